@@ -0,0 +1,549 @@
+"""
+Benchmarks for the evmdeploy hot paths.
+
+Usage:
+    python benchmarks/run.py                          # JSON report on stdout
+    python benchmarks/run.py -o bench.json            # write the report to a file
+    python benchmarks/run.py --only sign,link         # benchmarks whose name contains a filter
+    python benchmarks/run.py --compare base.json      # exit 1 on regressions vs. a saved report
+
+Each benchmark reports operations per second over the best of several
+repeats. Reports carry the git commit and interpreter so runs from
+different commits can be compared with --compare.
+"""
+import argparse
+import atexit
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+CONTRACTS = REPO_ROOT / "contracts"
+# A key of 1 makes deriving the public key nearly free, which would hide
+# the cost of account derivation in the signing benchmarks
+PRIVATE_KEY = "0x" + "4c0883a69102937d6231471b5dbb6204fe5129617082792ae468d01a3f362318"
+OWNER = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+
+
+def _tempdir(prefix: str) -> Path:
+    path = Path(tempfile.mkdtemp(prefix=f"evmdeploy-bench-{prefix}-"))
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+
+class Skip(Exception):
+    """Raised by a benchmark's setup when it cannot run here (missing solc, node, ...)."""
+
+
+@dataclass
+class Result:
+    name: str
+    status: str = "ok"
+    ops: int = 0
+    repeats: int = 0
+    best_seconds: float = 0.0
+    median_seconds: float = 0.0
+    ops_per_sec: float = 0.0
+    params: Dict[str, Any] = field(default_factory=dict)
+    reason: Optional[str] = None
+
+
+BENCHMARKS: Dict[str, Callable[[argparse.Namespace], Callable[[], int]]] = {}
+
+
+def benchmark(name: str):
+    """
+    Registers a benchmark. The decorated function does the setup and returns
+    the timed callable, which runs one batch and returns its operation count.
+    """
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def measure(name: str, setup, args: argparse.Namespace) -> Result:
+    try:
+        run = setup(args)
+    except Skip as e:
+        return Result(name, status="skipped", reason=str(e))
+    except Exception as e:
+        return Result(name, status="error", reason=f"{type(e).__name__}: {e}")
+
+    timings = []
+    ops = 0
+    try:
+        for _ in range(args.repeats):
+            t0 = time.perf_counter()
+            ops = run()
+            timings.append(time.perf_counter() - t0)
+    except Exception as e:
+        return Result(name, status="error", reason=f"{type(e).__name__}: {e}")
+
+    best = min(timings)
+    return Result(
+        name,
+        ops=ops,
+        repeats=len(timings),
+        best_seconds=best,
+        median_seconds=statistics.median(timings),
+        ops_per_sec=ops / best if best else 0.0,
+        params=getattr(run, "params", {}),
+    )
+
+
+def _with_params(run: Callable[[], int], **params) -> Callable[[], int]:
+    run.params = params
+    return run
+
+
+# --- compile -----------------------------------------------------------------
+
+def _compile_setup(source: str, warm: bool):
+    from evmdeploy.compiler.cache import CompilationCache
+    from evmdeploy.compiler.solidity import compile_solidity
+
+    path = CONTRACTS / source
+    if not path.exists():
+        raise Skip(f"{path} not found")
+    solc_version = os.environ.get("EVMDEPLOY_BENCH_SOLC", "0.8.23")
+    remappings = {"@openzeppelin/": str(REPO_ROOT / "node_modules" / "@openzeppelin") + "/"}
+    cache_dir = _tempdir("cache")
+
+    def compile_once(cache=None):
+        return compile_solidity(str(path), solc_version=solc_version, remappings=remappings, cache=cache)
+
+    try:
+        # Also resolves the solc binary, so neither variant pays for that
+        compile_once()
+    except Exception as e:
+        raise Skip(f"cannot compile {source} with solc {solc_version}: {e}")
+
+    if warm:
+        cache = CompilationCache(cache_dir)
+        compile_once(cache)
+
+        def run():
+            compile_once(cache)
+            return 1
+    else:
+        def run():
+            compile_once()
+            return 1
+
+    return _with_params(run, source=source, solc_version=solc_version)
+
+
+@benchmark("compile_cold[MyToken.sol]")
+def bench_compile_cold_token(args):
+    return _compile_setup("MyToken.sol", warm=False)
+
+
+@benchmark("compile_warm[MyToken.sol]")
+def bench_compile_warm_token(args):
+    return _compile_setup("MyToken.sol", warm=True)
+
+
+@benchmark("compile_cold[Vault.sol]")
+def bench_compile_cold_vault(args):
+    return _compile_setup("Vault.sol", warm=False)
+
+
+@benchmark("compile_warm[Vault.sol]")
+def bench_compile_warm_vault(args):
+    return _compile_setup("Vault.sol", warm=True)
+
+
+# --- constructor encoding ----------------------------------------------------
+
+_TOKEN_ABI = [
+    {"type": "function", "name": "transfer", "inputs": [{"name": "to", "type": "address"}, {"name": "amount", "type": "uint256"}]},
+    {"type": "event", "name": "Transfer", "inputs": []},
+    {
+        "type": "constructor",
+        "inputs": [
+            {"name": "name", "type": "string"},
+            {"name": "symbol", "type": "string"},
+            {"name": "initialSupply", "type": "uint256"},
+            {"name": "owner", "type": "address"},
+        ],
+    },
+]
+
+
+def _token_rows(n: int) -> List[List[Any]]:
+    return [[f"Token {i}", f"T{i}", 10**24 + i, OWNER] for i in range(n)]
+
+
+@benchmark("encode_constructor_args")
+def bench_encode(args):
+    from evmdeploy.encoding.constructor import encode_constructor_args
+
+    rows = _token_rows(args.scale * 200)
+
+    def run():
+        for row in rows:
+            encode_constructor_args(_TOKEN_ABI, *row)
+        return len(rows)
+
+    return _with_params(run, rows=len(rows))
+
+
+@benchmark("encode_many")
+def bench_encode_many(args):
+    from evmdeploy.encoding.constructor import ConstructorEncoder
+
+    rows = _token_rows(args.scale * 200)
+    encoder = ConstructorEncoder(_TOKEN_ABI)
+
+    def run():
+        encoder.encode_many(rows)
+        return len(rows)
+
+    return _with_params(run, rows=len(rows))
+
+
+# --- linking -----------------------------------------------------------------
+
+def _large_unlinked(size: int = 24_000, libraries: int = 5, refs_per_library: int = 20):
+    """Synthetic bytecode near the 24 KB contract size limit, with library placeholders."""
+    code = bytearray(bytes(range(256)) * (size // 256 + 1))[:size]
+    hex_code = list(code.hex())
+    link_refs: Dict[str, Dict[str, List[Dict[str, int]]]] = {}
+    addresses = {}
+    step = size // (libraries * refs_per_library + 1)
+    slot = 0
+    for lib in range(libraries):
+        name = f"Lib{lib}"
+        placeholder = "__$" + f"{lib:034x}" + "$__"
+        refs = []
+        for _ in range(refs_per_library):
+            slot += 1
+            start = slot * step
+            hex_code[start * 2 : start * 2 + 40] = placeholder
+            refs.append({"start": start, "length": 20})
+        link_refs[f"contracts/libs/{name}.sol"] = {name: refs}
+        addresses[name] = "0x" + f"{lib + 1:040x}"
+    return "".join(hex_code), link_refs, addresses
+
+
+@benchmark("link_bytecode[24KB]")
+def bench_link_bytecode(args):
+    from evmdeploy.compiler.linker import link_bytecode
+
+    bytecode, link_refs, addresses = _large_unlinked()
+    n = args.scale * 50
+
+    def run():
+        for _ in range(n):
+            link_bytecode(bytecode, link_refs, addresses)
+        return n
+
+    return _with_params(run, bytes=len(bytecode) // 2, references=100)
+
+
+@benchmark("link_plan[24KB]")
+def bench_link_plan(args):
+    from evmdeploy.compiler.linker import LinkPlan
+
+    bytecode, link_refs, addresses = _large_unlinked()
+    plan = LinkPlan(bytecode, link_refs)
+    n = args.scale * 500
+
+    def run():
+        for _ in range(n):
+            plan.link(addresses)
+        return n
+
+    return _with_params(run, bytes=len(bytecode) // 2, references=100)
+
+
+# --- signing -----------------------------------------------------------------
+
+def _unsigned_txs(n: int) -> List[Dict[str, Any]]:
+    return [
+        {"nonce": i, "gas": 1_000_000, "maxFeePerGas": 3 * 10**9, "maxPriorityFeePerGas": 10**9,
+         "chainId": 1, "data": "0x6080604052" + "00" * 2000, "value": 0}
+        for i in range(n)
+    ]
+
+
+@benchmark("sign_transaction")
+def bench_sign(args):
+    from evmdeploy.crypto.signer import sign_transaction
+
+    txs = _unsigned_txs(args.scale * 20)
+
+    def run():
+        for tx in txs:
+            sign_transaction(tx, PRIVATE_KEY)
+        return len(txs)
+
+    return _with_params(run, transactions=len(txs))
+
+
+@benchmark("signer_sign")
+def bench_signer_sign(args):
+    from evmdeploy.crypto.signer import TransactionSigner
+
+    # Same work as sign_transaction, minus deriving the account per call
+    signer = TransactionSigner(PRIVATE_KEY)
+    txs = _unsigned_txs(args.scale * 20)
+
+    def run():
+        for tx in txs:
+            signer.sign(tx)
+        return len(txs)
+
+    return _with_params(run, transactions=len(txs))
+
+
+@benchmark("sign_many")
+def bench_sign_many(args):
+    from evmdeploy.crypto.signer import TransactionSigner
+
+    signer = TransactionSigner(PRIVATE_KEY)
+    txs = _unsigned_txs(max(args.scale * 100, 512))
+    processes = os.cpu_count() or 1
+
+    def run():
+        signer.sign_many(txs, processes=processes)
+        return len(txs)
+
+    return _with_params(run, transactions=len(txs), processes=processes)
+
+
+# --- artifact storage --------------------------------------------------------
+
+def _artifacts(n: int):
+    from evmdeploy.artifacts.model import ContractArtifact
+
+    abi = _TOKEN_ABI * 10
+    return {
+        f"Contract{i}": ContractArtifact(
+            name=f"Contract{i}",
+            abi=abi,
+            bytecode="0x" + "60806040" * 1000,
+            compiler_version="0.8.23",
+            source_hash=f"{i:064x}",
+        )
+        for i in range(n)
+    }
+
+
+@benchmark("artifact_storage_save[1k]")
+def bench_storage_save(args):
+    from evmdeploy.artifacts.storage import ArtifactStorage
+
+    artifacts = _artifacts(1000)
+    base = _tempdir("store")
+
+    def run():
+        ArtifactStorage(base).save_artifacts(artifacts)
+        return len(artifacts)
+
+    return _with_params(run, artifacts=len(artifacts))
+
+
+@benchmark("artifact_storage_load[1k]")
+def bench_storage_load(args):
+    from evmdeploy.artifacts.storage import ArtifactStorage
+
+    artifacts = _artifacts(1000)
+    base = _tempdir("store")
+    ArtifactStorage(base).save_artifacts(artifacts)
+
+    def run():
+        # No ArtifactCache, so every run parses the files
+        ArtifactStorage(base).load_artifacts(list(artifacts))
+        return len(artifacts)
+
+    return _with_params(run, artifacts=len(artifacts))
+
+
+# --- end-to-end deploy -------------------------------------------------------
+
+def _local_chain():
+    """A funded in-process chain for the deployer key."""
+    try:
+        from web3 import EthereumTesterProvider, Web3
+
+        w3 = Web3(EthereumTesterProvider())
+    except Exception as e:
+        raise Skip(f"eth-tester is not available: {e}")
+
+    from evmdeploy.crypto.signer import get_signer
+
+    w3.eth.send_transaction(
+        {"from": w3.eth.accounts[0], "to": get_signer(PRIVATE_KEY).address, "value": 10**21}
+    )
+    return w3
+
+
+def _minimal_contract():
+    from evmdeploy.artifacts.model import ContractArtifact
+    from evmdeploy.contract import Contract
+
+    # Init code returns a 10-byte runtime; the appended constructor arg is ignored
+    return Contract(
+        ContractArtifact(
+            name="Minimal",
+            abi=[{"type": "constructor", "inputs": [{"name": "owner", "type": "address"}]}],
+            bytecode="0x600a600c600039600a6000f3602a60005260206000f3",
+            compiler_version="0.8.23",
+            source_hash="0" * 64,
+        )
+    )
+
+
+@benchmark("contract_deploy[local]")
+def bench_deploy(args):
+    w3 = _local_chain()
+    contract = _minimal_contract()
+    n = args.scale * 5
+
+    def run():
+        for _ in range(n):
+            contract.deploy(w3, PRIVATE_KEY, constructor_args=[OWNER])
+        return n
+
+    return _with_params(run, deployments=n, chain="eth-tester")
+
+
+def _simulated_w3(**chain_kwargs):
+    from web3 import Web3
+
+    from evmdeploy.network.simulated import SimulatedChain, SimulatedProvider
+
+    return Web3(SimulatedProvider(SimulatedChain(seed=0, **chain_kwargs)))
+
+
+@benchmark("contract_deploy[simulated]")
+def bench_deploy_simulated(args):
+    # No latency: measures evmdeploy's own per-deployment overhead
+    w3 = _simulated_w3()
+    contract = _minimal_contract()
+    n = args.scale * 10
+
+    def run():
+        for _ in range(n):
+            contract.deploy(w3, PRIVATE_KEY, constructor_args=[OWNER])
+        return n
+
+    return _with_params(run, deployments=n, chain="simulated")
+
+
+@benchmark("deploy_pipeline[simulated,5ms]")
+def bench_deploy_pipeline(args):
+    from evmdeploy.deployer.deployer import Deployer
+
+    # Sends without waiting, then awaits all receipts together
+    latency, block_time = 0.005, 0.1
+    w3 = _simulated_w3(latency=latency, jitter=latency / 5, block_time=block_time)
+    contract = _minimal_contract()
+    deployer = Deployer(w3, PRIVATE_KEY)
+    n = args.scale * 10
+    # Warm-up: lets the receipt tracker learn the block time first
+    deployer.wait_for_receipts([contract.deploy(w3, PRIVATE_KEY, constructor_args=[OWNER], wait=False).tx_hash])
+
+    def run():
+        hashes = [contract.deploy(w3, PRIVATE_KEY, constructor_args=[OWNER], wait=False).tx_hash for _ in range(n)]
+        deployer.wait_for_receipts(hashes)
+        return n
+
+    return _with_params(run, deployments=n, chain="simulated", latency=latency, block_time=block_time)
+
+
+# --- report ------------------------------------------------------------------
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Names of benchmarks whose ops/sec dropped more than `threshold` (a fraction) below the baseline."""
+    base = {r["name"]: r for r in baseline["results"] if r["status"] == "ok"}
+    regressions = []
+    for result in report["results"]:
+        old = base.get(result["name"])
+        if result["status"] != "ok" or old is None or not old["ops_per_sec"]:
+            continue
+        change = result["ops_per_sec"] / old["ops_per_sec"] - 1
+        result["change_vs_baseline"] = change
+        if change < -threshold:
+            regressions.append(f"{result['name']}: {old['ops_per_sec']:.1f} -> {result['ops_per_sec']:.1f} ops/s ({change:+.0%})")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-o", "--output", help="Write the JSON report here instead of stdout")
+    parser.add_argument("--only", help="Comma-separated substrings; run matching benchmarks only")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed repeats per benchmark (best is reported)")
+    parser.add_argument("--scale", type=int, default=5, help="Work-size multiplier")
+    parser.add_argument("--compare", help="Baseline report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed ops/sec drop vs. the baseline (fraction)")
+    parser.add_argument("--list", action="store_true", help="List benchmark names and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+
+    filters = [f for f in (args.only or "").split(",") if f]
+    selected = [name for name in BENCHMARKS if not filters or any(f in name for f in filters)]
+
+    results = []
+    for name in selected:
+        result = measure(name, BENCHMARKS[name], args)
+        print(f"{name}: {result.status} {result.ops_per_sec:.1f} ops/s", file=sys.stderr)
+        results.append(asdict(result))
+
+    report = {
+        "schema": 1,
+        "commit": _git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "repeats": args.repeats,
+        "scale": args.scale,
+        "results": results,
+    }
+
+    status = 0
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        report["regressions"] = regressions
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        status = 1 if regressions else 0
+
+    data = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(data + "\n")
+    else:
+        print(data)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
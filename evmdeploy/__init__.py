@@ -1,21 +1,64 @@
-from evmdeploy.compiler.solidity import compile_solidity, SolidityCompiler
-from evmdeploy.crypto.signer import sign_transaction
-from evmdeploy.encoding.constructor import encode_constructor_args
-from evmdeploy.contract import Contract
-from evmdeploy.deployer.deployer import Deployer
-from evmdeploy.network.evm import NetworkConfig, get_network
-from evmdeploy.artifacts.model import DeploymentResult
-from evmdeploy.artifacts.storage import ArtifactStorage
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from evmdeploy.compiler.solidity import compile_solidity, compile_project, SolidityCompiler
+    from evmdeploy.crypto.signer import TransactionSigner, sign_transaction
+    from evmdeploy.encoding.constructor import encode_constructor_args
+    from evmdeploy.contract import Contract
+    from evmdeploy.plan import DeploymentPlan, Ref
+    from evmdeploy.deployer.deployer import Deployer
+    from evmdeploy.network.evm import NetworkConfig, get_network
+    from evmdeploy.artifacts.model import DeploymentResult
+    from evmdeploy.artifacts.storage import ArtifactStorage
 
 __all__ = [
     "compile_solidity",
+    "compile_project",
     "SolidityCompiler",
     "sign_transaction",
+    "TransactionSigner",
     "encode_constructor_args",
     "Contract",
+    "DeploymentPlan",
+    "Ref",
     "Deployer",
     "NetworkConfig",
     "get_network",
     "DeploymentResult",
     "ArtifactStorage",
 ]
+
+# Public name -> defining module. Modules are imported on first attribute
+# access, so `import evmdeploy` does not load web3, solcx or eth-account
+# unless a name that needs them is used.
+_LAZY_IMPORTS: Dict[str, str] = {
+    "compile_solidity": "evmdeploy.compiler.solidity",
+    "compile_project": "evmdeploy.compiler.solidity",
+    "SolidityCompiler": "evmdeploy.compiler.solidity",
+    "sign_transaction": "evmdeploy.crypto.signer",
+    "TransactionSigner": "evmdeploy.crypto.signer",
+    "encode_constructor_args": "evmdeploy.encoding.constructor",
+    "Contract": "evmdeploy.contract",
+    "DeploymentPlan": "evmdeploy.plan",
+    "Ref": "evmdeploy.plan",
+    "Deployer": "evmdeploy.deployer.deployer",
+    "NetworkConfig": "evmdeploy.network.evm",
+    "get_network": "evmdeploy.network.evm",
+    "DeploymentResult": "evmdeploy.artifacts.model",
+    "ArtifactStorage": "evmdeploy.artifacts.storage",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    # Cache so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
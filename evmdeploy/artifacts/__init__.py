@@ -1,4 +1,13 @@
 from evmdeploy.artifacts.model import ContractArtifact, DeploymentResult
+from evmdeploy.artifacts.cache import ArtifactCache, get_artifact_cache
 from evmdeploy.artifacts.storage import ArtifactStorage
+from evmdeploy.artifacts.packed import PackedArtifactStorage
 
-__all__ = ["ContractArtifact", "DeploymentResult", "ArtifactStorage"]
+__all__ = [
+    "ContractArtifact",
+    "DeploymentResult",
+    "ArtifactStorage",
+    "PackedArtifactStorage",
+    "ArtifactCache",
+    "get_artifact_cache",
+]
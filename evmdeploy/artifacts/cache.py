@@ -0,0 +1,121 @@
+import os
+import threading
+from collections import OrderedDict
+from hashlib import sha256
+from pathlib import Path
+from typing import Callable, Dict, Tuple, Union
+
+from evmdeploy.artifacts.model import ContractArtifact
+
+
+class ArtifactCache:
+    """
+    Thread-safe LRU cache of loaded ContractArtifacts, keyed by file path.
+
+    Entries are revalidated on every lookup, either by the file's
+    (mtime, size) or by a hash of its content, so a rewritten artifact is
+    never served stale. Hits return the same artifact object, so its ABI
+    list is shared by every Contract built from it and must not be mutated.
+    """
+
+    def __init__(self, maxsize: int = 256, validate: str = "stat"):
+        """
+        Args:
+            maxsize: Maximum number of artifacts kept; least recently used go first.
+            validate: "stat" compares mtime and size (one stat per lookup);
+                      "hash" compares a sha256 of the file (one read, no parse).
+        """
+        if validate not in ("stat", "hash"):
+            raise ValueError(f"Unknown validation mode: {validate!r}")
+        self.maxsize = maxsize
+        self.validate = validate
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[tuple, ContractArtifact]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _validator(self, path: str) -> tuple:
+        if self.validate == "hash":
+            with open(path, "rb") as f:
+                return (sha256(f.read()).hexdigest(),)
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+
+    def get_or_load(
+        self,
+        path: Union[str, Path],
+        loader: Callable[[], ContractArtifact],
+    ) -> ContractArtifact:
+        """
+        Returns the cached artifact for `path`, calling `loader` on a miss or
+        when the file changed since it was cached.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        key = os.path.abspath(path)
+        try:
+            validator = self._validator(key)
+        except FileNotFoundError:
+            self.invalidate(key)
+            raise
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == validator:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        artifact = loader()
+
+        with self._lock:
+            self._entries[key] = (validator, artifact)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return artifact
+
+    def invalidate(self, path: Union[str, Path]):
+        """Drops the entry for a path, if any."""
+        with self._lock:
+            self._entries.pop(os.path.abspath(path), None)
+
+    def resize(self, maxsize: int):
+        """Changes the capacity, evicting least recently used entries if needed."""
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drops every entry and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters and current occupancy, for sizing."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+_default_cache = ArtifactCache(
+    maxsize=int(os.environ.get("EVMDEPLOY_ARTIFACT_CACHE_SIZE", "256"))
+)
+
+
+def get_artifact_cache() -> ArtifactCache:
+    """Returns the process-wide cache used by Contract.from_storage."""
+    return _default_cache
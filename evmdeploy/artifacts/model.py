@@ -1,5 +1,9 @@
-from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+import json
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
+
+if TYPE_CHECKING:
+    from evmdeploy.compiler.linker import LinkPlan
 
 @dataclass(frozen=True)
 class ContractArtifact:
@@ -8,9 +12,55 @@ class ContractArtifact:
     bytecode: str
     compiler_version: str
     source_hash: str
+    # Additional solc outputs keyed by selector (e.g. "storageLayout"), kept
+    # as raw JSON and only parsed when requested through `output()`.
+    extra_outputs: Dict[str, str] = field(default_factory=dict)
+    # solc linkReferences for library placeholders still in `bytecode`
+    # ({source: {library: [{"start", "length"}]}}); empty once linked.
+    link_references: Dict[str, Dict[str, List[Dict[str, int]]]] = field(default_factory=dict)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_parsed_outputs", {})
+        object.__setattr__(self, "_link_plan", None)
+
+    @property
+    def required_libraries(self) -> List[str]:
+        """Names of the libraries that must be linked before deployment."""
+        return sorted({lib for libs in self.link_references.values() for lib in libs})
+
+    @property
+    def qualified_libraries(self) -> List[str]:
+        """Required libraries as fully-qualified `file:Library` names."""
+        return sorted(f"{file}:{lib}" for file, libs in self.link_references.items() for lib in libs)
+
+    @property
+    def link_plan(self) -> "LinkPlan":
+        """LinkPlan for the unlinked bytecode, built on first access and kept with the artifact."""
+        if self._link_plan is None:
+            from evmdeploy.compiler.linker import LinkPlan
+
+            object.__setattr__(self, "_link_plan", LinkPlan(self.bytecode, self.link_references))
+        return self._link_plan
+
+    def output(self, selector: str) -> Any:
+        """
+        Returns a parsed extra compiler output, e.g. "storageLayout" or
+        "evm.deployedBytecode.sourceMap". Parsed values are memoised.
+
+        Raises:
+            KeyError: If the output was not selected at compile time.
+        """
+        parsed = self._parsed_outputs
+        if selector not in parsed:
+            if selector not in self.extra_outputs:
+                raise KeyError(f"Output {selector!r} was not requested when compiling {self.name}")
+            parsed[selector] = json.loads(self.extra_outputs[selector])
+        return parsed[selector]
 
 @dataclass(frozen=True)
 class DeploymentResult:
-    tx_hash: str
+    # None when a CREATE2 deployment was skipped because the code already exists
+    tx_hash: Optional[str]
     contract_address: Optional[str] = None
     receipt: Optional[Dict[str, Any]] = None
+    skipped: bool = False
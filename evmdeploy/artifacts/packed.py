@@ -0,0 +1,201 @@
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from evmdeploy.artifacts.model import ContractArtifact
+
+# File layout:
+#   MAGIC | u32 header length | header JSON | data section
+# The header maps each name to (offset, length) slices of the data section
+# for its bytecode, ABI and remaining metadata.
+MAGIC = b"EVMPACK1"
+_HEADER_LEN = struct.Struct("<I")
+_PREFIX_SIZE = len(MAGIC) + _HEADER_LEN.size
+
+
+def _encode_bytecode(bytecode: str) -> Tuple[str, bytes]:
+    """Raw bytes when the bytecode is plain hex; unlinked placeholders stay text."""
+    body = bytecode[2:] if bytecode.startswith("0x") else bytecode
+    try:
+        return "raw", bytes.fromhex(body)
+    except ValueError:
+        return "text", body.encode()
+
+
+class PackedArtifactStorage:
+    """
+    Stores every artifact in a single packed file with a header index.
+
+    Bytecode is kept as raw bytes and the ABI as compact JSON. Reads go
+    through mmap, so loading one artifact is a slice of the mapped file and
+    never parses unrelated contracts. Drop-in for ArtifactStorage's
+    save/load API.
+    """
+
+    def __init__(self, path: Union[str, Path] = "artifacts.pack"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._data_start = 0
+
+    def _open(self):
+        """Maps the pack file and parses its header index."""
+        if self._index is not None:
+            return
+
+        if not self.path.exists():
+            self._index = {}
+            return
+
+        f = open(self.path, "rb")
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file; mmap refuses zero-length maps
+            f.close()
+            raise ValueError(f"Corrupt artifact pack: {self.path}")
+
+        if mm[: len(MAGIC)] != MAGIC:
+            mm.close()
+            f.close()
+            raise ValueError(f"Not an artifact pack: {self.path}")
+
+        (header_len,) = _HEADER_LEN.unpack_from(mm, len(MAGIC))
+        self._index = json.loads(mm[_PREFIX_SIZE : _PREFIX_SIZE + header_len])
+        self._data_start = _PREFIX_SIZE + header_len
+        self._file, self._mmap = f, mm
+
+    def close(self):
+        """Unmaps the pack file. It is re-opened on the next read."""
+        with self._lock:
+            self._close()
+
+    def _close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._file.close()
+        self._file = self._mmap = None
+        self._index = None
+
+    def reload(self):
+        """Picks up a pack file rewritten by another process."""
+        self.close()
+
+    def names(self) -> List[str]:
+        """Names of every stored artifact."""
+        with self._lock:
+            self._open()
+            return list(self._index)
+
+    def __contains__(self, name: str) -> bool:
+        with self._lock:
+            self._open()
+            return name in self._index
+
+    def _slice(self, span: List[int]) -> bytes:
+        start = self._data_start + span[0]
+        return self._mmap[start : start + span[1]]
+
+    def load_artifact(self, name: str) -> ContractArtifact:
+        """Loads a ContractArtifact by name."""
+        with self._lock:
+            self._open()
+            entry = self._index.get(name)
+            if entry is None:
+                raise FileNotFoundError(f"Artifact not found: {name} in {self.path}")
+
+            code = self._slice(entry["bytecode"])
+            abi = json.loads(self._slice(entry["abi"]))
+            meta = json.loads(self._slice(entry["meta"]))
+
+        bytecode = "0x" + (code.hex() if entry["encoding"] == "raw" else code.decode())
+        return ContractArtifact(
+            name=name,
+            abi=abi,
+            bytecode=bytecode,
+            compiler_version=meta["compiler_version"],
+            source_hash=meta["source_hash"],
+            extra_outputs=meta.get("extra_outputs", {}),
+            link_references=meta.get("link_references", {}),
+        )
+
+    def load_artifacts(self, names: Optional[List[str]] = None) -> Dict[str, ContractArtifact]:
+        """Loads several artifacts (default: all), keyed by name."""
+        return {name: self.load_artifact(name) for name in (names if names is not None else self.names())}
+
+    def save_artifact(self, artifact: ContractArtifact) -> Path:
+        """Adds or replaces a single artifact. Rewrites the pack atomically."""
+        return self.save_artifacts({artifact.name: artifact})
+
+    def save_artifacts(self, artifacts: Dict[str, ContractArtifact]) -> Path:
+        """Adds or replaces artifacts, keeping existing entries. Rewrites the pack atomically."""
+        with self._lock:
+            self._open()
+            # Carry over untouched entries as raw slices; no re-encoding
+            records: Dict[str, Dict[str, Any]] = {}
+            for name, entry in self._index.items():
+                records[name] = {
+                    "encoding": entry["encoding"],
+                    "bytecode": self._slice(entry["bytecode"]),
+                    "abi": self._slice(entry["abi"]),
+                    "meta": self._slice(entry["meta"]),
+                }
+
+            for artifact in artifacts.values():
+                encoding, code = _encode_bytecode(artifact.bytecode)
+                meta = {
+                    "compiler_version": artifact.compiler_version,
+                    "source_hash": artifact.source_hash,
+                }
+                if artifact.extra_outputs:
+                    meta["extra_outputs"] = artifact.extra_outputs
+                if artifact.link_references:
+                    meta["link_references"] = artifact.link_references
+                records[artifact.name] = {
+                    "encoding": encoding,
+                    "bytecode": code,
+                    "abi": json.dumps(artifact.abi, separators=(",", ":")).encode(),
+                    "meta": json.dumps(meta, separators=(",", ":")).encode(),
+                }
+
+            self._write(records)
+            self._close()
+
+        return self.path
+
+    def _write(self, records: Dict[str, Dict[str, Any]]):
+        index: Dict[str, Dict[str, Any]] = {}
+        chunks: List[bytes] = []
+        offset = 0
+        for name, record in records.items():
+            entry: Dict[str, Any] = {"encoding": record["encoding"]}
+            for field in ("bytecode", "abi", "meta"):
+                chunk = record[field]
+                entry[field] = [offset, len(chunk)]
+                chunks.append(chunk)
+                offset += len(chunk)
+            index[name] = entry
+
+        header = json.dumps(index, separators=(",", ":")).encode()
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(MAGIC)
+                f.write(_HEADER_LEN.pack(len(header)))
+                f.write(header)
+                for chunk in chunks:
+                    f.write(chunk)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -1,22 +1,70 @@
+import asyncio
 import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Union
+from typing import Dict, Iterable, List, Optional, Union
 
+from evmdeploy.artifacts.cache import ArtifactCache
 from evmdeploy.artifacts.model import ContractArtifact
+from evmdeploy.tracing import span
+
+FSYNC_POLICIES = ("never", "batch", "always")
+
+
+def find_name_clashes(qualified_names: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Groups "path:Contract" keys by contract name and returns the names that
+    occur more than once. Storage keeps one file per contract name, so such
+    contracts would overwrite each other.
+    """
+    by_name: Dict[str, List[str]] = {}
+    for qualified in qualified_names:
+        by_name.setdefault(qualified.rpartition(":")[2], []).append(qualified)
+    return {name: sorted(keys) for name, keys in by_name.items() if len(keys) > 1}
+
 
 class ArtifactStorage:
     """
     Handles persisting and retrieving contract artifacts from disk.
     """
 
-    def __init__(self, base_path: Union[str, Path] = "artifacts"):
+    def __init__(
+        self,
+        base_path: Union[str, Path] = "artifacts",
+        cache: Optional[ArtifactCache] = None,
+        fsync: str = "never",
+        max_workers: int = 16,
+    ):
+        """
+        Args:
+            base_path: Directory holding one JSON file per artifact. It is
+                       created on the first save, not here.
+            cache: Optional ArtifactCache consulted by load_artifact.
+            fsync: Durability policy for writes. "never" relies on the OS;
+                   "batch" fsyncs each file and the directory once per bulk
+                   save; "always" also fsyncs the directory after every file.
+            max_workers: Thread pool size for bulk save/load.
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy {fsync!r}; expected one of {FSYNC_POLICIES}")
         self.base_path = Path(base_path)
-        self.base_path.mkdir(parents=True, exist_ok=True)
+        self.cache = cache
+        self.fsync = fsync
+        self.max_workers = max_workers
 
-    def save_artifact(self, artifact: ContractArtifact) -> Path:
-        """Saves a single ContractArtifact to a JSON file."""
+    def _fsync_dir(self):
+        fd = os.open(self.base_path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _write_artifact(self, artifact: ContractArtifact) -> Path:
+        """Writes one artifact atomically (temp file + rename)."""
         file_path = self.base_path / f"{artifact.name}.json"
-        
+
         data = {
             "name": artifact.name,
             "abi": artifact.abi,
@@ -24,30 +72,130 @@ class ArtifactStorage:
             "compiler_version": artifact.compiler_version,
             "source_hash": artifact.source_hash,
         }
-        
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=4)
-        
+        if artifact.extra_outputs:
+            data["extra_outputs"] = artifact.extra_outputs
+        if artifact.link_references:
+            data["link_references"] = artifact.link_references
+
+        with span("artifacts.save", artifact=artifact.name, fsync=self.fsync) as trace:
+            fd, tmp_path = tempfile.mkstemp(dir=self.base_path, prefix=f".{artifact.name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f, indent=4)
+                    trace.set(bytes=f.tell())
+                    if self.fsync != "never":
+                        f.flush()
+                        os.fsync(f.fileno())
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+            if self.fsync == "always":
+                self._fsync_dir()
+        if self.cache is not None:
+            self.cache.invalidate(file_path)
+
+        return file_path
+
+    def save_artifact(self, artifact: ContractArtifact) -> Path:
+        """Saves a single ContractArtifact to a JSON file. The write is atomic."""
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        file_path = self._write_artifact(artifact)
+        if self.fsync == "batch":
+            self._fsync_dir()
         return file_path
 
-    def save_artifacts(self, artifacts: Dict[str, ContractArtifact]):
-        """Saves a dictionary of artifacts."""
-        for artifact in artifacts.values():
-            self.save_artifact(artifact)
+    def save_artifacts(self, artifacts: Dict[str, ContractArtifact]) -> Dict[str, Path]:
+        """
+        Saves a dictionary of artifacts, writing files concurrently on a
+        thread pool. Each write is atomic.
+
+        Returns:
+            Dict of written file paths, keyed like the input.
+        """
+        if not artifacts:
+            return {}
+
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        if len(artifacts) == 1:
+            paths = {key: self._write_artifact(a) for key, a in artifacts.items()}
+        else:
+            workers = min(self.max_workers, len(artifacts))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {key: pool.submit(self._write_artifact, a) for key, a in artifacts.items()}
+                paths = {key: future.result() for key, future in futures.items()}
+
+        if self.fsync == "batch":
+            self._fsync_dir()
+        return paths
 
     def load_artifact(self, name: str) -> ContractArtifact:
         """Loads a ContractArtifact by name."""
         file_path = self.base_path / f"{name}.json"
+        if self.cache is not None:
+            try:
+                return self.cache.get_or_load(file_path, lambda: self._read_artifact(file_path))
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Artifact not found: {file_path}")
+
         if not file_path.exists():
             raise FileNotFoundError(f"Artifact not found: {file_path}")
-            
-        with open(file_path, "r") as f:
+        return self._read_artifact(file_path)
+
+    def delete_artifact(self, name: str) -> bool:
+        """Removes an artifact's file. Returns False if there was none."""
+        file_path = self.base_path / f"{name}.json"
+        if self.cache is not None:
+            self.cache.invalidate(file_path)
+        try:
+            file_path.unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def load_artifacts(self, names: Optional[Iterable[str]] = None) -> Dict[str, ContractArtifact]:
+        """
+        Loads several artifacts concurrently on a thread pool.
+
+        Args:
+            names: Artifact names to load (default: every artifact in base_path).
+
+        Returns:
+            Dict of ContractArtifact objects, keyed by name.
+        """
+        if names is None:
+            names = sorted(p.stem for p in self.base_path.glob("*.json") if not p.name.startswith("."))
+        names = list(names)
+        if len(names) <= 1:
+            return {name: self.load_artifact(name) for name in names}
+
+        workers = min(self.max_workers, len(names))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return dict(zip(names, pool.map(self.load_artifact, names)))
+
+    async def save_artifacts_async(self, artifacts: Dict[str, ContractArtifact]) -> Dict[str, Path]:
+        """asyncio variant of save_artifacts; file I/O runs on the loop's executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.save_artifacts, artifacts)
+
+    async def load_artifacts_async(self, names: Optional[Iterable[str]] = None) -> Dict[str, ContractArtifact]:
+        """asyncio variant of load_artifacts; file I/O runs on the loop's executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.load_artifacts, names)
+
+    def _read_artifact(self, file_path: Path) -> ContractArtifact:
+        with span("artifacts.load", artifact=file_path.stem) as trace, open(file_path, "r") as f:
             data = json.load(f)
-            
+            trace.set(bytes=f.tell())
+
         return ContractArtifact(
             name=data["name"],
             abi=data["abi"],
             bytecode=data["bytecode"],
             compiler_version=data["compiler_version"],
             source_hash=data["source_hash"],
+            extra_outputs=data.get("extra_outputs", {}),
+            link_references=data.get("link_references", {}),
         )
@@ -0,0 +1,316 @@
+"""
+Command line interface.
+
+Startup is kept cheap for shell pipelines: only the standard library is
+imported at module level, and each subcommand imports what it needs when it
+runs. Only `build` loads solcx, and only `deploy` and `plan` load web3;
+`--help` and `verify-address` need neither.
+"""
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+
+def _load_dotenv():
+    """Loads .env when python-dotenv is installed (it is optional)."""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv()
+
+
+def _json_arg(value: str) -> Any:
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError as e:
+        raise argparse.ArgumentTypeError(f"invalid JSON: {e}")
+
+
+def _pairs(values: Optional[List[str]], option: str) -> Dict[str, str]:
+    """Parses repeated KEY=VALUE options."""
+    result = {}
+    for item in values or []:
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise SystemExit(f"error: {option} expects KEY=VALUE, got {item!r}")
+        result[key] = value
+    return result
+
+
+def _salt(value: str) -> Any:
+    """Salts are given as decimal or 0x-prefixed 32-byte hex."""
+    return value if value.startswith("0x") else int(value)
+
+
+def _print(data: Any, as_json: bool):
+    if as_json:
+        print(json.dumps(data, separators=(",", ":")))
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            print(f"{key}\t{value}")
+    else:
+        print(data)
+
+
+def _load_artifact(args: argparse.Namespace, name: str):
+    from evmdeploy.artifacts.storage import ArtifactStorage
+
+    return ArtifactStorage(args.artifacts or "artifacts").load_artifact(name)
+
+
+def _factory(args: argparse.Namespace) -> str:
+    if args.factory:
+        return args.factory
+    from evmdeploy.utils.create2 import DETERMINISTIC_DEPLOYER
+
+    return DETERMINISTIC_DEPLOYER
+
+
+def _web3(args: argparse.Namespace):
+    from web3 import Web3
+
+    rpc_url = args.rpc_url or os.getenv("RPC_URL")
+    if rpc_url is None and args.network:
+        from evmdeploy.network.evm import get_network
+
+        network = get_network(args.network)
+        if network is None:
+            raise SystemExit(f"error: unknown network {args.network!r}")
+        rpc_url = network.rpc_url
+    if not rpc_url:
+        raise SystemExit("error: no RPC endpoint; pass --rpc-url or --network, or set RPC_URL")
+    return Web3(Web3.HTTPProvider(rpc_url))
+
+
+def _private_key(args: argparse.Namespace) -> str:
+    key = args.private_key or os.getenv("PRIVATE_KEY")
+    if not key:
+        raise SystemExit("error: no private key; pass --private-key or set PRIVATE_KEY")
+    return key
+
+
+def cmd_build(args: argparse.Namespace) -> int:
+    from evmdeploy.artifacts.storage import ArtifactStorage, find_name_clashes
+    from evmdeploy.compiler.solidity import SolidityCompiler
+
+    compiler = SolidityCompiler(
+        solc_version=args.solc_version,
+        remappings=_pairs(args.remap, "--remap") or None,
+        optimizer=not args.no_optimizer,
+        runs=args.runs,
+        cache_dir=args.cache_dir,
+        outputs=args.outputs,
+    )
+    sources = args.sources[0] if len(args.sources) == 1 else args.sources
+    artifacts = compiler.compile_many(sources)
+
+    clashes = find_name_clashes(artifacts)
+    if clashes:
+        details = "; ".join(f"{name} ({', '.join(q)})" for name, q in sorted(clashes.items()))
+        raise SystemExit(
+            f"error: contract names defined more than once: {details}; "
+            "build those sources into separate --out directories"
+        )
+
+    paths = ArtifactStorage(args.out or args.artifacts or "artifacts").save_artifacts(
+        {artifact.name: artifact for artifact in artifacts.values()}
+    )
+    _print({name: str(path) for name, path in paths.items()}, args.json)
+    return 0
+
+
+def cmd_deploy(args: argparse.Namespace) -> int:
+    from evmdeploy.contract import Contract
+
+    contract = Contract(_load_artifact(args, args.name))
+    w3 = _web3(args)
+    common = dict(
+        constructor_args=args.args,
+        constructor_kwargs=args.kwargs,
+        gas=args.gas,
+        value=args.value,
+        wait=not args.no_wait,
+        libraries=_pairs(args.library, "--library") or None,
+    )
+    if args.salt is not None:
+        result = contract.deploy_create2(w3, _private_key(args), _salt(args.salt), factory=_factory(args), **common)
+    else:
+        result = contract.deploy(w3, _private_key(args), **common)
+
+    _print(
+        {
+            "address": result.contract_address,
+            "tx_hash": result.tx_hash,
+            "skipped": result.skipped,
+        },
+        args.json,
+    )
+    return 0
+
+
+def _plan_value(value: Any) -> Any:
+    """Turns "@Name" strings in a plan file into Refs."""
+    from evmdeploy.plan import Ref
+
+    if isinstance(value, str) and value.startswith("@"):
+        return Ref(value[1:])
+    if isinstance(value, list):
+        return [_plan_value(item) for item in value]
+    if isinstance(value, dict):
+        return {k: _plan_value(v) for k, v in value.items()}
+    return value
+
+
+def cmd_plan(args: argparse.Namespace) -> int:
+    from evmdeploy.artifacts.storage import ArtifactStorage
+    from evmdeploy.plan import DeploymentPlan
+
+    with open(args.file) as f:
+        spec = json.load(f)
+
+    storage = ArtifactStorage(args.artifacts or spec.get("artifacts") or "artifacts")
+    plan = DeploymentPlan()
+    for node in spec["nodes"]:
+        plan.add(
+            node["name"],
+            storage.load_artifact(node.get("artifact", node["name"])),
+            constructor_args=_plan_value(node.get("args", [])),
+            constructor_kwargs=_plan_value(node.get("kwargs", {})),
+            libraries=_plan_value(node.get("libraries", {})),
+            depends_on=node.get("depends_on"),
+            value=node.get("value", 0),
+            gas=node.get("gas"),
+            salt=_salt(str(node["salt"])) if "salt" in node else None,
+            **({"factory": node["factory"]} if "factory" in node else {}),
+        )
+
+    if args.dry_run:
+        _print({"waves": plan.waves(), "create2_addresses": plan.create2_addresses()}, True)
+        return 0
+
+    results = plan.execute(_web3(args), _private_key(args), max_workers=args.workers, timeout=args.timeout)
+    _print(
+        {
+            name: {"address": r.contract_address, "tx_hash": r.tx_hash, "skipped": r.skipped}
+            for name, r in results.items()
+        },
+        True,
+    )
+    return 0
+
+
+def cmd_verify_address(args: argparse.Namespace) -> int:
+    # Offline: needs only the artifact, eth-abi and keccak, never web3
+    from evmdeploy.compiler.linker import link_artifact
+    from evmdeploy.encoding.constructor import ConstructorEncoder
+    from evmdeploy.utils.create2 import compute_create2_address
+
+    artifact = link_artifact(_load_artifact(args, args.name), _pairs(args.library, "--library"))
+
+    encoded = ConstructorEncoder(artifact.abi).encode(*(args.args or []), **(args.kwargs or {}))
+    bytecode = artifact.bytecode if artifact.bytecode.startswith("0x") else "0x" + artifact.bytecode
+    address = compute_create2_address(_factory(args), _salt(args.salt), bytecode + encoded.hex())
+
+    if args.expect is None:
+        print(address)
+        return 0
+    if address.lower() == args.expect.lower():
+        print(address)
+        return 0
+    print(f"mismatch: computed {address}, expected {args.expect}", file=sys.stderr)
+    return 1
+
+
+def _add_connection(parser: argparse.ArgumentParser):
+    parser.add_argument("--rpc-url", help="JSON-RPC endpoint (default: $RPC_URL)")
+    parser.add_argument("--network", help="Named network from evmdeploy.network (e.g. sepolia)")
+    parser.add_argument("--private-key", help="Deployer key (default: $PRIVATE_KEY)")
+
+
+def _add_constructor(parser: argparse.ArgumentParser):
+    parser.add_argument("--args", type=_json_arg, help="Constructor args as a JSON list")
+    parser.add_argument("--kwargs", type=_json_arg, help="Constructor args as a JSON object")
+    parser.add_argument(
+        "--library", action="append", metavar="NAME=ADDRESS",
+        help="Library address; NAME is Library or file:Library (repeatable)",
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--artifacts", help="Artifact directory (default: artifacts)")
+    common.add_argument("--json", action="store_true", help="Print results as JSON")
+    common.add_argument("--trace", action="store_true", help="Print a per-phase timing summary to stderr")
+
+    parser = argparse.ArgumentParser(prog="evmdeploy", description="Compile and deploy Solidity contracts.")
+    sub = parser.add_subparsers(dest="command", required=True, metavar="COMMAND")
+
+    build = sub.add_parser("build", parents=[common], help="Compile Solidity sources into artifacts")
+    build.add_argument("sources", nargs="+", help="Solidity files or glob patterns")
+    build.add_argument("--solc-version", default="0.8.23")
+    build.add_argument("--runs", type=int, default=200, help="Optimizer runs")
+    build.add_argument("--no-optimizer", action="store_true")
+    build.add_argument("--remap", action="append", metavar="PREFIX=PATH", help="Import remapping (repeatable)")
+    build.add_argument("--cache-dir", help="Compilation cache directory")
+    build.add_argument("--outputs", default="deploy", help="Output profile: deploy, debug or full")
+    build.add_argument("--out", help="Artifact output directory (default: --artifacts)")
+    build.set_defaults(func=cmd_build)
+
+    deploy = sub.add_parser("deploy", parents=[common], help="Deploy a stored artifact")
+    deploy.add_argument("name", help="Artifact name")
+    _add_constructor(deploy)
+    _add_connection(deploy)
+    deploy.add_argument("--gas", type=int)
+    deploy.add_argument("--value", type=int, default=0, help="Wei sent with the deployment")
+    deploy.add_argument("--salt", help="Deploy with CREATE2 using this salt")
+    deploy.add_argument("--factory", help="CREATE2 factory address (default: deterministic deployer)")
+    deploy.add_argument("--no-wait", action="store_true", help="Do not wait for the receipt")
+    deploy.set_defaults(func=cmd_deploy)
+
+    plan = sub.add_parser("plan", parents=[common], help="Deploy a JSON deployment plan")
+    plan.add_argument("file", help='Plan file: {"nodes": [{"name", "artifact", "args", "salt", ...}]}; "@Node" refers to a node\'s address')
+    _add_connection(plan)
+    plan.add_argument("--dry-run", action="store_true", help="Print waves and CREATE2 addresses without sending")
+    plan.add_argument("--workers", type=int, default=8, help="Threads sending each wave")
+    plan.add_argument("--timeout", type=int, default=120, help="Seconds to wait for each wave")
+    plan.set_defaults(func=cmd_plan)
+
+    verify = sub.add_parser("verify-address", parents=[common], help="Compute (and check) a CREATE2 address offline")
+    verify.add_argument("name", help="Artifact name")
+    verify.add_argument("--salt", required=True)
+    verify.add_argument("--factory", help="CREATE2 factory address (default: deterministic deployer)")
+    verify.add_argument("--expect", help="Exit with status 1 unless the address matches")
+    _add_constructor(verify)
+    verify.set_defaults(func=cmd_verify_address)
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    _load_dotenv()
+
+    from evmdeploy.exceptions import EvmDeployError
+
+    histogram = None
+    if args.trace:
+        from evmdeploy.tracing import HistogramExporter, add_exporter, remove_exporter
+
+        histogram = add_exporter(HistogramExporter())
+
+    try:
+        return args.func(args)
+    except (EvmDeployError, FileNotFoundError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if histogram is not None:
+            remove_exporter(histogram)
+            print(histogram.report(), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from packaging.version import Version
+from solcx import install_solc
+from solcx.install import get_executable
+from solcx.exceptions import SolcNotInstalled
+from solcx.wrapper import get_solc_version
+
+from evmdeploy.exceptions import CompilationError
+
+
+class SolcRegistry:
+    """
+    Resolves solc versions to verified executables, once per process.
+
+    The resolved path is passed explicitly to every compile, so concurrent
+    compiles with different versions never touch py-solc-x's global active
+    version.
+    """
+
+    def __init__(
+        self,
+        offline: bool = False,
+        solcx_binary_path: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Args:
+            offline: Never download; fail fast if a version is not installed.
+            solcx_binary_path: Override py-solc-x's install directory.
+        """
+        self.offline = offline
+        self.solcx_binary_path = solcx_binary_path
+        self._binaries: Dict[str, Path] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def register(self, version: str, binary: Union[str, Path]) -> Path:
+        """Registers a solc executable for a version, e.g. one baked into a build image."""
+        binary_path = self._verify(version, Path(binary))
+        with self._lock:
+            self._binaries[version] = binary_path
+        return binary_path
+
+    def resolve(self, version: str) -> Path:
+        """
+        Returns the solc executable for a version, installing it if allowed.
+
+        Raises:
+            CompilationError: If the version is missing in offline mode, or the
+                              binary reports a different version.
+        """
+        binary = self._binaries.get(version)
+        if binary is not None:
+            return binary
+
+        with self._lock:
+            binary = self._binaries.get(version)
+            if binary is None:
+                binary = self._verify(version, self._locate(version))
+                self._binaries[version] = binary
+        return binary
+
+    def _locate(self, version: str) -> Path:
+        try:
+            return get_executable(version, self.solcx_binary_path)
+        except SolcNotInstalled:
+            if self.offline:
+                raise CompilationError(
+                    f"solc {version} is not installed and offline mode is enabled"
+                )
+
+        install_solc(version, solcx_binary_path=self.solcx_binary_path)
+        return get_executable(version, self.solcx_binary_path)
+
+    @staticmethod
+    def _verify(version: str, binary: Path) -> Path:
+        if not binary.exists():
+            raise CompilationError(f"solc binary not found: {binary}")
+        actual = get_solc_version(binary)
+        if actual.base_version != Version(version).base_version:
+            raise CompilationError(
+                f"solc binary {binary} reports version {actual.base_version}, expected {version}"
+            )
+        return binary
+
+    def clear(self):
+        """Forgets every resolved binary."""
+        with self._lock:
+            self._binaries.clear()
+
+
+_default_registry = SolcRegistry(
+    offline=os.environ.get("EVMDEPLOY_SOLC_OFFLINE", "").lower() in ("1", "true", "yes")
+)
+
+
+def get_default_registry() -> SolcRegistry:
+    """Returns the process-wide registry used when none is passed explicitly."""
+    return _default_registry
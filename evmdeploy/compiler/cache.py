@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+from dataclasses import asdict
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from evmdeploy.artifacts.model import ContractArtifact
+
+# Bumped whenever the cached artifact layout changes, so old entries miss
+CACHE_FORMAT = 2
+
+
+class CompilationCache:
+    """
+    Content-addressed, on-disk cache of compilation results.
+
+    Entries are keyed by a hash of every source in the import closure plus
+    the compiler settings, so a hit is only possible when solc would produce
+    the exact same output.
+    """
+
+    def __init__(self, base_path: Union[str, Path] = ".evmdeploy_cache"):
+        self.base_path = Path(base_path)
+        self.base_path.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def compute_key(sources: Dict[str, Optional[str]], settings: Dict[str, Any]) -> str:
+        """
+        Hash a set of sources and compiler settings into a cache key.
+
+        Args:
+            sources: {source_unit_name: content}, content None for missing files.
+            settings: Anything that affects compiler output (version, optimizer,
+                      remappings, libraries, ...). Must be JSON-serialisable.
+        """
+        digest = sha256(f"v{CACHE_FORMAT}\0".encode())
+        digest.update(json.dumps(settings, sort_keys=True).encode())
+        for name in sorted(sources):
+            content = sources[name]
+            content_hash = sha256(content.encode()).hexdigest() if content is not None else "missing"
+            digest.update(f"\0{name}\0{content_hash}".encode())
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.base_path / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, ContractArtifact]]:
+        """Returns the cached artifacts for a key, or None on a miss."""
+        file_path = self._entry_path(key)
+        try:
+            with open(file_path, "r") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        return {
+            name: ContractArtifact(**artifact)
+            for name, artifact in data["artifacts"].items()
+        }
+
+    def put(self, key: str, artifacts: Dict[str, ContractArtifact]) -> Path:
+        """Stores artifacts under a key. The write is atomic."""
+        file_path = self._entry_path(key)
+        data = {"artifacts": {name: asdict(a) for name, a in artifacts.items()}}
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.base_path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        return file_path
+
+    def clear(self):
+        """Removes every cached entry."""
+        for file_path in self.base_path.glob("*.json"):
+            file_path.unlink()
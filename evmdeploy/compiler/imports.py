@@ -0,0 +1,107 @@
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_COMMENT_RE = re.compile(r"//[^\n]*|/\*.*?\*/", re.S)
+_IMPORT_RE = re.compile(r"\bimport\s+[^;]*?[\"']([^\"']+)[\"'][^;]*;")
+
+
+def scan_imports(source: str) -> List[str]:
+    """
+    Return the import paths referenced by a Solidity source, in order.
+
+    Handles every import form (`import "x";`, `import "x" as y;`,
+    `import * as y from "x";`, `import {a, b} from "x";`). Comments are
+    stripped first so commented-out imports are ignored.
+    """
+    return _IMPORT_RE.findall(_COMMENT_RE.sub("", source))
+
+
+def resolve_import(
+    import_path: str,
+    importer: Path,
+    remappings: Optional[Dict[str, str]] = None,
+) -> Path:
+    """
+    Resolve an import path to a file on disk, the same way solc would.
+
+    Relative imports ("./", "../") resolve against the importing file's
+    directory. Everything else goes through the longest matching remapping
+    prefix and then resolves against the current working directory.
+    """
+    if import_path.startswith(("./", "../")):
+        return (importer.parent / import_path).resolve()
+
+    remappings = remappings or {}
+    for prefix in sorted(remappings, key=len, reverse=True):
+        if import_path.startswith(prefix):
+            import_path = remappings[prefix] + import_path[len(prefix):]
+            break
+
+    return Path(import_path).resolve()
+
+
+def source_unit_name(path: Path) -> str:
+    """Stable name for a source file: relative to the cwd when possible."""
+    path = path.resolve()
+    try:
+        return path.relative_to(Path.cwd()).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def scan_import_graph(
+    paths: Iterable[str],
+    remappings: Optional[Dict[str, str]] = None,
+) -> Dict[str, Tuple[Optional[str], List[str]]]:
+    """
+    Walk the import closure of one or more Solidity files.
+
+    Args:
+        paths: Root Solidity files.
+        remappings: Import remappings, as passed to `compile_solidity`.
+
+    Returns:
+        Dict of {source_unit_name: (content, imported_source_unit_names)} for
+        every root and every file they transitively import. Imports that
+        cannot be found on disk map to (None, []) so callers can still
+        account for them.
+    """
+    graph: Dict[str, Tuple[Optional[str], List[str]]] = {}
+    pending = [Path(path).resolve() for path in paths]
+
+    while pending:
+        current = pending.pop()
+        name = source_unit_name(current)
+        if name in graph:
+            continue
+
+        if not current.is_file():
+            graph[name] = (None, [])
+            continue
+
+        content = current.read_text()
+        imported = [resolve_import(p, current, remappings) for p in scan_imports(content)]
+        graph[name] = (content, [source_unit_name(p) for p in imported])
+        pending.extend(imported)
+
+    return graph
+
+
+def collect_sources(
+    path: str,
+    remappings: Optional[Dict[str, str]] = None,
+) -> Dict[str, Optional[str]]:
+    """
+    Walk the import closure of a Solidity file.
+
+    Args:
+        path: Root Solidity file.
+        remappings: Import remappings, as passed to `compile_solidity`.
+
+    Returns:
+        Dict of {source_unit_name: content} for the root file and every file
+        it transitively imports. Imports that cannot be found on disk map to
+        None so callers can still account for them.
+    """
+    return {name: content for name, (content, _) in scan_import_graph([path], remappings).items()}
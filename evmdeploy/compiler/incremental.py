@@ -0,0 +1,242 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+from hashlib import sha256
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Union
+
+from evmdeploy.artifacts.model import ContractArtifact
+from evmdeploy.artifacts.storage import ArtifactStorage, find_name_clashes
+from evmdeploy.compiler.imports import scan_import_graph, source_unit_name
+from evmdeploy.compiler.solidity import SolidityCompiler, _expand_paths, _extra_outputs
+from evmdeploy.exceptions import CompilationError
+
+logger = logging.getLogger(__name__)
+
+
+class ImportGraph:
+    """
+    Persistent record of every known source: its content hash, the source
+    units it imports and, for built roots, the artifact names it produced.
+    """
+
+    def __init__(self, settings: Optional[Dict] = None):
+        self.settings = settings or {}
+        self.nodes: Dict[str, Dict] = {}
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ImportGraph":
+        """Loads a graph from disk; a missing or corrupt file yields an empty graph."""
+        graph = cls()
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return graph
+
+        graph.settings = data.get("settings", {})
+        graph.nodes = data.get("nodes", {})
+        return graph
+
+    def save(self, path: Union[str, Path]):
+        """Writes the graph to disk atomically."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"settings": self.settings, "nodes": self.nodes}, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def content_hash(self, name: str) -> Optional[str]:
+        node = self.nodes.get(name)
+        return node["hash"] if node else None
+
+    def update(self, name: str, content_hash: Optional[str], imports: List[str]):
+        self.nodes[name] = {"hash": content_hash, "imports": imports}
+
+    def artifact_names(self, name: str) -> List[str]:
+        node = self.nodes.get(name)
+        return node.get("artifacts", []) if node else []
+
+    def set_artifact_names(self, name: str, artifact_names: List[str]):
+        self.nodes[name]["artifacts"] = sorted(artifact_names)
+
+    def dependents(self, names: Iterable[str]) -> Set[str]:
+        """Returns `names` plus every source that transitively imports one of them."""
+        reverse: Dict[str, Set[str]] = {}
+        for name, node in self.nodes.items():
+            for imported in node["imports"]:
+                reverse.setdefault(imported, set()).add(name)
+
+        result = set(names)
+        pending = list(result)
+        while pending:
+            for importer in reverse.get(pending.pop(), ()):
+                if importer not in result:
+                    result.add(importer)
+                    pending.append(importer)
+        return result
+
+
+def _hash_content(content: Optional[str]) -> Optional[str]:
+    return sha256(content.encode()).hexdigest() if content is not None else None
+
+
+class IncrementalBuilder:
+    """
+    Rebuilds only the compilation units affected by a change.
+
+    The import graph is stored next to the artifacts, so state survives
+    across processes. Changing compiler settings invalidates everything.
+    The builder owns the artifacts it wrote: those of a root that is deleted
+    or renamed, or of a contract removed from a root, are deleted again.
+    """
+
+    GRAPH_FILE = ".import_graph.json"
+
+    def __init__(self, compiler: SolidityCompiler, storage: ArtifactStorage):
+        self.compiler = compiler
+        self.storage = storage
+        self.graph_path = storage.base_path / self.GRAPH_FILE
+
+    def _settings(self) -> Dict:
+        return {
+            "solc_version": self.compiler.solc_version,
+            "optimizer": self.compiler.optimizer,
+            "runs": self.compiler.runs,
+            "remappings": self.compiler.remappings or {},
+            "libraries": self.compiler.libraries or {},
+            "outputs": _extra_outputs(self.compiler.outputs),
+        }
+
+    def build(self, paths_or_glob: Union[str, Iterable[str]]) -> Dict[str, ContractArtifact]:
+        """
+        Recompiles every root whose import closure changed since the last build,
+        in a single solc invocation, and saves the results to storage.
+
+        Returns:
+            The rebuilt artifacts keyed by "path:Contract"; empty if nothing changed.
+        """
+        roots = {source_unit_name(p): p for p in _expand_paths(paths_or_glob)}
+        scanned = scan_import_graph([str(p) for p in roots.values()], self.compiler.remappings)
+
+        previous = ImportGraph.load(self.graph_path)
+        settings = self._settings()
+        current = ImportGraph(settings)
+        for name, (content, imports) in scanned.items():
+            current.update(name, _hash_content(content), imports)
+
+        if previous.settings != settings:
+            dirty = set(roots)
+        else:
+            changed = [
+                name for name in current.nodes
+                if current.content_hash(name) != previous.content_hash(name)
+            ]
+            dirty = current.dependents(changed) & set(roots)
+
+        artifacts: Dict[str, ContractArtifact] = {}
+        if dirty:
+            # Roots defining only interfaces or abstract contracts compile to nothing
+            artifacts = self.compiler.compile_many(
+                [str(roots[name]) for name in sorted(dirty)], allow_empty=True
+            )
+
+        # Clean roots still own what the previous build saved for them
+        produced = {name: [] if name in dirty else previous.artifact_names(name) for name in roots}
+        for qualified in artifacts:
+            root, _, contract = qualified.rpartition(":")
+            produced[root].append(contract)
+
+        # Storage keeps one file per contract name, across all roots
+        clashes = find_name_clashes(f"{root}:{name}" for root, names in produced.items() for name in names)
+        if clashes:
+            details = "; ".join(f"{name} ({', '.join(q)})" for name, q in sorted(clashes.items()))
+            raise CompilationError(f"Contract names defined more than once: {details}")
+
+        self.storage.save_artifacts(artifacts)
+
+        owned = {name for root in previous.nodes for name in previous.artifact_names(root)}
+        for name in owned.difference(*produced.values()):
+            self.storage.delete_artifact(name)
+
+        for root, names in produced.items():
+            current.set_artifact_names(root, names)
+        current.save(self.graph_path)
+        return artifacts
+
+    def _snapshot(self, paths_or_glob: Union[str, Iterable[str]]) -> Dict[str, float]:
+        """mtimes of every tracked file: the current roots plus the last known graph."""
+        files = {str(p) for p in _expand_paths(paths_or_glob)}
+        files.update(ImportGraph.load(self.graph_path).nodes)
+
+        snapshot = {}
+        for name in files:
+            try:
+                snapshot[name] = os.stat(name).st_mtime
+            except FileNotFoundError:
+                snapshot[name] = -1.0
+        return snapshot
+
+    def watch(
+        self,
+        paths_or_glob: Union[str, Iterable[str]],
+        debounce: float = 0.3,
+        poll_interval: float = 0.5,
+        on_build: Optional[Callable[[Dict[str, ContractArtifact]], None]] = None,
+        stop: Optional[threading.Event] = None,
+    ):
+        """
+        Builds once, then rebuilds whenever a tracked file changes.
+
+        Changes are detected by polling file mtimes. A rebuild starts only
+        after `debounce` seconds without further changes, so an editor saving
+        several files produces one build.
+
+        Args:
+            paths_or_glob: Roots to build; globs are re-expanded every cycle.
+            debounce: Quiet period required before rebuilding (seconds).
+            poll_interval: How often to check for changes (seconds).
+            on_build: Called with the rebuilt artifacts after every build.
+            stop: Event that ends the loop when set (default: run until interrupted).
+        """
+        stop = stop or threading.Event()
+
+        def run_build(snapshot: Dict[str, float]) -> Dict[str, float]:
+            # `snapshot` is taken before building, so a file saved during the
+            # build still differs from it and triggers another build. Files
+            # the build newly discovered through imports start from their
+            # current mtime.
+            try:
+                artifacts = self.build(paths_or_glob)
+            except (CompilationError, FileNotFoundError) as e:
+                logger.error("Build failed: %s", e)
+            else:
+                if on_build is not None:
+                    on_build(artifacts)
+            after = self._snapshot(paths_or_glob)
+            return {name: snapshot.get(name, mtime) for name, mtime in after.items()}
+
+        snapshot = run_build(self._snapshot(paths_or_glob))
+
+        while not stop.wait(poll_interval):
+            current = self._snapshot(paths_or_glob)
+            if current == snapshot:
+                continue
+
+            # Wait for the burst of changes to settle
+            while not stop.wait(debounce):
+                settled = self._snapshot(paths_or_glob)
+                if settled == current:
+                    break
+                current = settled
+
+            if stop.is_set():
+                break
+            snapshot = run_build(current)
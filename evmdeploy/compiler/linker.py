@@ -1,25 +1,129 @@
+from dataclasses import replace
+from typing import Dict, List, Mapping, Tuple
+
+from evmdeploy.artifacts.model import ContractArtifact
+from evmdeploy.exceptions import LinkingError
+
+
+def _address_bytes(address: str, library_name: str) -> bytes:
+    body = address[2:] if address.startswith("0x") else address
+    if len(body) != 40:
+        raise LinkingError("Invalid library address", library_name=library_name)
+    try:
+        return bytes.fromhex(body)
+    except ValueError:
+        raise LinkingError("Invalid library address", library_name=library_name) from None
+
+
+class LinkPlan:
+    """
+    Library placeholder offsets for one bytecode, resolved once.
+
+    The placeholders are zeroed into a raw byte template when the plan is
+    built; link() copies the template and writes each library address into
+    its slots, so linking against another library set is one buffer copy
+    plus a slice assignment per reference.
+
+    Libraries are keyed by fully-qualified `file:Library` name. A bare
+    `Library` key is accepted when only one linked library has that name.
+    """
+
+    def __init__(self, bytecode: str, link_refs: Mapping[str, Mapping[str, List[Dict[str, int]]]]):
+        """
+        Args:
+            bytecode: Unlinked bytecode (hex, with or without 0x).
+            link_refs: solc linkReferences ({file: {library: [{"start", "length"}]}}).
+        """
+        body = bytecode[2:] if bytecode.startswith("0x") else bytecode
+        code = bytearray(body, "ascii")
+
+        self.slots: Dict[str, List[Tuple[int, int]]] = {}
+        by_name: Dict[str, List[str]] = {}
+        for file, libs in link_refs.items():
+            for lib_name, refs in libs.items():
+                qualified = f"{file}:{lib_name}"
+                self.slots[qualified] = [(ref["start"], ref["start"] + ref["length"]) for ref in refs]
+                by_name.setdefault(lib_name, []).append(qualified)
+                for ref in refs:
+                    start = ref["start"] * 2
+                    length = ref["length"] * 2
+                    code[start : start + length] = b"0" * length
+
+        try:
+            self.template = bytes.fromhex(code.decode("ascii"))
+        except ValueError:
+            raise LinkingError("Bytecode has placeholders not covered by its link references") from None
+        # Bare name -> qualified name, for names that are unambiguous
+        self._aliases = {name: names[0] for name, names in by_name.items() if len(names) == 1}
+
+    @property
+    def libraries(self) -> List[str]:
+        """Fully-qualified names of the libraries to link."""
+        return sorted(self.slots)
+
+    def _qualify(self, libraries: Mapping[str, str]) -> Dict[str, str]:
+        resolved: Dict[str, str] = {}
+        for key, address in libraries.items():
+            qualified = key if key in self.slots else self._aliases.get(key)
+            if qualified is not None:
+                resolved[qualified] = address
+        return resolved
+
+    def link(self, libraries: Mapping[str, str]) -> bytes:
+        """
+        Returns the linked bytecode as raw bytes.
+
+        Args:
+            libraries: {"file:Library" or "Library": address}; extra keys
+                       are ignored.
+
+        Raises:
+            LinkingError: If a library is missing or an address is invalid.
+        """
+        resolved = self._qualify(libraries)
+        code = bytearray(self.template)
+        for qualified, slots in self.slots.items():
+            if qualified not in resolved:
+                raise LinkingError("Missing library address", library_name=qualified)
+            address = _address_bytes(resolved[qualified], qualified)
+            for start, end in slots:
+                code[start:end] = address
+        return bytes(code)
+
+    def link_hex(self, libraries: Mapping[str, str]) -> str:
+        """link() as a 0x-prefixed hex string."""
+        return "0x" + self.link(libraries).hex()
+
+
 def link_bytecode(bytecode: str, link_refs: dict, libraries: dict) -> str:
     """
     Replace library placeholders in bytecode.
+
+    `bytecode` may still contain solc's `__$...$__` placeholders (with or
+    without a 0x prefix). To link the same bytecode against many library
+    sets, build a LinkPlan once instead.
     Args:
         bytecode: raw bytecode
         link_refs: from solc output
-        libraries: {library_name: address}
+        libraries: {library_name: address}; names may be `file:Library`
     """
-    bytecode_bytes = bytearray.fromhex(bytecode)
+    return LinkPlan(bytecode, link_refs).link_hex(libraries)
 
-    for file, libs in link_refs.items():
-        for lib_name, refs in libs.items():
-            if lib_name not in libraries:
-                raise ValueError(f"Missing library address for {lib_name}")
 
-            address = libraries[lib_name].replace("0x", "")
-            if len(address) != 40:
-                raise ValueError(f"Invalid library address for {lib_name}")
+def link_artifact(artifact: ContractArtifact, libraries: dict) -> ContractArtifact:
+    """
+    Links an artifact against deployed library addresses using its stored
+    link plan, without recompiling.
 
-            for ref in refs:
-                start = ref["start"] * 2
-                length = ref["length"] * 2
-                bytecode_bytes[start : start + length] = bytes.fromhex(address)
+    Args:
+        artifact: Artifact compiled without `libraries=`.
+        libraries: {library_name: address}; must cover required_libraries.
+                   Keys may be bare or `file:Library` names.
 
-    return "0x" + bytecode_bytes.hex()
+    Returns:
+        A new, fully linked artifact (the input is returned if nothing needs linking).
+    """
+    if not artifact.link_references:
+        return artifact
+    bytecode = artifact.link_plan.link_hex(libraries)
+    return replace(artifact, bytecode=bytecode, link_references={})
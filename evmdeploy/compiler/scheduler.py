@@ -0,0 +1,217 @@
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+from packaging.version import Version
+from solcx import get_installed_solc_versions
+from solcx.install import select_pragma_version
+
+from evmdeploy.artifacts.model import ContractArtifact
+from evmdeploy.compiler.imports import scan_import_graph, source_unit_name
+from evmdeploy.compiler.solidity import SolidityCompiler, _expand_paths
+from evmdeploy.exceptions import CompilationError
+
+_PRAGMA_RE = re.compile(r"pragma\s+solidity\s+([^;]+);")
+
+
+def detect_pragma(source: str) -> Optional[str]:
+    """Returns the version constraint of the first `pragma solidity` in a source, if any."""
+    match = _PRAGMA_RE.search(source)
+    return match.group(1).strip() if match else None
+
+
+def matching_versions(pragma: str, versions: Iterable[str]) -> List[str]:
+    """The versions from `versions` that satisfy a pragma constraint, in input order."""
+    return [v for v in versions if select_pragma_version(pragma, [Version(v)]) is not None]
+
+
+def select_solc_version(source: str, versions: Iterable[str], default: str) -> str:
+    """
+    Picks the newest version from `versions` that satisfies the source's pragma.
+
+    Sources without a pragma compile with `default`. This looks at one file
+    only; CompilationScheduler also takes every imported file into account.
+
+    Raises:
+        CompilationError: If the pragma matches none of the candidate versions.
+    """
+    pragma = detect_pragma(source)
+    if pragma is None:
+        return default
+
+    selected = select_pragma_version(pragma, [Version(v) for v in versions])
+    if selected is None:
+        raise CompilationError(f"No candidate solc version satisfies pragma '{pragma}'")
+    return str(selected)
+
+
+def _closure(graph: Dict[str, tuple], root: str) -> Set[str]:
+    """Source unit names of `root` and everything it transitively imports."""
+    seen: Set[str] = set()
+    pending = [root]
+    while pending:
+        name = pending.pop()
+        if name not in seen:
+            seen.add(name)
+            pending.extend(graph.get(name, (None, []))[1])
+    return seen
+
+
+def _compile_group(compiler: SolidityCompiler, version: str, files: List[str]) -> Dict[str, ContractArtifact]:
+    """Worker entry point: compiles one version group in its own process."""
+    worker = SolidityCompiler(
+        solc_version=version,
+        remappings=compiler.remappings,
+        libraries=compiler.libraries,
+        optimizer=compiler.optimizer,
+        runs=compiler.runs,
+        cache_dir=compiler.cache.base_path if compiler.cache is not None else None,
+        registry=compiler.registry,
+        outputs=compiler.outputs,
+    )
+    # A group may hold only interfaces; compile() checks the merged result
+    return worker.compile_many(files, allow_empty=True)
+
+
+class CompilationScheduler:
+    """
+    Compiles a multi-version project by grouping sources per solc version and
+    building each group in a separate worker process.
+
+    Every worker resolves its own solc binary and passes it explicitly to
+    solc, so groups never share or race on a global active version.
+    """
+
+    def __init__(
+        self,
+        compiler: SolidityCompiler,
+        versions: Optional[Iterable[str]] = None,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Args:
+            compiler: Supplies remappings, libraries, optimizer settings and
+                      cache; its solc_version is used for sources without a pragma.
+            versions: Candidate solc versions for pragma matching. Defaults to
+                      the installed versions plus the compiler's own version.
+            max_workers: Upper bound on worker processes (default: CPU count).
+        """
+        self.compiler = compiler
+        self.versions = list(versions) if versions is not None else None
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def _candidate_versions(self) -> List[str]:
+        if self.versions is not None:
+            return self.versions
+        installed = {str(v) for v in get_installed_solc_versions()}
+        installed.add(self.compiler.solc_version)
+        return sorted(installed, key=Version)
+
+    def group(self, paths_or_glob: Union[str, Iterable[str]]) -> Dict[str, List[str]]:
+        """
+        Groups source files by the solc version they should be compiled with.
+
+        A file's version must satisfy the pragma of every file in its import
+        closure, not just its own. Files that share imports are put in one
+        group when a common version exists, so a shared file is compiled
+        once rather than once per group.
+
+        Raises:
+            CompilationError: If no candidate version satisfies a file's
+                              import closure.
+        """
+        candidates = self._candidate_versions()
+        files = _expand_paths(paths_or_glob)
+        roots = {source_unit_name(f): str(f) for f in files}
+        graph = scan_import_graph(list(roots.values()), self.compiler.remappings)
+
+        # Versions allowed by each file's own pragma; None if it has none
+        allowed: Dict[str, Optional[List[str]]] = {}
+        for name, (content, _) in graph.items():
+            pragma = detect_pragma(content) if content is not None else None
+            allowed[name] = matching_versions(pragma, candidates) if pragma is not None else None
+
+        closures: Dict[str, Set[str]] = {}
+        root_allowed: Dict[str, Optional[Set[str]]] = {}
+        for root in roots:
+            closures[root] = _closure(graph, root)
+            constraints = [set(allowed[f]) for f in closures[root] if allowed.get(f) is not None]
+            versions = set.intersection(*constraints) if constraints else None
+            if versions is not None and not versions:
+                pragmas = ", ".join(
+                    f"{f} ({detect_pragma(graph[f][0])})" for f in sorted(closures[root]) if allowed.get(f) is not None
+                )
+                raise CompilationError(
+                    f"No candidate solc version satisfies every pragma in the import closure: {pragmas}",
+                    source_path=roots[root],
+                )
+            root_allowed[root] = versions
+
+        groups: Dict[str, List[str]] = {}
+        for component in self._components(closures):
+            constraints = [root_allowed[r] for r in component if root_allowed[r] is not None]
+            shared = set.intersection(*constraints) if constraints else None
+            for root in component:
+                if shared is None:
+                    version = self.compiler.solc_version
+                else:
+                    version = max(shared or root_allowed[root] or {self.compiler.solc_version}, key=Version)
+                groups.setdefault(version, []).append(roots[root])
+
+        return groups
+
+    @staticmethod
+    def _components(closures: Dict[str, Set[str]]) -> List[List[str]]:
+        """Roots grouped so that roots sharing any imported file end up together."""
+        owner: Dict[str, str] = {}
+        parent: Dict[str, str] = {root: root for root in closures}
+
+        def find(root: str) -> str:
+            while parent[root] != root:
+                parent[root] = parent[parent[root]]
+                root = parent[root]
+            return root
+
+        for root, closure in closures.items():
+            for name in closure:
+                other = owner.setdefault(name, root)
+                parent[find(root)] = find(other)
+
+        components: Dict[str, List[str]] = {}
+        for root in closures:
+            components.setdefault(find(root), []).append(root)
+        return list(components.values())
+
+    def compile(self, paths_or_glob: Union[str, Iterable[str]]) -> Dict[str, ContractArtifact]:
+        """
+        Compiles every matched source and merges the results.
+
+        Returns:
+            Dict of ContractArtifact objects, keyed by "path:Contract".
+
+        Raises:
+            CompilationError: If no source defines a deployable contract.
+        """
+        groups = self.group(paths_or_glob)
+        if not groups:
+            raise FileNotFoundError(f"No Solidity files matched: {paths_or_glob}")
+
+        # A single group gains nothing from a pool; skip the spawn cost
+        if len(groups) == 1:
+            version, files = next(iter(groups.items()))
+            artifacts = _compile_group(self.compiler, version, files)
+        else:
+            artifacts = {}
+            workers = min(self.max_workers, len(groups))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_compile_group, self.compiler, version, files)
+                    for version, files in groups.items()
+                ]
+                for future in futures:
+                    artifacts.update(future.result())
+
+        if not artifacts:
+            raise CompilationError("No deployable contracts found in project")
+        return artifacts
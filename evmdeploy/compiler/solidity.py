@@ -1,12 +1,145 @@
+import glob
+import json
 from pathlib import Path
 from hashlib import sha256
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
 
-from solcx import compile_standard, install_solc, set_solc_version
+from solcx import compile_standard
 
+from evmdeploy.compiler.binaries import SolcRegistry, get_default_registry
+from evmdeploy.compiler.cache import CompilationCache
+from evmdeploy.compiler.imports import collect_sources, source_unit_name
 from evmdeploy.compiler.linker import link_bytecode
 from evmdeploy.artifacts.model import ContractArtifact
 from evmdeploy.exceptions import CompilationError
+from evmdeploy.tracing import span
+
+
+# Outputs every compile needs to produce a deployable artifact
+_REQUIRED_OUTPUTS = ["abi", "evm.bytecode.object", "evm.bytecode.linkReferences"]
+
+# Named sets of additional solc outputs for `outputs=`. The default, "deploy",
+# asks solc for nothing beyond bytecode and ABI.
+OUTPUT_PROFILES: Dict[str, List[str]] = {
+    "deploy": [],
+    "debug": [
+        "evm.bytecode.sourceMap",
+        "evm.deployedBytecode.object",
+        "evm.deployedBytecode.sourceMap",
+        "storageLayout",
+    ],
+    "full": [
+        "evm.bytecode.sourceMap",
+        "evm.deployedBytecode.object",
+        "evm.deployedBytecode.sourceMap",
+        "evm.deployedBytecode.linkReferences",
+        "evm.methodIdentifiers",
+        "storageLayout",
+        "metadata",
+        "devdoc",
+        "userdoc",
+    ],
+}
+
+
+def _extra_outputs(outputs: Union[str, Sequence[str]]) -> List[str]:
+    """Resolves a profile name or list of solc output selectors to the extras to request."""
+    if isinstance(outputs, str):
+        if outputs not in OUTPUT_PROFILES:
+            raise ValueError(
+                f"Unknown output profile {outputs!r}; expected one of {sorted(OUTPUT_PROFILES)}"
+            )
+        return list(OUTPUT_PROFILES[outputs])
+    return [o for o in dict.fromkeys(outputs) if o not in _REQUIRED_OUTPUTS]
+
+
+def _standard_input(
+    sources: Dict[str, Dict[str, str]],
+    remappings: Dict[str, str],
+    optimizer: bool,
+    runs: int,
+    extra_outputs: List[str],
+) -> Dict[str, Any]:
+    """Builds the solc standard-JSON input for a set of sources."""
+    # Handle remappings for py-solc-x
+    # remapping format: "@openzeppelin/": "node_modules/@openzeppelin/"
+    import_remaps = [f"{k}={v}" for k, v in remappings.items()]
+
+    return {
+        "language": "Solidity",
+        "sources": sources,
+        "settings": {
+            "optimizer": {"enabled": optimizer, "runs": runs},
+            "outputSelection": {"*": {"*": _REQUIRED_OUTPUTS + extra_outputs}},
+            "remappings": import_remaps,
+        },
+    }
+
+
+def _run_solc(input_data: Dict[str, Any], source_path: str, solc_binary: Path) -> Dict[str, Any]:
+    """Runs solc on a standard-JSON input, wrapping failures in CompilationError."""
+    sources = input_data["sources"]
+    try:
+        with span(
+            "compile.solc",
+            source=source_path,
+            sources=len(sources),
+            bytes=sum(len(s.get("content", "")) for s in sources.values()),
+        ):
+            return compile_standard(
+                input_data,
+                allow_paths=".",  # required for relative imports
+                solc_binary=solc_binary,
+            )
+    except Exception as e:
+        raise CompilationError(
+            f"Compilation failed: {e}", source_path=source_path, compiler_output=str(e)
+        )
+
+
+def _extract_artifacts(
+    contracts: Dict[str, Any],
+    libraries: Dict[str, str],
+    solc_version: str,
+    source_hash: str,
+    extra_outputs: List[str],
+) -> Dict[str, ContractArtifact]:
+    """Turns the solc output for one source unit into ContractArtifacts."""
+    artifacts = {}
+
+    for contract_name, data in contracts.items():
+        bytecode = data["evm"]["bytecode"]["object"]
+        link_refs = data["evm"]["bytecode"].get("linkReferences", {})
+
+        if bytecode == "":
+            # abstract contract or interface
+            continue
+
+        if link_refs and libraries:
+            bytecode = link_bytecode(bytecode, link_refs, libraries)[2:]
+            link_refs = {}
+
+        # Keep extras as compact JSON; they are parsed on first access
+        extras = {}
+        for selector in extra_outputs:
+            value: Any = data
+            for key in selector.split("."):
+                value = value.get(key) if isinstance(value, dict) else None
+            if value is not None:
+                extras[selector] = json.dumps(value, separators=(",", ":"))
+
+        artifact = ContractArtifact(
+            name=contract_name,
+            abi=data.get("abi", []),
+            bytecode="0x" + bytecode,
+            compiler_version=solc_version,
+            source_hash=source_hash,
+            extra_outputs=extras,
+            link_references=link_refs,
+        )
+        artifacts[contract_name] = artifact
+
+    return artifacts
 
 
 def compile_solidity(
@@ -16,6 +149,9 @@ def compile_solidity(
     libraries: Optional[Dict[str, str]] = None,
     optimizer: bool = True,
     runs: int = 200,
+    cache: Optional[CompilationCache] = None,
+    registry: Optional[SolcRegistry] = None,
+    outputs: Union[str, Sequence[str]] = "deploy",
 ) -> Dict[str, ContractArtifact]:
     """
     Compile Solidity file(s) using py-solc-x and return ContractArtifact dict.
@@ -27,20 +163,46 @@ def compile_solidity(
         libraries: optional dict of {library_name: deployed_address} for linking
         optimizer: Whether to enable Solidity optimizer (default: True)
         runs: Optimizer runs (default: 200)
+        cache: optional CompilationCache; on a hit solc is never started
+        registry: SolcRegistry resolving the solc binary (default: process-wide registry)
+        outputs: OUTPUT_PROFILES name or list of solc output selectors to keep on
+                 the artifacts as `extra_outputs` (default: "deploy", none)
 
     Returns:
         Dict of ContractArtifact objects, keyed by contract name.
     """
     remappings = remappings or {}
     libraries = libraries or {}
+    extra_outputs = _extra_outputs(outputs)
 
     path_obj = Path(path)
     if not path_obj.exists():
         raise FileNotFoundError(f"Solidity file not found: {path}")
 
-    # Ensure compiler version is installed
-    install_solc(solc_version)
-    set_solc_version(solc_version)
+    # Look up the cache before touching solc at all
+    cache_key = None
+    if cache is not None:
+        with span("compile.cache", source=str(path)) as trace:
+            cache_key = CompilationCache.compute_key(
+                collect_sources(path, remappings),
+                {
+                    "root": path_obj.name,
+                    "solc_version": solc_version,
+                    "optimizer": optimizer,
+                    "runs": runs,
+                    "remappings": remappings,
+                    "libraries": libraries,
+                    "outputs": extra_outputs,
+                },
+            )
+            cached = cache.get(cache_key)
+            trace.set(hit=cached is not None)
+        if cached is not None:
+            return cached
+
+    # Resolve (and on first use install) the compiler binary
+    with span("compile.resolve_solc", version=solc_version):
+        solc_binary = (registry or get_default_registry()).resolve(solc_version)
 
     # Read Solidity source
     source = path_obj.read_text()
@@ -48,65 +210,146 @@ def compile_solidity(
     # Prepare sources dict for py-solc-x
     sources = {str(path_obj.name): {"content": source}}
 
-    # Handle remappings for py-solc-x
-    # remapping format: "@openzeppelin/": "node_modules/@openzeppelin/"
-    import_remaps = [f"{k}={v}" for k, v in remappings.items()]
-
     # Compile
-    try:
-        compiled = compile_standard(
-            {
-                "language": "Solidity",
-                "sources": sources,
-                "settings": {
-                    "optimizer": {"enabled": optimizer, "runs": runs},
-                    "outputSelection": {
-                        "*": {
-                            "*": [
-                                "abi",
-                                "evm.bytecode.object",
-                                "evm.deployedBytecode.object",
-                                "metadata",
-                                "evm.bytecode.linkReferences",
-                            ]
-                        }
-                    },
-                    "remappings": import_remaps,
-                },
-            },
-            allow_paths=".",  # required for relative imports
-        )
-    except Exception as e:
-        raise CompilationError(
-            f"Compilation failed: {e}", source_path=path, compiler_output=str(e)
-        )
+    compiled = _run_solc(_standard_input(sources, remappings, optimizer, runs, extra_outputs), path, solc_binary)
 
     source_hash = sha256(source.encode()).hexdigest()
-    artifacts = {}
+    artifacts = _extract_artifacts(
+        compiled.get("contracts", {}).get(path_obj.name, {}),
+        libraries,
+        solc_version,
+        source_hash,
+        extra_outputs,
+    )
 
-    contracts = compiled.get("contracts", {}).get(path_obj.name, {})
-    for contract_name, data in contracts.items():
-        bytecode = data["evm"]["bytecode"]["object"]
-        link_refs = data["evm"]["bytecode"].get("linkReferences", {})
+    if not artifacts:
+        raise CompilationError("No deployable contracts found in file")
 
-        if bytecode == "":
-            # abstract contract or interface
-            continue
+    if cache is not None:
+        cache.put(cache_key, artifacts)
 
-        if link_refs and libraries:
-            bytecode = link_bytecode(bytecode, link_refs, libraries)
+    return artifacts
 
-        artifact = ContractArtifact(
-            name=contract_name,
-            abi=data.get("abi", []),
-            bytecode="0x" + bytecode,
-            compiler_version=solc_version,
-            source_hash=source_hash,
+
+def _expand_paths(paths_or_glob: Union[str, Iterable[str]]) -> List[Path]:
+    """Expands a path, glob pattern or list of either into unique, sorted file paths."""
+    patterns = [paths_or_glob] if isinstance(paths_or_glob, (str, Path)) else list(paths_or_glob)
+
+    found: Dict[str, Path] = {}
+    for pattern in patterns:
+        pattern = str(pattern)
+        if glob.has_magic(pattern):
+            matches = [Path(m) for m in glob.glob(pattern, recursive=True)]
+        else:
+            matches = [Path(pattern)]
+            if not matches[0].exists():
+                raise FileNotFoundError(f"Solidity file not found: {pattern}")
+
+        for match in matches:
+            if match.is_file():
+                found[source_unit_name(match)] = match
+
+    return [found[name] for name in sorted(found)]
+
+
+def compile_project(
+    paths_or_glob: Union[str, Iterable[str]],
+    solc_version: str = "0.8.23",
+    remappings: Optional[Dict[str, str]] = None,
+    libraries: Optional[Dict[str, str]] = None,
+    optimizer: bool = True,
+    runs: int = 200,
+    cache: Optional[CompilationCache] = None,
+    registry: Optional[SolcRegistry] = None,
+    outputs: Union[str, Sequence[str]] = "deploy",
+    allow_empty: bool = False,
+) -> Dict[str, ContractArtifact]:
+    """
+    Compile many Solidity files in a single solc standard-JSON invocation.
+
+    Shared imports are parsed once for the whole batch instead of once per file.
+
+    Args:
+        paths_or_glob: A path, a glob pattern (e.g. "contracts/**/*.sol"), or a
+                       list of either.
+        solc_version: Solidity compiler version to use.
+        remappings: dict of import remappings, e.g., {"@openzeppelin/": "node_modules/@openzeppelin/"}
+        libraries: optional dict of {library_name: deployed_address} for linking
+        optimizer: Whether to enable Solidity optimizer (default: True)
+        runs: Optimizer runs (default: 200)
+        cache: optional CompilationCache; on a hit solc is never started
+        registry: SolcRegistry resolving the solc binary (default: process-wide registry)
+        outputs: OUTPUT_PROFILES name or list of solc output selectors to keep on
+                 the artifacts as `extra_outputs` (default: "deploy", none)
+        allow_empty: Return an empty dict instead of raising when the files
+                     define only interfaces or abstract contracts
+                     without bytecode
+
+    Returns:
+        Dict of ContractArtifact objects, keyed by fully-qualified name
+        ("contracts/Vault.sol:Vault"). Only contracts defined in the given
+        files are returned, not those of their imports.
+    """
+    remappings = remappings or {}
+    libraries = libraries or {}
+    extra_outputs = _extra_outputs(outputs)
+
+    files = _expand_paths(paths_or_glob)
+    if not files:
+        raise FileNotFoundError(f"No Solidity files matched: {paths_or_glob}")
+
+    sources = {source_unit_name(f): {"content": f.read_text()} for f in files}
+
+    cache_key = None
+    if cache is not None:
+        with span("compile.cache", sources=len(sources)) as trace:
+            closure: Dict[str, Optional[str]] = {}
+            for f in files:
+                closure.update(collect_sources(str(f), remappings))
+            cache_key = CompilationCache.compute_key(
+                closure,
+                {
+                    "roots": sorted(sources),
+                    "solc_version": solc_version,
+                    "optimizer": optimizer,
+                    "runs": runs,
+                    "remappings": remappings,
+                    "libraries": libraries,
+                    "outputs": extra_outputs,
+                },
+            )
+            cached = cache.get(cache_key)
+            trace.set(hit=cached is not None)
+        if cached is not None:
+            return cached
+
+    with span("compile.resolve_solc", version=solc_version):
+        solc_binary = (registry or get_default_registry()).resolve(solc_version)
+
+    compiled = _run_solc(
+        _standard_input(sources, remappings, optimizer, runs, extra_outputs),
+        ", ".join(sources),
+        solc_binary,
+    )
+
+    artifacts: Dict[str, ContractArtifact] = {}
+    for name, source in sources.items():
+        source_hash = sha256(source["content"].encode()).hexdigest()
+        unit = _extract_artifacts(
+            compiled.get("contracts", {}).get(name, {}),
+            libraries,
+            solc_version,
+            source_hash,
+            extra_outputs,
         )
-        artifacts[contract_name] = artifact
+        for contract_name, artifact in unit.items():
+            artifacts[f"{name}:{contract_name}"] = artifact
 
-    if not artifacts:
-        raise CompilationError("No deployable contracts found in file")
+    if not artifacts and not allow_empty:
+        raise CompilationError("No deployable contracts found in project")
+
+    if cache is not None and artifacts:
+        cache.put(cache_key, artifacts)
 
     return artifacts
 
@@ -123,12 +366,18 @@ class SolidityCompiler:
         libraries: Optional[Dict[str, str]] = None,
         optimizer: bool = True,
         runs: int = 200,
+        cache_dir: Optional[Union[str, Path]] = None,
+        registry: Optional[SolcRegistry] = None,
+        outputs: Union[str, Sequence[str]] = "deploy",
     ):
         self.solc_version = solc_version
         self.remappings = remappings
         self.libraries = libraries
         self.optimizer = optimizer
         self.runs = runs
+        self.cache = CompilationCache(cache_dir) if cache_dir is not None else None
+        self.registry = registry
+        self.outputs = outputs
 
     def compile(self, path: str) -> Dict[str, ContractArtifact]:
         """
@@ -141,4 +390,27 @@ class SolidityCompiler:
             libraries=self.libraries,
             optimizer=self.optimizer,
             runs=self.runs,
+            cache=self.cache,
+            registry=self.registry,
+            outputs=self.outputs,
+        )
+
+    def compile_many(
+        self, paths_or_glob: Union[str, Iterable[str]], allow_empty: bool = False
+    ) -> Dict[str, ContractArtifact]:
+        """
+        Compile several Solidity files in one solc invocation using the stored
+        configuration. Artifacts are keyed by "path:Contract".
+        """
+        return compile_project(
+            paths_or_glob,
+            solc_version=self.solc_version,
+            remappings=self.remappings,
+            libraries=self.libraries,
+            optimizer=self.optimizer,
+            runs=self.runs,
+            cache=self.cache,
+            registry=self.registry,
+            outputs=self.outputs,
+            allow_empty=allow_empty,
         )
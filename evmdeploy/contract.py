@@ -1,14 +1,21 @@
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
 from eth_account.datastructures import SignedTransaction
 from eth_account.types import PrivateKeyType
-from web3 import Web3
+from web3 import AsyncWeb3, Web3
 
+from evmdeploy.artifacts.cache import get_artifact_cache
 from evmdeploy.artifacts.model import ContractArtifact, DeploymentResult
-from evmdeploy.crypto.signer import sign_transaction
-from evmdeploy.encoding.constructor import encode_constructor_args
+from evmdeploy.crypto.signer import get_signer, sign_transaction
+from evmdeploy.encoding.constructor import ConstructorEncoder
+from evmdeploy.deployer.async_deployer import AsyncDeployer
 from evmdeploy.deployer.deployer import Deployer
 from evmdeploy.artifacts.storage import ArtifactStorage
+from evmdeploy.compiler.linker import link_artifact
+from evmdeploy.exceptions import DeploymentError, LinkingError
+from evmdeploy.tracing import span
+from evmdeploy.utils.create2 import DETERMINISTIC_DEPLOYER, Salt, compute_create2_address, normalize_salt
 
 
 class Contract:
@@ -27,8 +34,11 @@ class Contract:
     def from_storage(cls, name: str, base_path: Union[str, Path] = "artifacts") -> "Contract":
         """
         Loads a contract from the artifact storage.
+
+        Artifacts are served from the process-wide ArtifactCache, so repeated
+        lookups skip the file parse and share the same ABI object.
         """
-        storage = ArtifactStorage(base_path)
+        storage = ArtifactStorage(base_path, cache=get_artifact_cache())
         artifact = storage.load_artifact(name)
         return cls(artifact)
 
@@ -46,11 +56,76 @@ class Contract:
             return "0x" + self.bytecode
         return self.bytecode
 
+    def link(self, libraries: Mapping[str, str]) -> "Contract":
+        """
+        Returns this contract linked against the given library addresses.
+
+        Uses the artifact's LinkPlan, so linking the same contract against
+        many library sets costs a byte copy each and never recompiles.
+
+        Args:
+            libraries: {"file:Library" or "Library": address}.
+        """
+        if not self.artifact.link_references:
+            return self
+        linked = Contract(link_artifact(self.artifact, libraries))
+        # Same ABI, so the compiled constructor encoder carries over
+        linked.__dict__["constructor_encoder"] = self.constructor_encoder
+        return linked
+
+    @cached_property
+    def constructor_encoder(self) -> ConstructorEncoder:
+        """Constructor encoder compiled from the ABI on first use."""
+        return ConstructorEncoder(self.abi)
+
     def encode_constructor_args(self, *args, **kwargs) -> bytes:
         """
         Encodes constructor arguments according to the contract's ABI.
         """
-        return encode_constructor_args(self.abi, *args, **kwargs)
+        return self.constructor_encoder.encode(*args, **kwargs)
+
+    def init_codes(self, arg_rows: Iterable[Union[Sequence[Any], Mapping[str, Any]]]) -> List[str]:
+        """
+        init_code() for many constructor argument sets, e.g. to generate
+        thousands of parameterised instances.
+
+        Args:
+            arg_rows: Each row is a list of positional args or a dict of keyword args.
+        """
+        bytecode = self.hex_bytecode
+        return [bytecode + encoded.hex() for encoded in self.constructor_encoder.encode_many(arg_rows)]
+
+    def init_code(
+        self,
+        constructor_args: Optional[List[Any]] = None,
+        constructor_kwargs: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Deployment bytecode followed by the encoded constructor args, as hex."""
+        if self.artifact.link_references:
+            raise LinkingError(
+                f"{self.name} has unlinked libraries; link() it or pass libraries=",
+                library_name=", ".join(self.artifact.qualified_libraries),
+            )
+        encoded_args = self.encode_constructor_args(*(constructor_args or []), **(constructor_kwargs or {}))
+        return self.hex_bytecode + encoded_args.hex()
+
+    def create2_address(
+        self,
+        salt: Salt,
+        constructor_args: Optional[List[Any]] = None,
+        constructor_kwargs: Optional[Dict[str, Any]] = None,
+        factory: str = DETERMINISTIC_DEPLOYER,
+    ) -> str:
+        """
+        Address deploy_create2() will deploy to, computed offline.
+
+        Args:
+            salt: int or 32-byte value.
+            constructor_args: Positional constructor args (they change the address).
+            constructor_kwargs: Keyword constructor args.
+            factory: CREATE2 factory address.
+        """
+        return compute_create2_address(factory, salt, self.init_code(constructor_args, constructor_kwargs))
 
     def prepare_deployment_transaction(
         self,
@@ -68,11 +143,7 @@ class Contract:
         """
         Prepares a deployment transaction dictionary.
         """
-        constructor_args = constructor_args or []
-        constructor_kwargs = constructor_kwargs or {}
-
-        encoded_args = self.encode_constructor_args(*constructor_args, **constructor_kwargs)
-        data = self.hex_bytecode + encoded_args.hex()
+        data = self.init_code(constructor_args, constructor_kwargs)
 
         tx: Dict[str, Any] = {
             "from": deployer_address,
@@ -112,12 +183,11 @@ class Contract:
         Prepares and signs a deployment transaction.
         """
         # We need the address for the 'from' field, though sign_transaction might not strictly require it
-        # but it's good practice.
-        from eth_account import Account
-        deployer_address = Account.from_key(private_key).address
+        # but it's good practice. Holding the signer lets sign_transaction reuse it.
+        signer = get_signer(private_key)
 
         tx = self.prepare_deployment_transaction(
-            deployer_address=deployer_address,
+            deployer_address=signer.address,
             nonce=nonce,
             gas=gas,
             max_fee_per_gas=max_fee_per_gas,
@@ -140,35 +210,163 @@ class Contract:
         gas: Optional[int] = None,
         value: int = 0,
         wait: bool = True,
+        libraries: Optional[Mapping[str, str]] = None,
     ) -> DeploymentResult:
         """
         Deploys the contract to the network.
         Returns a DeploymentResult containing the tx hash and optionally the receipt/address.
+        `libraries` links library addresses into the bytecode first (see link()).
         """
+        contract = self.link(libraries) if libraries else self
         deployer = Deployer(w3, private_key)
         
         # Prepare transaction
+        nonce = deployer.reserve_nonce()
+        try:
+            tx = contract._deployment_tx(deployer.address, nonce, gas, value, constructor_args, constructor_kwargs)
+        except Exception:
+            deployer.nonce_manager.release(nonce)
+            raise
+
+        with span("deploy.contract", contract=self.name, bytes=len(tx["data"]) // 2 - 1):
+            tx_hash = deployer.send_transaction(tx)
+            receipt = deployer.wait_for_receipt(tx_hash) if wait else None
+
+        if receipt is None:
+            return DeploymentResult(tx_hash=tx_hash)
+        return DeploymentResult(
+            tx_hash=tx_hash,
+            contract_address=receipt.get("contractAddress"),
+            receipt=receipt
+        )
+
+    def deploy_create2(
+        self,
+        w3: Web3,
+        private_key: PrivateKeyType,
+        salt: Salt,
+        constructor_args: Optional[List[Any]] = None,
+        constructor_kwargs: Optional[Dict[str, Any]] = None,
+        gas: Optional[int] = None,
+        value: int = 0,
+        wait: bool = True,
+        factory: str = DETERMINISTIC_DEPLOYER,
+        skip_existing: bool = True,
+        libraries: Optional[Mapping[str, str]] = None,
+    ) -> DeploymentResult:
+        """
+        Deploys the contract with CREATE2 through a deterministic-deployer factory.
+
+        The address depends only on the factory, salt and init code, so it is
+        known before sending (see create2_address) and is the same on every
+        chain. If code already exists there and `skip_existing` is set, no
+        transaction is sent and the result has `skipped=True`.
+        """
+        contract = self.link(libraries) if libraries else self
+        address = contract.create2_address(salt, constructor_args, constructor_kwargs, factory)
+        if skip_existing and w3.eth.get_code(address):
+            return DeploymentResult(tx_hash=None, contract_address=address, skipped=True)
+        if not w3.eth.get_code(factory):
+            raise DeploymentError(f"No CREATE2 factory deployed at {factory}")
+
+        deployer = Deployer(w3, private_key)
+
+        nonce = deployer.reserve_nonce()
+        try:
+            tx = contract._create2_tx(deployer.address, nonce, salt, gas, value, constructor_args, constructor_kwargs, factory)
+        except Exception:
+            deployer.nonce_manager.release(nonce)
+            raise
+
+        with span("deploy.contract", contract=self.name, bytes=len(tx["data"]) // 2 - 1, create2=True):
+            tx_hash = deployer.send_transaction(tx)
+            receipt = deployer.wait_for_receipt(tx_hash) if wait else None
+
+        if receipt is None:
+            return DeploymentResult(tx_hash=tx_hash, contract_address=address)
+        return DeploymentResult(tx_hash=tx_hash, contract_address=address, receipt=receipt)
+
+    async def deploy_async(
+        self,
+        w3: AsyncWeb3,
+        private_key: PrivateKeyType,
+        constructor_args: Optional[List[Any]] = None,
+        constructor_kwargs: Optional[Dict[str, Any]] = None,
+        gas: Optional[int] = None,
+        value: int = 0,
+        wait: bool = True,
+        libraries: Optional[Mapping[str, str]] = None,
+    ) -> DeploymentResult:
+        """
+        asyncio variant of deploy() using AsyncWeb3. Many deployments can be
+        awaited concurrently, e.g. with asyncio.gather.
+        """
+        contract = self.link(libraries) if libraries else self
+        deployer = AsyncDeployer(w3, private_key)
+
+        nonce = await deployer.reserve_nonce()
+        try:
+            tx = contract._deployment_tx(deployer.address, nonce, gas, value, constructor_args, constructor_kwargs)
+        except Exception:
+            deployer.nonce_manager.release(nonce)
+            raise
+
+        with span("deploy.contract", contract=self.name, bytes=len(tx["data"]) // 2 - 1):
+            tx_hash = await deployer.send_transaction(tx)
+            receipt = await deployer.wait_for_receipt(tx_hash) if wait else None
+
+        if receipt is None:
+            return DeploymentResult(tx_hash=tx_hash)
+        return DeploymentResult(
+            tx_hash=tx_hash,
+            contract_address=receipt.get("contractAddress"),
+            receipt=receipt
+        )
+
+    def _deployment_tx(
+        self,
+        deployer_address: str,
+        nonce: int,
+        gas: Optional[int],
+        value: int,
+        constructor_args: Optional[List[Any]],
+        constructor_kwargs: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Deployment tx for deploy()/deploy_async(); gas is left for the deployer to estimate if not given."""
         tx = self.prepare_deployment_transaction(
-            deployer_address=deployer.address,
-            nonce=deployer.get_nonce(),
+            deployer_address=deployer_address,
+            nonce=nonce,
             gas=gas or 0, # Deployer will estimate if 0
             value=value,
             constructor_args=constructor_args,
             constructor_kwargs=constructor_kwargs,
         )
-        
+
         # Remove gas if 0 so Deployer estimates it
         if tx.get("gas") == 0:
             del tx["gas"]
+        return tx
 
-        tx_hash = deployer.send_transaction(tx)
-        
-        if not wait:
-            return DeploymentResult(tx_hash=tx_hash)
-
-        receipt = deployer.wait_for_receipt(tx_hash)
-        return DeploymentResult(
-            tx_hash=tx_hash,
-            contract_address=receipt.get("contractAddress"),
-            receipt=receipt
-        )
+    def _create2_tx(
+        self,
+        deployer_address: str,
+        nonce: int,
+        salt: Salt,
+        gas: Optional[int],
+        value: int,
+        constructor_args: Optional[List[Any]],
+        constructor_kwargs: Optional[Dict[str, Any]],
+        factory: str,
+    ) -> Dict[str, Any]:
+        """Factory call for deploy_create2(); calldata is salt ++ init code."""
+        init_code = self.init_code(constructor_args, constructor_kwargs)
+        tx: Dict[str, Any] = {
+            "from": deployer_address,
+            "to": factory,
+            "nonce": nonce,
+            "data": "0x" + normalize_salt(salt).hex() + init_code[2:],
+            "value": value,
+        }
+        if gas:
+            tx["gas"] = gas
+        return tx
@@ -1,4 +1,55 @@
 from evmdeploy.deployer.deployer import Deployer
-from evmdeploy.deployer.gas import estimate_gas_fees
+from evmdeploy.deployer.async_deployer import AsyncDeployer
+from evmdeploy.deployer.gas import (
+    AsyncFeeOracle,
+    FeeOracle,
+    estimate_gas_fees,
+    estimate_gas_fees_async,
+    get_async_fee_oracle,
+    get_fee_oracle,
+)
+from evmdeploy.deployer.nonce import (
+    AsyncNonceManager,
+    NonceManager,
+    get_async_nonce_manager,
+    get_nonce_manager,
+)
+from evmdeploy.deployer.prepare import (
+    get_chain_id,
+    get_chain_id_async,
+    prepare_transaction,
+    prepare_transaction_async,
+)
+from evmdeploy.deployer.salt_miner import MiningProgress, SaltMatch, SaltMiner
+from evmdeploy.deployer.receipts import (
+    AsyncReceiptTracker,
+    ReceiptTracker,
+    get_async_receipt_tracker,
+    get_receipt_tracker,
+)
 
-__all__ = ["Deployer", "estimate_gas_fees"]
+__all__ = [
+    "Deployer",
+    "AsyncDeployer",
+    "estimate_gas_fees",
+    "estimate_gas_fees_async",
+    "FeeOracle",
+    "AsyncFeeOracle",
+    "get_fee_oracle",
+    "get_async_fee_oracle",
+    "NonceManager",
+    "AsyncNonceManager",
+    "get_nonce_manager",
+    "get_async_nonce_manager",
+    "prepare_transaction",
+    "prepare_transaction_async",
+    "get_chain_id",
+    "get_chain_id_async",
+    "ReceiptTracker",
+    "AsyncReceiptTracker",
+    "get_receipt_tracker",
+    "get_async_receipt_tracker",
+    "SaltMiner",
+    "SaltMatch",
+    "MiningProgress",
+]
@@ -0,0 +1,123 @@
+from typing import Any, Dict, Iterable, List, Optional
+from web3 import AsyncWeb3
+from eth_account.types import PrivateKeyType
+
+from evmdeploy.crypto.signer import get_signer
+from evmdeploy.deployer.nonce import (
+    AsyncNonceManager,
+    get_async_nonce_manager,
+    is_known_transaction_error,
+    is_nonce_error,
+)
+from evmdeploy.deployer.prepare import prepare_transaction_async
+from evmdeploy.deployer.receipts import get_async_receipt_tracker
+from evmdeploy.tracing import span
+
+
+class AsyncDeployer:
+    """
+    asyncio counterpart of Deployer, built on AsyncWeb3.
+
+    Every RPC is awaited, so many deployments and receipt waits can run
+    concurrently on one event loop without a thread each.
+    """
+
+    def __init__(
+        self,
+        w3: AsyncWeb3,
+        private_key: PrivateKeyType,
+        nonce_manager: Optional[AsyncNonceManager] = None,
+        max_nonce_retries: int = 2,
+    ):
+        """
+        Args:
+            w3: Connected AsyncWeb3 instance.
+            private_key: Sender's private key.
+            nonce_manager: Nonce allocator; defaults to the one shared by all
+                           AsyncDeployers for this key on this provider and
+                           event loop.
+            max_nonce_retries: How often send_transaction resyncs and retries
+                               after a "nonce too low" style rejection.
+        """
+        self.w3 = w3
+        self.private_key = private_key
+        self.signer = get_signer(private_key)
+        self.account = self.signer.account
+        self.address = self.account.address
+        self._nonce_manager = nonce_manager
+        self.max_nonce_retries = max_nonce_retries
+
+    @property
+    def nonce_manager(self) -> AsyncNonceManager:
+        """The explicit nonce manager, or the one shared on the running event loop."""
+        if self._nonce_manager is not None:
+            return self._nonce_manager
+        return get_async_nonce_manager(self.w3, self.address)
+
+    async def get_nonce(self) -> int:
+        """Returns the account's transaction count on the node; nothing is reserved."""
+        return await self.w3.eth.get_transaction_count(self.address)
+
+    async def reserve_nonce(self) -> int:
+        """Reserves the next nonce from the local nonce manager (see Deployer.reserve_nonce)."""
+        return await self.nonce_manager.reserve()
+
+    async def send_transaction(self, tx: Dict[str, Any]) -> str:
+        """Signs and sends a transaction, returning the tx hash."""
+        if "nonce" not in tx:
+            tx["nonce"] = await self.reserve_nonce()
+        managed = self.nonce_manager.is_outstanding(tx["nonce"])
+
+        retries = 0
+        while True:
+            try:
+                with span("deploy.send", nonce=tx["nonce"], attempt=retries + 1):
+                    tx_hash = await self._sign_and_send(tx)
+            except Exception as e:
+                if not managed:
+                    raise
+                if is_nonce_error(e) and retries < self.max_nonce_retries:
+                    self.nonce_manager.commit(tx["nonce"])
+                    await self.nonce_manager.resync()
+                    tx["nonce"] = await self.reserve_nonce()
+                    retries += 1
+                    continue
+                self.nonce_manager.release(tx["nonce"])
+                raise
+
+            if managed:
+                self.nonce_manager.commit(tx["nonce"])
+            return tx_hash
+
+    async def _sign_and_send(self, tx: Dict[str, Any]) -> str:
+        with span("deploy.prepare"):
+            await prepare_transaction_async(self.w3, tx)
+
+        with span("deploy.sign", nonce=tx["nonce"]):
+            signed_tx = self.signer.sign(tx)
+        raw_tx = signed_tx.raw_transaction
+        with span("deploy.broadcast", method="eth_sendRawTransaction", bytes=len(raw_tx)):
+            try:
+                tx_hash = await self.w3.eth.send_raw_transaction(raw_tx)
+            except Exception as e:
+                if not is_known_transaction_error(e):
+                    raise
+                # The node already has this exact transaction: it was broadcast
+                tx_hash = signed_tx.hash
+        return self.w3.to_hex(tx_hash)
+
+    async def wait_for_receipt(self, tx_hash: str, timeout: int = 120, poll_latency: float = 1.0) -> Dict[str, Any]:
+        """
+        Waits for a transaction receipt without blocking the event loop.
+
+        Backed by the provider's AsyncReceiptTracker, like Deployer.wait_for_receipt;
+        `poll_latency` is ignored.
+        """
+        with span("deploy.confirm", method="eth_getTransactionReceipt", tx_hash=tx_hash):
+            return await get_async_receipt_tracker(self.w3).track(tx_hash, timeout=timeout)
+
+    async def wait_for_receipts(self, tx_hashes: Iterable[str], timeout: int = 120) -> List[Dict[str, Any]]:
+        """Async variant of Deployer.wait_for_receipts, backed by an AsyncReceiptTracker."""
+        tx_hashes = list(tx_hashes)
+        with span("deploy.confirm", method="eth_getTransactionReceipt", count=len(tx_hashes)):
+            return await get_async_receipt_tracker(self.w3).wait(tx_hashes, timeout=timeout)
@@ -1,55 +1,132 @@
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Optional
 from web3 import Web3
 from eth_account.types import PrivateKeyType
 
-from evmdeploy.crypto.signer import sign_transaction
-from evmdeploy.deployer.gas import estimate_gas_fees
-from evmdeploy.exceptions import DeploymentError
+from evmdeploy.crypto.signer import get_signer
+from evmdeploy.deployer.nonce import (
+    NonceManager,
+    get_nonce_manager,
+    is_known_transaction_error,
+    is_nonce_error,
+)
+from evmdeploy.deployer.prepare import prepare_transaction
+from evmdeploy.deployer.receipts import get_receipt_tracker
+from evmdeploy.tracing import span
 
 class Deployer:
     """
     Handles sending transactions and waiting for confirmations on the EVM.
     """
 
-    def __init__(self, w3: Web3, private_key: PrivateKeyType):
+    def __init__(
+        self,
+        w3: Web3,
+        private_key: PrivateKeyType,
+        nonce_manager: Optional[NonceManager] = None,
+        max_nonce_retries: int = 2,
+    ):
+        """
+        Args:
+            w3: Connected Web3 instance.
+            private_key: Sender's private key.
+            nonce_manager: Nonce allocator; defaults to the one shared by all
+                           Deployers for this key on this provider.
+            max_nonce_retries: How often send_transaction resyncs and retries
+                               after a "nonce too low" style rejection.
+        """
         self.w3 = w3
         self.private_key = private_key
-        self.account = w3.eth.account.from_key(private_key)
+        self.signer = get_signer(private_key)
+        self.account = self.signer.account
         self.address = self.account.address
+        self.nonce_manager = nonce_manager or get_nonce_manager(w3, self.address)
+        self.max_nonce_retries = max_nonce_retries
 
     def get_nonce(self) -> int:
+        """Returns the account's transaction count on the node; nothing is reserved."""
         return self.w3.eth.get_transaction_count(self.address)
 
+    def reserve_nonce(self) -> int:
+        """
+        Reserves the next nonce from the local nonce manager.
+
+        Pass it in the transaction given to send_transaction, which commits
+        it on broadcast or releases it for reuse if the send fails. A nonce
+        that is reserved but never sent must be given back with
+        `nonce_manager.release(nonce)`, or later transactions stall behind
+        the gap.
+        """
+        return self.nonce_manager.reserve()
+
     def send_transaction(self, tx: Dict[str, Any]) -> str:
         """Signs and sends a transaction, returning the tx hash."""
         # Ensure nonce and chainId are set if missing
         if "nonce" not in tx:
-            tx["nonce"] = self.get_nonce()
-        if "chainId" not in tx:
-            tx["chainId"] = self.w3.eth.chain_id
-        
-        # Estimate gas if missing
-        if "gas" not in tx:
-            tx["gas"] = self.w3.eth.estimate_gas(tx)
-
-        # Merge in fee estimation if no fee fields are present
-        if not any(k in tx for k in ["gasPrice", "maxFeePerGas"]):
-            fees = estimate_gas_fees(self.w3)
-            tx.update(fees)
-
-        signed_tx = sign_transaction(tx, self.private_key, chain_id=tx["chainId"])
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            tx["nonce"] = self.reserve_nonce()
+        managed = self.nonce_manager.is_outstanding(tx["nonce"])
+
+        retries = 0
+        while True:
+            try:
+                with span("deploy.send", nonce=tx["nonce"], attempt=retries + 1):
+                    tx_hash = self._sign_and_send(tx)
+            except Exception as e:
+                if not managed:
+                    raise
+                if is_nonce_error(e) and retries < self.max_nonce_retries:
+                    # Someone else used this nonce; move past it and retry
+                    self.nonce_manager.commit(tx["nonce"])
+                    self.nonce_manager.resync()
+                    tx["nonce"] = self.reserve_nonce()
+                    retries += 1
+                    continue
+                self.nonce_manager.release(tx["nonce"])
+                raise
+
+            if managed:
+                self.nonce_manager.commit(tx["nonce"])
+            return tx_hash
+
+    def _sign_and_send(self, tx: Dict[str, Any]) -> str:
+        # Fill in chainId, gas and fees (one batched round trip where supported)
+        with span("deploy.prepare"):
+            prepare_transaction(self.w3, tx)
+
+        with span("deploy.sign", nonce=tx["nonce"]):
+            signed_tx = self.signer.sign(tx)
+        raw_tx = signed_tx.raw_transaction
+        with span("deploy.broadcast", method="eth_sendRawTransaction", bytes=len(raw_tx)):
+            try:
+                tx_hash = self.w3.eth.send_raw_transaction(raw_tx)
+            except Exception as e:
+                if not is_known_transaction_error(e):
+                    raise
+                # The node already has this exact transaction: it was broadcast
+                tx_hash = signed_tx.hash
         return self.w3.to_hex(tx_hash)
 
     def wait_for_receipt(self, tx_hash: str, timeout: int = 120, poll_latency: float = 1.0) -> Dict[str, Any]:
-        """Waits for a transaction receipt."""
-        try:
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout, poll_latency)
-            if receipt["status"] == 0:
-                raise DeploymentError(f"Transaction failed: {tx_hash}", tx_hash=tx_hash)
-            return dict(receipt)
-        except Exception as e:
-            if isinstance(e, DeploymentError):
-                raise
-            raise DeploymentError(f"Error waiting for receipt: {e}", tx_hash=tx_hash)
+        """
+        Waits for a transaction receipt.
+
+        Goes through the provider's ReceiptTracker, which polls once per
+        block (at most a second apart) and shares its loop with every other
+        wait on this provider. `poll_latency` is accepted for compatibility
+        and ignored. Raises DeploymentError if the transaction failed or
+        timed out.
+        """
+        with span("deploy.confirm", method="eth_getTransactionReceipt", tx_hash=tx_hash):
+            return get_receipt_tracker(self.w3).track(tx_hash, timeout=timeout).result()
+
+    def wait_for_receipts(self, tx_hashes: Iterable[str], timeout: int = 120) -> List[Dict[str, Any]]:
+        """
+        Waits for several receipts at once, returned in the order given.
+
+        All hashes share the provider's ReceiptTracker, which polls them
+        together once per block instead of one loop per transaction.
+        Raises DeploymentError if any transaction failed or timed out.
+        """
+        tx_hashes = list(tx_hashes)
+        with span("deploy.confirm", method="eth_getTransactionReceipt", count=len(tx_hashes)):
+            return get_receipt_tracker(self.w3).wait(tx_hashes, timeout=timeout)
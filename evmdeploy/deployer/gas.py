@@ -1,25 +1,266 @@
-from typing import Dict
-from web3 import Web3
+import asyncio
+import statistics
+import threading
+import time
+from typing import Any, Dict, Optional
 
-def estimate_gas_fees(w3: Web3) -> Dict[str, int]:
+from web3 import AsyncWeb3, Web3
+
+from evmdeploy.deployer.provider_state import shared, shared_in_loop
+
+# Reward percentile used for each urgency level
+URGENCY_PERCENTILES: Dict[str, float] = {
+    "low": 10.0,
+    "normal": 25.0,
+    "high": 50.0,
+    "urgent": 90.0,
+}
+
+
+class FeeOracle:
+    """
+    Block-scoped fee estimates shared by every deployer on a provider.
+
+    One eth_feeHistory call covers the last `blocks` blocks at all urgency
+    percentiles at once. The estimate is keyed on the head block it was
+    computed at and reused until the chain moves past that block, so a burst
+    of transactions costs a single fee query per block. The head is assumed
+    unchanged for `max_age` seconds after it was last seen; after that a
+    cheap eth_blockNumber call decides whether to reuse or refresh. The
+    priority fee for an urgency level is the median of that percentile across
+    the window (ignoring empty blocks), which is far less noisy than one block.
+    Chains without EIP-1559 data fall back to eth_gasPrice, cached the same way.
+    """
+
+    def __init__(
+        self,
+        w3: Web3,
+        blocks: int = 10,
+        urgency: str = "normal",
+        urgency_percentiles: Optional[Dict[str, float]] = None,
+        base_fee_multiplier: float = 2.0,
+        max_age: float = 1.0,
+    ):
+        """
+        Args:
+            w3: Connected Web3 instance.
+            blocks: Number of recent blocks to sample.
+            urgency: Default urgency level for fees().
+            urgency_percentiles: Reward percentile per urgency level.
+            base_fee_multiplier: maxFeePerGas headroom over the next base fee.
+            max_age: Seconds the head block is assumed unchanged before it is
+                     checked again with eth_blockNumber (0 checks on every call).
+        """
+        self.w3 = w3
+        self.blocks = blocks
+        self.urgency = urgency
+        self.urgency_percentiles = dict(urgency_percentiles or URGENCY_PERCENTILES)
+        self.percentiles = sorted(set(self.urgency_percentiles.values()))
+        self.base_fee_multiplier = base_fee_multiplier
+        self.max_age = max_age
+        # None until the first query shows whether the chain reports base fees
+        self.eip1559: Optional[bool] = None
+        # Head block the current estimate was computed at
+        self.block_number: Optional[int] = None
+        self._base_fee: Optional[int] = None
+        self._priority_fees: Dict[float, int] = {}
+        self._gas_price: Optional[int] = None
+        # When the head was last seen to still be block_number
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def fee_history_request(self):
+        """The eth_feeHistory call this oracle consumes, e.g. for a JSON-RPC batch."""
+        return self.w3.eth.fee_history(self.blocks, "latest", self.percentiles)
+
+    def cached(self, urgency: Optional[str] = None) -> Optional[Dict[str, int]]:
+        """
+        Fee fields from the current estimate, or None if there is none or the
+        head has not been checked within `max_age` seconds.
+        """
+        with self._lock:
+            if self.eip1559 is None or time.monotonic() - self._checked_at > self.max_age:
+                return None
+            return self._fields(urgency or self.urgency)
+
+    def reuse(self, head: Optional[int], urgency: Optional[str] = None) -> Optional[Dict[str, int]]:
+        """
+        Fee fields from the current estimate if it was computed at block
+        `head`, renewing it for another `max_age` seconds; None otherwise.
+        """
+        with self._lock:
+            if self.eip1559 is None or head is None or head != self.block_number:
+                return None
+            self._checked_at = time.monotonic()
+            return self._fields(urgency or self.urgency)
+
+    def update(self, fee_history: Dict[str, Any], urgency: Optional[str] = None) -> Dict[str, int]:
+        """
+        Stores an eth_feeHistory result and returns fee fields from it.
+
+        Returns an empty dict and switches to legacy pricing if the history
+        has no base fees (pre-London chains, some dev nodes).
+        """
+        base_fees = fee_history.get("baseFeePerGas") or []
+        if not any(base_fees):
+            with self._lock:
+                self.eip1559 = False
+            return {}
+
+        rewards = fee_history.get("reward") or []
+        priority_fees = {}
+        for i, percentile in enumerate(self.percentiles):
+            samples = [r[i] for r in rewards if len(r) > i]
+            # Empty blocks report zero rewards; they say nothing about demand
+            paid = [s for s in samples if s > 0]
+            priority_fees[percentile] = int(statistics.median(paid or samples or [0]))
+
+        with self._lock:
+            self.eip1559 = True
+            self.block_number = fee_history["oldestBlock"] + len(base_fees) - 2
+            # The last entry is the base fee of the next, not yet mined, block
+            self._base_fee = base_fees[-1]
+            self._priority_fees = priority_fees
+            self._checked_at = time.monotonic()
+            return self._fields(urgency or self.urgency)
+
+    def update_gas_price(self, gas_price: int, block_number: Optional[int] = None) -> Dict[str, int]:
+        """Stores an eth_gasPrice result for legacy chains, seen at head `block_number`."""
+        with self._lock:
+            self.eip1559 = False
+            self.block_number = block_number
+            self._gas_price = gas_price
+            self._checked_at = time.monotonic()
+            return {"gasPrice": gas_price}
+
+    def _head(self) -> Optional[int]:
+        """The chain head, or None when there is nothing cached to compare it with."""
+        if self.block_number is None:
+            return None
+        try:
+            return self.w3.eth.block_number
+        except Exception:
+            return None
+
+    def fees(self, urgency: Optional[str] = None, head: Optional[int] = None) -> Dict[str, int]:
+        """
+        Returns 'maxFeePerGas' and 'maxPriorityFeePerGas' (EIP-1559) or just
+        'gasPrice' (legacy) for the given urgency level, querying the node
+        only once the chain head has moved past the cached estimate.
+
+        A failed eth_feeHistory call prices that one call with eth_gasPrice;
+        the chain is only treated as legacy once fee history comes back
+        without base fees.
+
+        Args:
+            urgency: Urgency level (default: the oracle's).
+            head: Chain head the caller has just read, e.g. in a JSON-RPC
+                  batch; saves the eth_blockNumber check.
+        """
+        fees = self.cached(urgency)
+        if fees is not None:
+            return fees
+        # Concurrent callers wait for one refresh instead of each querying
+        with self._refresh_lock:
+            fees = self.cached(urgency)
+            if fees is not None:
+                return fees
+            if head is None:
+                head = self._head()
+            fees = self.reuse(head, urgency)
+            if fees is not None:
+                return fees
+            if self.eip1559 is not False:
+                try:
+                    history = self.fee_history_request()
+                except Exception:
+                    # Transient failure: do not cache, try fee history again next time
+                    return {"gasPrice": self.w3.eth.gas_price}
+                fees = self.update(history, urgency)
+                if fees:
+                    return fees
+            return self.update_gas_price(self.w3.eth.gas_price, head)
+
+    def _fields(self, urgency: str) -> Dict[str, int]:
+        if not self.eip1559:
+            return {"gasPrice": self._gas_price}
+        if urgency not in self.urgency_percentiles:
+            raise ValueError(
+                f"Unknown urgency '{urgency}'. Available: {', '.join(self.urgency_percentiles)}"
+            )
+        priority_fee = self._priority_fees[self.urgency_percentiles[urgency]]
+        return {
+            "maxFeePerGas": int(self._base_fee * self.base_fee_multiplier + priority_fee),
+            "maxPriorityFeePerGas": priority_fee,
+        }
+
+
+class AsyncFeeOracle(FeeOracle):
+    """FeeOracle for AsyncWeb3; fees() is a coroutine."""
+
+    def __init__(self, w3: AsyncWeb3, *args, **kwargs):
+        super().__init__(w3, *args, **kwargs)
+        self._async_refresh_lock = asyncio.Lock()
+
+    async def fees(self, urgency: Optional[str] = None, head: Optional[int] = None) -> Dict[str, int]:
+        """Async variant of FeeOracle.fees."""
+        fees = self.cached(urgency)
+        if fees is not None:
+            return fees
+        async with self._async_refresh_lock:
+            fees = self.cached(urgency)
+            if fees is not None:
+                return fees
+            if head is None:
+                head = await self._head_async()
+            fees = self.reuse(head, urgency)
+            if fees is not None:
+                return fees
+            if self.eip1559 is not False:
+                try:
+                    history = await self.fee_history_request()
+                except Exception:
+                    return {"gasPrice": await self.w3.eth.gas_price}
+                fees = self.update(history, urgency)
+                if fees:
+                    return fees
+            return self.update_gas_price(await self.w3.eth.gas_price, head)
+
+    async def _head_async(self) -> Optional[int]:
+        if self.block_number is None:
+            return None
+        try:
+            return await self.w3.eth.block_number
+        except Exception:
+            return None
+
+
+def get_fee_oracle(w3: Web3) -> FeeOracle:
+    """Returns the FeeOracle shared by every deployer on this provider."""
+    return shared(w3, "fee_oracle", lambda: FeeOracle(w3))
+
+
+def get_async_fee_oracle(w3: AsyncWeb3) -> AsyncFeeOracle:
+    """
+    Async counterpart of get_fee_oracle, shared per provider and event loop.
+    Must be called from a coroutine.
+    """
+    return shared_in_loop(w3, "fee_oracle", lambda: AsyncFeeOracle(w3))
+
+
+def estimate_gas_fees(w3: Web3, urgency: Optional[str] = None) -> Dict[str, int]:
     """
     Estimates gas fees for the current network.
     Returns a dict with 'maxFeePerGas' and 'maxPriorityFeePerGas' (EIP-1559)
     or just 'gasPrice' (Legacy).
+
+    Backed by the provider's shared FeeOracle, so repeated calls within a
+    block do not hit the node again.
     """
-    try:
-        # Try EIP-1559 fees first
-        fee_data = w3.eth.fee_history(1, "latest", [25.0])
-        base_fee = fee_data["baseFeePerGas"][-1]
-        priority_fee = fee_data["reward"][0][0]
-        
-        # Buffer the base fee slightly for stability
-        max_fee = int(base_fee * 2 + priority_fee)
-        
-        return {
-            "maxFeePerGas": max_fee,
-            "maxPriorityFeePerGas": priority_fee
-        }
-    except Exception:
-        # Fallback to legacy gas price
-        return {"gasPrice": w3.eth.gas_price}
+    return get_fee_oracle(w3).fees(urgency)
+
+
+async def estimate_gas_fees_async(w3: AsyncWeb3, urgency: Optional[str] = None) -> Dict[str, int]:
+    """Async variant of estimate_gas_fees for AsyncWeb3."""
+    return await get_async_fee_oracle(w3).fees(urgency)
@@ -0,0 +1,165 @@
+import asyncio
+import heapq
+import threading
+from typing import List, Optional, Set
+
+from web3 import AsyncWeb3, Web3
+
+from evmdeploy.deployer.provider_state import shared, shared_in_loop
+
+# Substrings nodes use when another transaction already took the nonce
+_NONCE_ERRORS = (
+    "nonce too low",
+    "nonce is too low",
+    "replacement transaction underpriced",
+)
+
+# Substrings nodes use when they already hold this exact signed transaction
+_KNOWN_TX_ERRORS = (
+    "already known",
+    "known transaction",
+)
+
+
+def is_nonce_error(exc: BaseException) -> bool:
+    """True if an RPC error means a different transaction already used the nonce."""
+    message = str(exc).lower()
+    return any(marker in message for marker in _NONCE_ERRORS)
+
+
+def is_known_transaction_error(exc: BaseException) -> bool:
+    """
+    True if an RPC error means the node already has this exact transaction,
+    e.g. after a resend whose first attempt reached the node. The send
+    succeeded; re-signing with a new nonce would broadcast a duplicate.
+    """
+    message = str(exc).lower()
+    return any(marker in message for marker in _KNOWN_TX_ERRORS)
+
+
+class NonceManager:
+    """
+    Thread-safe local nonce allocator for one sender address.
+
+    Only the first reservation hits the node (`pending` transaction count);
+    after that nonces are handed out sequentially, so many transactions can
+    be submitted back to back without a round trip each. Nonces released
+    after a failed send are reused lowest-first so no gap is left behind.
+    """
+
+    def __init__(self, w3: Web3, address: str):
+        self.w3 = w3
+        self.address = address
+        self._next: Optional[int] = None
+        self._released: List[int] = []
+        self._outstanding: Set[int] = set()
+        self._lock = threading.Lock()
+
+    def _chain_nonce(self) -> int:
+        return self.w3.eth.get_transaction_count(self.address, "pending")
+
+    def _allocate(self) -> int:
+        """Hands out the next nonce. Caller holds the lock and has synced once."""
+        if self._released:
+            nonce = heapq.heappop(self._released)
+        else:
+            nonce = self._next
+            self._next += 1
+        self._outstanding.add(nonce)
+        return nonce
+
+    def reserve(self) -> int:
+        """Reserves and returns the next nonce to use."""
+        with self._lock:
+            if self._next is None and not self._released:
+                self._next = self._chain_nonce()
+            return self._allocate()
+
+    def is_outstanding(self, nonce: int) -> bool:
+        """True if the nonce was reserved here and not yet committed or released."""
+        with self._lock:
+            return nonce in self._outstanding
+
+    def commit(self, nonce: int):
+        """Marks a reserved nonce as used by a broadcast transaction."""
+        with self._lock:
+            self._outstanding.discard(nonce)
+
+    def release(self, nonce: int):
+        """Returns a reserved nonce whose transaction was never broadcast, so it is reused."""
+        with self._lock:
+            if nonce in self._outstanding:
+                self._outstanding.discard(nonce)
+                heapq.heappush(self._released, nonce)
+
+    def resync(self) -> int:
+        """
+        Re-reads the node's pending count after a nonce conflict.
+
+        The local counter only moves forward, so nonces already handed out
+        are never reissued; released nonces the chain has since consumed are
+        dropped. Returns the next nonce that will be reserved.
+        """
+        return self._apply_chain_nonce(self._chain_nonce())
+
+    def _apply_chain_nonce(self, chain_nonce: int) -> int:
+        with self._lock:
+            self._next = max(self._next or 0, chain_nonce)
+            self._released = [n for n in self._released if n >= chain_nonce]
+            heapq.heapify(self._released)
+            return self._released[0] if self._released else self._next
+
+    def reset(self):
+        """Forgets all local state; the next reservation re-reads the node."""
+        with self._lock:
+            self._next = None
+            self._released = []
+            self._outstanding.clear()
+
+
+class AsyncNonceManager(NonceManager):
+    """
+    NonceManager for AsyncWeb3. Reservations are coroutines; only the
+    initial sync and resync await the node.
+    """
+
+    def __init__(self, w3: AsyncWeb3, address: str):
+        super().__init__(w3, address)
+        self._sync_lock = asyncio.Lock()
+
+    async def _chain_nonce(self) -> int:
+        return await self.w3.eth.get_transaction_count(self.address, "pending")
+
+    async def reserve(self) -> int:
+        """Reserves and returns the next nonce to use."""
+        if self._next is None:
+            async with self._sync_lock:
+                if self._next is None:
+                    chain_nonce = await self._chain_nonce()
+                    with self._lock:
+                        if self._next is None:
+                            self._next = chain_nonce
+        with self._lock:
+            return self._allocate()
+
+    async def resync(self) -> int:
+        """Async variant of NonceManager.resync."""
+        return self._apply_chain_nonce(await self._chain_nonce())
+
+
+def get_nonce_manager(w3: Web3, address: str) -> NonceManager:
+    """
+    Returns the shared NonceManager for an address on a provider, creating it
+    on first use. Every Deployer for the same key and provider shares it.
+    """
+    return shared(w3, ("nonce_manager", address), lambda: NonceManager(w3, address))
+
+
+def get_async_nonce_manager(w3: AsyncWeb3, address: str) -> AsyncNonceManager:
+    """
+    Async counterpart of get_nonce_manager, shared by AsyncDeployers per
+    provider and event loop (its lock belongs to one loop). Must be called
+    from a coroutine; a manager for a new loop starts from the node's
+    pending count.
+    """
+    return shared_in_loop(w3, ("nonce_manager", address), lambda: AsyncNonceManager(w3, address))
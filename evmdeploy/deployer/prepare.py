@@ -0,0 +1,173 @@
+import threading
+import weakref
+from typing import Any, Callable, Dict, List, Tuple
+
+from web3 import AsyncWeb3, Web3
+from web3.exceptions import MethodUnavailable, Web3TypeError
+
+from evmdeploy.deployer.gas import FeeOracle, get_async_fee_oracle, get_fee_oracle
+from evmdeploy.tracing import span
+
+# Per-provider facts that never change for a connection: chain id and
+# whether the provider accepts JSON-RPC batches.
+_provider_info: "weakref.WeakKeyDictionary[object, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+_provider_info_lock = threading.Lock()
+
+
+def _info(w3) -> Dict[str, Any]:
+    with _provider_info_lock:
+        return _provider_info.setdefault(w3.provider, {"chain_id": None, "batching": True})
+
+
+def get_chain_id(w3: Web3) -> int:
+    """Returns the provider's chain id, fetched once and cached."""
+    info = _info(w3)
+    if info["chain_id"] is None:
+        info["chain_id"] = w3.eth.chain_id
+    return info["chain_id"]
+
+
+async def get_chain_id_async(w3: AsyncWeb3) -> int:
+    """Async variant of get_chain_id."""
+    info = _info(w3)
+    if info["chain_id"] is None:
+        info["chain_id"] = await w3.eth.chain_id
+    return info["chain_id"]
+
+
+def _estimate_params(tx: Dict[str, Any]) -> Dict[str, Any]:
+    # Pipelined nonces are ahead of the chain and some nodes reject them
+    # during estimation, so the nonce is left out. So is chainId: web3's
+    # validation middleware checks it against its own eth_chainId lookup,
+    # which cannot complete inside a batch.
+    return {k: v for k, v in tx.items() if k not in ("nonce", "chainId")}
+
+
+def _plan(w3, tx: Dict[str, Any], oracle: FeeOracle) -> List[Tuple[str, Callable[[], Any]]]:
+    """The RPCs still needed to complete `tx`, as (field, request) pairs."""
+    info = _info(w3)
+    if "chainId" not in tx and info["chain_id"] is not None:
+        tx["chainId"] = info["chain_id"]
+    if not any(k in tx for k in ["gasPrice", "maxFeePerGas"]):
+        tx.update(oracle.cached() or {})
+
+    calls: List[Tuple[str, Callable[[], Any]]] = []
+    if "chainId" not in tx:
+        calls.append(("chainId", lambda: w3.eth.chain_id))
+    if "gas" not in tx:
+        calls.append(("gas", lambda: w3.eth.estimate_gas(_estimate_params(tx))))
+    if not any(k in tx for k in ["gasPrice", "maxFeePerGas"]):
+        if oracle.block_number is not None:
+            # Reuse the estimate if the head has not moved; fees() refreshes otherwise
+            calls.append(("head", lambda: w3.eth.block_number))
+        elif oracle.eip1559 is False:
+            calls.append(("gasPrice", lambda: w3.eth.gas_price))
+        else:
+            calls.append(("fees", oracle.fee_history_request))
+    return calls
+
+
+_RPC_METHODS = {
+    "chainId": "eth_chainId",
+    "gas": "eth_estimateGas",
+    "fees": "eth_feeHistory",
+    "gasPrice": "eth_gasPrice",
+    "head": "eth_blockNumber",
+}
+
+
+def _apply(w3, tx: Dict[str, Any], oracle: FeeOracle, field: str, value: Any):
+    if field == "chainId":
+        _info(w3)["chain_id"] = value
+        tx["chainId"] = value
+    elif field == "fees":
+        # Empty if the chain turned out to be legacy; filled in below then
+        tx.update(oracle.update(value))
+    elif field == "gasPrice":
+        tx.update(oracle.update_gas_price(value))
+    elif field == "head":
+        tx.update(oracle.reuse(value) or {})
+    else:
+        tx[field] = value
+
+
+def prepare_transaction(w3: Web3, tx: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fills in chainId, gas and fee fields that `tx` is missing, in place.
+
+    The chain id is cached per provider and fees come from the provider's
+    FeeOracle while its estimate is fresh. The remaining lookups
+    (eth_estimateGas plus eth_feeHistory, eth_gasPrice or the eth_blockNumber
+    check that revalidates cached fees) are sent as one
+    JSON-RPC batch when the provider supports it, so preparation costs a
+    single round trip. If the head has moved, the head read in the batch is
+    passed on to the oracle, so only eth_feeHistory follows. Fields the
+    batch could not fill (non-EIP-1559 chain) are fetched with one call per
+    field, as is everything on providers that reject batches. Errors from
+    the batched calls themselves, such as a revert during estimation,
+    propagate.
+    """
+    info = _info(w3)
+    oracle = get_fee_oracle(w3)
+    calls = _plan(w3, tx, oracle)
+    head = None
+
+    if calls and info["batching"]:
+        try:
+            with span("deploy.batch", methods=[_RPC_METHODS[field] for field, _ in calls]):
+                with w3.batch_requests() as batch:
+                    for _, request in calls:
+                        batch.add(request())
+                    results = batch.execute()
+        except (Web3TypeError, MethodUnavailable):
+            # The provider does not take batches
+            info["batching"] = False
+        else:
+            filled = dict(zip((field for field, _ in calls), results))
+            for field, value in filled.items():
+                _apply(w3, tx, oracle, field, value)
+            head = filled.get("head")
+
+    if "chainId" not in tx:
+        tx["chainId"] = get_chain_id(w3)
+    if "gas" not in tx:
+        with span("deploy.estimate_gas", method="eth_estimateGas"):
+            tx["gas"] = w3.eth.estimate_gas(_estimate_params(tx))
+    if not any(k in tx for k in ["gasPrice", "maxFeePerGas"]):
+        with span("deploy.fees", method="eth_feeHistory" if oracle.eip1559 is not False else "eth_gasPrice"):
+            tx.update(oracle.fees(head=head))
+    return tx
+
+
+async def prepare_transaction_async(w3: AsyncWeb3, tx: Dict[str, Any]) -> Dict[str, Any]:
+    """Async variant of prepare_transaction for AsyncWeb3."""
+    info = _info(w3)
+    oracle = get_async_fee_oracle(w3)
+    calls = _plan(w3, tx, oracle)
+    head = None
+
+    if calls and info["batching"]:
+        try:
+            with span("deploy.batch", methods=[_RPC_METHODS[field] for field, _ in calls]):
+                async with w3.batch_requests() as batch:
+                    for _, request in calls:
+                        batch.add(request())
+                    results = await batch.async_execute()
+        except (Web3TypeError, MethodUnavailable):
+            # The provider does not take batches
+            info["batching"] = False
+        else:
+            filled = dict(zip((field for field, _ in calls), results))
+            for field, value in filled.items():
+                _apply(w3, tx, oracle, field, value)
+            head = filled.get("head")
+
+    if "chainId" not in tx:
+        tx["chainId"] = await get_chain_id_async(w3)
+    if "gas" not in tx:
+        with span("deploy.estimate_gas", method="eth_estimateGas"):
+            tx["gas"] = await w3.eth.estimate_gas(_estimate_params(tx))
+    if not any(k in tx for k in ["gasPrice", "maxFeePerGas"]):
+        with span("deploy.fees", method="eth_feeHistory" if oracle.eip1559 is not False else "eth_gasPrice"):
+            tx.update(await oracle.fees(head=head))
+    return tx
@@ -0,0 +1,63 @@
+"""
+Objects shared by every deployer on one provider: nonce managers, fee
+oracles and receipt trackers.
+
+They are stored on the provider object itself, not in a module-level map
+keyed by provider. Each shared object holds its Web3, and the Web3 holds the
+provider, so a global map would keep every provider it ever saw alive
+through its own values. Attached to the provider, they form an ordinary
+reference cycle that the garbage collector frees together with it.
+
+Async objects own event-loop-bound primitives (locks, futures, polling
+tasks), so they are shared per running loop. State for a loop is dropped
+once that loop is closed.
+"""
+import asyncio
+import threading
+from typing import Any, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+_ATTRIBUTE = "_evmdeploy_shared"
+_lock = threading.Lock()
+
+
+def _state(provider: Any) -> Dict[Hashable, Any]:
+    try:
+        namespace = vars(provider)
+    except TypeError:
+        # No instance dict (__slots__): nothing can be shared
+        return {}
+    state = namespace.get(_ATTRIBUTE)
+    if state is None:
+        state = namespace[_ATTRIBUTE] = {}
+    return state
+
+
+def shared(w3: Any, key: Hashable, factory: Callable[[], T]) -> T:
+    """
+    Returns the object stored under `key` for w3's provider, creating it with
+    `factory()` on first use.
+    """
+    with _lock:
+        state = _state(w3.provider)
+        value = state.get(key)
+        if value is None:
+            value = state[key] = factory()
+        return value
+
+
+def shared_in_loop(w3: Any, key: Hashable, factory: Callable[[], T]) -> T:
+    """
+    Like shared(), but per running event loop. Must be called from a coroutine.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        loops: Dict[asyncio.AbstractEventLoop, Dict[Hashable, Any]] = _state(w3.provider).setdefault("loops", {})
+        for closed in [other for other in loops if other.is_closed()]:
+            del loops[closed]
+        state = loops.setdefault(loop, {})
+        value = state.get(key)
+        if value is None:
+            value = state[key] = factory()
+        return value
@@ -0,0 +1,495 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, Web3
+from web3.exceptions import TransactionIndexingInProgress, TransactionNotFound
+from web3.providers.persistent import PersistentConnectionProvider
+
+from evmdeploy.deployer.provider_state import shared, shared_in_loop
+from evmdeploy.exceptions import DeploymentError
+
+logger = logging.getLogger(__name__)
+
+_GET_RECEIPT = "eth_getTransactionReceipt"
+
+# Blocks looked back over when measuring the block time
+_BLOCK_TIME_SAMPLE = 20
+
+# Upper bound on the delay between polls: web3's wait_for_transaction_receipt
+# polled every second, and tracking must never be slower than that
+_MAX_INTERVAL = 1.0
+
+
+def _normalize_hash(tx_hash) -> str:
+    return "0x" + bytes(HexBytes(tx_hash)).hex()
+
+
+def _block_time_from(latest: Dict[str, Any], past: Dict[str, Any]) -> Optional[float]:
+    blocks = latest["number"] - past["number"]
+    if blocks <= 0 or latest["timestamp"] <= past["timestamp"]:
+        return None
+    return (latest["timestamp"] - past["timestamp"]) / blocks
+
+
+def _resolve(future: Future, tx_hash: str, receipt: Dict[str, Any]):
+    if future.done():
+        return
+    if receipt["status"] == 0:
+        future.set_exception(DeploymentError(f"Transaction failed: {tx_hash}", tx_hash=tx_hash))
+    else:
+        future.set_result(dict(receipt))
+
+
+def _expire(future: Future, tx_hash: str):
+    if not future.done():
+        future.set_exception(DeploymentError(f"Timed out waiting for receipt: {tx_hash}", tx_hash=tx_hash))
+
+
+class _Backoff:
+    """
+    Poll scheduling derived from the chain's block time.
+
+    After a block is seen the next check is due one block time later. If
+    that block is late, polling starts at an eighth of the block time and
+    doubles up to one block time. While the block time is unknown (a young
+    chain) every wait takes that doubling path. Delays always stay within
+    [min_interval, max_interval]. The estimate is refined from the blocks
+    actually observed: a shorter interval is adopted at once and a longer
+    one is averaged in, so a bad first guess costs at most one poll.
+    """
+
+    def __init__(self, block_time: Optional[float], min_interval: float, max_interval: float = _MAX_INTERVAL):
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.known = block_time is not None
+        self.block_time = min(block_time or self.max_interval, self.max_interval)
+        self._last_block: Optional[int] = None
+        self._last_seen = 0.0
+        self._misses = 0
+
+    def on_block(self, number: int, now: float):
+        if self._last_block is not None and number > self._last_block:
+            observed = (now - self._last_seen) / (number - self._last_block)
+            if not self.known or observed < self.block_time:
+                self.known = True
+                self.block_time = min(self.max_interval, observed)
+            else:
+                self.block_time = min(self.max_interval, 0.8 * self.block_time + 0.2 * observed)
+        self._last_block = number
+        self._last_seen = now
+        self._misses = 0
+
+    def next_delay(self, now: float) -> float:
+        if self._last_block is None:
+            return self.min_interval
+        due = self._last_seen + self.block_time - now
+        if self.known and due > 0:
+            return min(self.max_interval, max(self.min_interval, due))
+        delay = self.block_time / 8 * 2 ** self._misses
+        self._misses += 1
+        return max(self.min_interval, min(self.block_time, delay))
+
+
+class ReceiptTracker:
+    """
+    Waits for many transaction receipts with one shared polling loop.
+
+    A background thread watches the block number and, once per new block,
+    asks for every outstanding receipt in a single JSON-RPC batch (one call
+    per hash on providers without batch support). Each tracked hash gets a
+    Future that resolves to the receipt, or fails with DeploymentError if
+    the transaction reverted or timed out. The thread exits when nothing is
+    left to track.
+    """
+
+    def __init__(
+        self,
+        w3: Web3,
+        timeout: float = 120,
+        block_time: Optional[float] = None,
+        min_interval: float = 0.05,
+        max_interval: float = _MAX_INTERVAL,
+    ):
+        """
+        Args:
+            w3: Connected Web3 instance.
+            timeout: Default seconds to wait for each receipt.
+            block_time: Expected seconds between blocks; measured from the
+                        chain on first use if not given.
+            min_interval: Lower bound on the delay between polls.
+            max_interval: Upper bound on the delay between polls.
+        """
+        self.w3 = w3
+        self.timeout = timeout
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._block_time = block_time
+        self._backoff: Optional[_Backoff] = None
+        self._batching = True
+        self._pending: Dict[str, Future] = {}
+        self._deadlines: Dict[str, float] = {}
+        self._fresh = False
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def track(
+        self,
+        tx_hash,
+        callback: Optional[Callable[[Future], Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """
+        Starts tracking a transaction and returns a Future for its receipt.
+
+        Args:
+            tx_hash: Transaction hash (hex string or bytes).
+            callback: Called with the Future once it resolves.
+            timeout: Seconds to wait for this receipt; defaults to the tracker's.
+                     Tracking a pending hash again keeps the later deadline.
+        """
+        tx_hash = _normalize_hash(tx_hash)
+        with self._cond:
+            future = self._pending.get(tx_hash)
+            if future is None:
+                future = self._pending[tx_hash] = Future()
+            # A caller re-tracking a pending hash may extend its wait, never shorten it
+            deadline = time.monotonic() + (timeout or self.timeout)
+            self._deadlines[tx_hash] = max(deadline, self._deadlines.get(tx_hash, deadline))
+            # Newly tracked hashes may already be mined; check without waiting for a block
+            self._fresh = True
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="evmdeploy-receipts", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        if callback is not None:
+            future.add_done_callback(callback)
+        return future
+
+    def wait(self, tx_hashes: Iterable, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Tracks several hashes and blocks until all receipts are in, in order."""
+        futures = [self.track(h, timeout=timeout) for h in tx_hashes]
+        return [f.result() for f in futures]
+
+    def _measure_block_time(self) -> Optional[float]:
+        """Average block time over recent blocks, or None if the chain is too young to tell."""
+        try:
+            latest = self.w3.eth.get_block("latest")
+            past = self.w3.eth.get_block(max(0, latest["number"] - _BLOCK_TIME_SAMPLE))
+            return _block_time_from(latest, past)
+        except Exception:
+            return None
+
+    def _run(self):
+        if self._backoff is None:
+            self._backoff = _Backoff(self._block_time or self._measure_block_time(), self.min_interval, self.max_interval)
+        backoff = self._backoff
+        last_block: Optional[int] = None
+
+        while True:
+            with self._cond:
+                if not self._pending:
+                    self._thread = None
+                    return
+                fresh, self._fresh = self._fresh, False
+                hashes = list(self._pending)
+
+            now = time.monotonic()
+            try:
+                block = self.w3.eth.block_number
+            except Exception as e:
+                logger.warning("Receipt tracker could not read the block number: %s", e)
+                block = last_block
+
+            if block is not None and block != last_block:
+                backoff.on_block(block, now)
+                last_block = block
+                fresh = True
+
+            receipts = {}
+            if fresh:
+                try:
+                    receipts = self._fetch(hashes)
+                except Exception as e:
+                    logger.warning("Receipt tracker poll failed: %s", e)
+            self._settle(receipts, time.monotonic())
+
+            with self._cond:
+                if self._pending and not self._fresh:
+                    self._cond.wait(backoff.next_delay(time.monotonic()))
+
+    def _settle(self, receipts: Dict[str, Dict[str, Any]], now: float):
+        with self._cond:
+            for tx_hash in list(self._pending):
+                receipt = receipts.get(tx_hash)
+                if receipt is None and self._deadlines[tx_hash] > now:
+                    continue
+                future = self._pending.pop(tx_hash)
+                del self._deadlines[tx_hash]
+                if receipt is not None:
+                    _resolve(future, tx_hash, receipt)
+                else:
+                    _expire(future, tx_hash)
+
+    def _fetch(self, hashes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Receipts for the mined subset of `hashes`."""
+        if self._batching and len(hashes) > 1:
+            try:
+                responses = self.w3.provider.make_batch_request([(_GET_RECEIPT, [h]) for h in hashes])
+            except (AttributeError, NotImplementedError):
+                self._batching = False
+            else:
+                if isinstance(responses, list):
+                    # Raw results only tell which are mined; pending ones are
+                    # null, which web3's formatters would turn into errors
+                    mined = [h for h, r in zip(hashes, responses) if r.get("result")]
+                    return self._get_receipts(mined)
+                logger.debug("Batch receipt request rejected: %s", responses)
+
+        receipts = {}
+        for tx_hash in hashes:
+            try:
+                receipts[tx_hash] = self.w3.eth.get_transaction_receipt(tx_hash)
+            except (TransactionNotFound, TransactionIndexingInProgress):
+                pass
+        return receipts
+
+    def _get_receipts(self, mined: List[str]) -> Dict[str, Dict[str, Any]]:
+        if len(mined) == 1:
+            return {mined[0]: self.w3.eth.get_transaction_receipt(mined[0])}
+        if not mined:
+            return {}
+        with self.w3.batch_requests() as batch:
+            for tx_hash in mined:
+                batch.add(self.w3.eth.get_transaction_receipt(tx_hash))
+            return dict(zip(mined, batch.execute()))
+
+
+class AsyncReceiptTracker:
+    """
+    asyncio counterpart of ReceiptTracker for AsyncWeb3.
+
+    On persistent connections (websockets, IPC) new blocks arrive through a
+    `newHeads` subscription instead of polling; the adaptive poll delay then
+    only serves as a fallback if a head notification is missed. The
+    tracker consumes the connection's subscription stream while it runs.
+    """
+
+    def __init__(
+        self,
+        w3: AsyncWeb3,
+        timeout: float = 120,
+        block_time: Optional[float] = None,
+        min_interval: float = 0.05,
+        max_interval: float = _MAX_INTERVAL,
+    ):
+        """
+        Args:
+            w3: Connected AsyncWeb3 instance.
+            timeout: Default seconds to wait for each receipt.
+            block_time: Expected seconds between blocks; measured from the
+                        chain on first use if not given.
+            min_interval: Lower bound on the delay between polls.
+            max_interval: Upper bound on the delay between polls.
+        """
+        self.w3 = w3
+        self.timeout = timeout
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._block_time = block_time
+        self._backoff: Optional[_Backoff] = None
+        self._batching = True
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._deadlines: Dict[str, float] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._head_read: Optional[asyncio.Future] = None
+
+    def track(
+        self,
+        tx_hash,
+        callback: Optional[Callable[[asyncio.Future], Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> asyncio.Future:
+        """
+        Starts tracking a transaction and returns an asyncio Future for its receipt.
+
+        Must be called from the event loop the tracker runs on.
+        """
+        tx_hash = _normalize_hash(tx_hash)
+        loop = asyncio.get_running_loop()
+        future = self._pending.get(tx_hash)
+        if future is None:
+            future = self._pending[tx_hash] = loop.create_future()
+        deadline = time.monotonic() + (timeout or self.timeout)
+        self._deadlines[tx_hash] = max(deadline, self._deadlines.get(tx_hash, deadline))
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+        if callback is not None:
+            future.add_done_callback(callback)
+        return future
+
+    async def wait(self, tx_hashes: Iterable, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Tracks several hashes and waits until all receipts are in, in order."""
+        futures = [self.track(h, timeout=timeout) for h in tx_hashes]
+        return list(await asyncio.gather(*futures))
+
+    async def _measure_block_time(self) -> Optional[float]:
+        """Average block time over recent blocks, or None if the chain is too young to tell."""
+        try:
+            latest = await self.w3.eth.get_block("latest")
+            past = await self.w3.eth.get_block(max(0, latest["number"] - _BLOCK_TIME_SAMPLE))
+            return _block_time_from(latest, past)
+        except Exception:
+            return None
+
+    async def _run(self):
+        if self._backoff is None:
+            self._backoff = _Backoff(self._block_time or await self._measure_block_time(), self.min_interval, self.max_interval)
+
+        heads = None
+        if isinstance(self.w3.provider, PersistentConnectionProvider):
+            try:
+                subscription = await self.w3.eth.subscribe("newHeads")
+                heads = self._heads(subscription)
+            except Exception as e:
+                logger.warning("newHeads subscription failed, polling instead: %s", e)
+
+        try:
+            await self._loop(heads)
+        finally:
+            if self._head_read is not None:
+                self._head_read.cancel()
+                self._head_read = None
+            if heads is not None:
+                await heads.aclose()
+                try:
+                    await self.w3.eth.unsubscribe(subscription)
+                except Exception:
+                    pass
+
+    async def _heads(self, subscription):
+        async for message in self.w3.socket.process_subscriptions():
+            if message.get("subscription") == subscription:
+                yield message["result"]
+
+    async def _next_head(self, heads, delay: float) -> Optional[int]:
+        """Block number from the next head notification, or None after `delay`."""
+        # The pending read is kept across calls; cancelling it would close the stream
+        if self._head_read is None:
+            self._head_read = asyncio.ensure_future(heads.__anext__())
+        wakeup = asyncio.ensure_future(self._wakeup.wait())
+        await asyncio.wait({wakeup, self._head_read}, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+        wakeup.cancel()
+        if not self._head_read.done():
+            return None
+        head, self._head_read = self._head_read, None
+        return int(head.result()["number"])
+
+    async def _loop(self, heads):
+        backoff = self._backoff
+        last_block: Optional[int] = None
+        block: Optional[int] = None
+
+        while self._pending:
+            fresh = self._wakeup.is_set()
+            self._wakeup.clear()
+            hashes = list(self._pending)
+
+            if heads is None or block is None:
+                try:
+                    block = await self.w3.eth.block_number
+                except Exception as e:
+                    logger.warning("Receipt tracker could not read the block number: %s", e)
+                    block = last_block
+
+            if block is not None and block != last_block:
+                backoff.on_block(block, time.monotonic())
+                last_block = block
+                fresh = True
+
+            receipts = {}
+            if fresh:
+                try:
+                    receipts = await self._fetch(hashes)
+                except Exception as e:
+                    logger.warning("Receipt tracker poll failed: %s", e)
+            self._settle(receipts, time.monotonic())
+
+            if not self._pending or self._wakeup.is_set():
+                continue
+            delay = backoff.next_delay(time.monotonic())
+            if heads is not None:
+                # None here means timeout or wakeup; poll the block number then
+                block = await self._next_head(heads, delay)
+            else:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+
+    def _settle(self, receipts: Dict[str, Dict[str, Any]], now: float):
+        for tx_hash in list(self._pending):
+            receipt = receipts.get(tx_hash)
+            if receipt is None and self._deadlines[tx_hash] > now:
+                continue
+            future = self._pending.pop(tx_hash)
+            del self._deadlines[tx_hash]
+            if receipt is not None:
+                _resolve(future, tx_hash, receipt)
+            else:
+                _expire(future, tx_hash)
+
+    async def _fetch(self, hashes: List[str]) -> Dict[str, Dict[str, Any]]:
+        if self._batching and len(hashes) > 1:
+            try:
+                responses = await self.w3.provider.make_batch_request([(_GET_RECEIPT, [h]) for h in hashes])
+            except (AttributeError, NotImplementedError):
+                self._batching = False
+            else:
+                if isinstance(responses, list):
+                    mined = [h for h, r in zip(hashes, responses) if r.get("result")]
+                    return await self._get_receipts(mined)
+                logger.debug("Batch receipt request rejected: %s", responses)
+
+        receipts = {}
+        for tx_hash in hashes:
+            try:
+                receipts[tx_hash] = await self.w3.eth.get_transaction_receipt(tx_hash)
+            except (TransactionNotFound, TransactionIndexingInProgress):
+                pass
+        return receipts
+
+    async def _get_receipts(self, mined: List[str]) -> Dict[str, Dict[str, Any]]:
+        if len(mined) == 1:
+            return {mined[0]: await self.w3.eth.get_transaction_receipt(mined[0])}
+        if not mined:
+            return {}
+        async with self.w3.batch_requests() as batch:
+            for tx_hash in mined:
+                batch.add(self.w3.eth.get_transaction_receipt(tx_hash))
+            return dict(zip(mined, await batch.async_execute()))
+
+
+def get_receipt_tracker(w3: Web3) -> ReceiptTracker:
+    """
+    Returns the ReceiptTracker shared by everything waiting on this provider,
+    so concurrent waits share one polling loop.
+    """
+    return shared(w3, "receipt_tracker", lambda: ReceiptTracker(w3))
+
+
+def get_async_receipt_tracker(w3: AsyncWeb3) -> AsyncReceiptTracker:
+    """
+    Async counterpart of get_receipt_tracker, shared per provider and event
+    loop (its futures and polling task belong to one loop). Must be called
+    from a coroutine.
+    """
+    return shared_in_loop(w3, "receipt_tracker", lambda: AsyncReceiptTracker(w3))
@@ -0,0 +1,282 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+from eth_utils import to_checksum_address
+
+from evmdeploy.utils.create2 import DETERMINISTIC_DEPLOYER, _hex_bytes
+from evmdeploy.utils.hashing import compute_keccak256
+
+if TYPE_CHECKING:
+    from evmdeploy.contract import Contract
+
+try:
+    # safe-pysha3 hashes short inputs several times faster than eth-hash's backends
+    from sha3 import keccak_256 as _keccak_256
+
+    def _keccak(data: bytearray) -> bytes:
+        return _keccak_256(data).digest()
+except ImportError:
+    from eth_hash.auto import keccak as _keccak
+
+
+@dataclass(frozen=True)
+class SaltMatch:
+    """A salt whose CREATE2 address satisfies the miner's target."""
+    salt: int
+    salt_bytes: bytes
+    address: str
+
+
+@dataclass(frozen=True)
+class MiningProgress:
+    """
+    Snapshot passed to the progress callback.
+
+    `next_start` is the lowest salt not yet fully searched; passing it as
+    `start` to mine() resumes without re-checking anything.
+    """
+    checked: int
+    next_start: int
+    elapsed: float
+    hashes_per_sec: float
+
+
+def _search_range(
+    head: bytes,
+    tail: bytes,
+    counter_len: int,
+    target: bytes,
+    nibble: Optional[int],
+    start: int,
+    end: int,
+) -> Optional[int]:
+    """
+    Hot loop: returns the first salt in [start, end) matching the target.
+
+    The 0xff ++ factory ++ salt prefix ++ counter ++ keccak(init_code)
+    preimage lives in one buffer; only the counter bytes change per hash.
+    """
+    buf = bytearray(head + bytes(counter_len) + tail)
+    lo = len(head)
+    hi = lo + counter_len
+    # Address bytes start at digest offset 12
+    t_lo = 12
+    t_hi = 12 + len(target)
+    keccak = _keccak
+    to_bytes = int.to_bytes
+
+    for salt in range(start, end):
+        buf[lo:hi] = to_bytes(salt, counter_len, "big")
+        digest = keccak(buf)
+        if digest[t_lo:t_hi] == target and (nibble is None or digest[t_hi] >> 4 == nibble):
+            return salt
+    return None
+
+
+class SaltMiner:
+    """
+    Searches CREATE2 salts for vanity addresses across a process pool.
+
+    Salts are `salt_prefix` followed by a big-endian counter. Workers scan
+    disjoint counter ranges in chunks. The init-code hash and the fixed
+    preimage bytes are computed once; each candidate costs a single keccak.
+
+    Example:
+        miner = SaltMiner(contract, constructor_args=[owner], leading_zero_bytes=2)
+        match = miner.mine(progress=print)
+        contract.deploy_create2(w3, key, match.salt_bytes, constructor_args=[owner])
+    """
+
+    def __init__(
+        self,
+        init_code: Union[str, bytes, "Contract"],
+        factory: str = DETERMINISTIC_DEPLOYER,
+        leading_zero_bytes: int = 0,
+        prefix: str = "",
+        constructor_args: Optional[List[Any]] = None,
+        constructor_kwargs: Optional[Dict[str, Any]] = None,
+        salt_prefix: bytes = b"",
+    ):
+        """
+        Args:
+            init_code: Init code as hex/bytes, or a Contract (combined with
+                       the constructor args below).
+            factory: CREATE2 factory address.
+            leading_zero_bytes: Required number of leading zero bytes.
+            prefix: Hex digits the address must start with after the zero
+                    bytes (case-insensitive, odd lengths allowed).
+            constructor_args: Constructor args when init_code is a Contract.
+            constructor_kwargs: Constructor kwargs when init_code is a Contract.
+            salt_prefix: Fixed leading salt bytes (e.g. the sender address
+                         for factories that check it); at most 24 bytes.
+        """
+        if hasattr(init_code, "init_code"):
+            init_code = init_code.init_code(constructor_args, constructor_kwargs)
+        if len(salt_prefix) > 24:
+            raise ValueError("salt_prefix leaves too few bytes for the counter (max 24 bytes)")
+
+        pattern = "00" * leading_zero_bytes + prefix.lower().removeprefix("0x")
+        if len(pattern) > 40:
+            raise ValueError("Target pattern is longer than an address")
+        self.target = bytes.fromhex(pattern[: len(pattern) // 2 * 2])
+        self.nibble = int(pattern[-1], 16) if len(pattern) % 2 else None
+        self.pattern = pattern
+
+        self.factory = factory
+        self.salt_prefix = bytes(salt_prefix)
+        self.counter_len = 32 - len(self.salt_prefix)
+        self.code_hash = _hex_bytes(compute_keccak256(_hex_bytes(init_code)))
+        self._head = b"\xff" + _hex_bytes(factory) + self.salt_prefix
+
+    @property
+    def expected_attempts(self) -> int:
+        """Average number of salts to try before a match (16 per hex digit)."""
+        return 16 ** len(self.pattern)
+
+    def salt_bytes(self, salt: int) -> bytes:
+        """The 32-byte salt for a counter value."""
+        return self.salt_prefix + salt.to_bytes(self.counter_len, "big")
+
+    def address(self, salt: int) -> str:
+        """CREATE2 address for a counter value."""
+        digest = compute_keccak256(self._head + salt.to_bytes(self.counter_len, "big") + self.code_hash)
+        return to_checksum_address("0x" + digest[-40:])
+
+    def _args(self, start: int, end: int) -> Tuple:
+        return (self._head, self.code_hash, self.counter_len, self.target, self.nibble, start, end)
+
+    def _match(self, salt: int) -> SaltMatch:
+        return SaltMatch(salt=salt, salt_bytes=self.salt_bytes(salt), address=self.address(salt))
+
+    def mine(
+        self,
+        start: int = 0,
+        max_salts: Optional[int] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = 1 << 16,
+        progress: Optional[Callable[[MiningProgress], Any]] = None,
+        progress_interval: float = 1.0,
+    ) -> Optional[SaltMatch]:
+        """
+        Searches salts from `start` upward and returns the lowest matching
+        salt, or None if `max_salts` were checked without one. The result
+        does not depend on the number of workers.
+
+        Args:
+            start: First counter value; use MiningProgress.next_start to resume.
+            max_salts: Upper bound on salts to check (default: whole counter space).
+            workers: Worker processes (default: CPU count). 1 searches in-process.
+            chunk_size: Salts per task handed to a worker.
+            progress: Called with MiningProgress at most every `progress_interval` seconds.
+            progress_interval: Seconds between progress callbacks.
+        """
+        end = 1 << (8 * self.counter_len)
+        if max_salts is not None:
+            end = min(end, start + max_salts)
+        workers = workers or os.cpu_count() or 1
+        began = time.monotonic()
+        last_report = began
+
+        def report(next_start: int, final: bool = False):
+            nonlocal last_report
+            now = time.monotonic()
+            if progress is None or (not final and now - last_report < progress_interval):
+                return
+            last_report = now
+            elapsed = now - began
+            checked = next_start - start
+            progress(MiningProgress(checked, next_start, elapsed, checked / elapsed if elapsed else 0.0))
+
+        if workers == 1:
+            position = start
+            while position < end:
+                chunk_end = min(position + chunk_size, end)
+                found = _search_range(*self._args(position, chunk_end))
+                if found is not None:
+                    report(found + 1, final=True)
+                    return self._match(found)
+                position = chunk_end
+                report(position)
+            report(position, final=True)
+            return None
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending: Dict[Any, Tuple[int, int]] = {}
+            completed: Dict[int, int] = {}
+            next_chunk = start
+            watermark = start
+            found: Optional[int] = None
+
+            while True:
+                while found is None and next_chunk < end and len(pending) < workers * 2:
+                    chunk_end = min(next_chunk + chunk_size, end)
+                    pending[pool.submit(_search_range, *self._args(next_chunk, chunk_end))] = (next_chunk, chunk_end)
+                    next_chunk = chunk_end
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk_start, chunk_end = pending.pop(future)
+                    result = future.result()
+                    if result is not None and (found is None or result < found):
+                        found = result
+                    completed[chunk_start] = chunk_end
+                # Advance over the contiguous run of finished chunks
+                while watermark in completed:
+                    watermark = completed.pop(watermark)
+                if found is not None:
+                    # Chunks past the match cannot beat it; earlier ones still might
+                    for future, (chunk_start, _) in list(pending.items()):
+                        if chunk_start > found and future.cancel():
+                            del pending[future]
+                    if watermark > found:
+                        for future in pending:
+                            future.cancel()
+                        break
+                report(watermark)
+
+            report(watermark, final=True)
+            return self._match(found) if found is not None else None
+
+    def benchmark(self, seconds: float = 2.0, workers: Optional[int] = None) -> Dict[str, float]:
+        """
+        Measures search throughput.
+
+        Returns:
+            {"workers", "hashes", "seconds", "hashes_per_sec", "hashes_per_sec_per_core"}
+        """
+        workers = workers or os.cpu_count() or 1
+
+        def args(start: int, end: int) -> Tuple:
+            # A 21-byte target never matches, so every chunk is scanned in full
+            return self._args(start, end)[:3] + (b"\x00" * 21, None, start, end)
+
+        # Size chunks from a quick single-core sample so the run lasts about `seconds`
+        sample = 20_000
+        t0 = time.perf_counter()
+        _search_range(*args(0, sample))
+        per_core = sample / max(time.perf_counter() - t0, 1e-9)
+        chunk = max(1, int(per_core * seconds))
+
+        t0 = time.perf_counter()
+        if workers == 1:
+            _search_range(*args(0, chunk))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_search_range, *args(i * chunk, (i + 1) * chunk)) for i in range(workers)]
+                for future in futures:
+                    future.result()
+        elapsed = time.perf_counter() - t0
+
+        hashes = chunk * workers
+        return {
+            "workers": workers,
+            "hashes": hashes,
+            "seconds": elapsed,
+            "hashes_per_sec": hashes / elapsed,
+            "hashes_per_sec_per_core": hashes / elapsed / workers,
+        }
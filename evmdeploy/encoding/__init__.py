@@ -0,0 +1,3 @@
+from evmdeploy.encoding.constructor import ConstructorEncoder, encode_constructor_args
+
+__all__ = ["ConstructorEncoder", "encode_constructor_args"]
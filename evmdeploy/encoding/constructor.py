@@ -1,5 +1,111 @@
-from typing import Any, List, Dict
-from eth_abi.abi import encode
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+from eth_abi.registry import registry
+
+
+def _abi_type(param: Dict[str, Any]) -> str:
+    """Canonical type string for an ABI input; structs become `(t1,t2,...)`."""
+    abi_type = param["type"]
+    if abi_type.startswith("tuple"):
+        components = ",".join(_abi_type(c) for c in param.get("components", []))
+        return f"({components}){abi_type[5:]}"
+    return abi_type
+
+
+class ConstructorEncoder:
+    """
+    Constructor argument encoder compiled once per ABI.
+
+    The constructor entry, its type list, the name -> index map and the
+    eth_abi tuple encoder are resolved up front, so each encode() only
+    orders the values and runs the encoder.
+
+    Example:
+        encoder = ConstructorEncoder(abi)
+        data = encoder.encode("Token", "TOK")
+        rows = encoder.encode_many([["A", "A"], {"name": "B", "symbol": "B"}])
+    """
+
+    def __init__(self, abi: List[Dict[str, Any]]):
+        """
+        Args:
+            abi: The full contract ABI (list of dicts).
+        """
+        # Find the constructor entry (there should be only one)
+        constructor_abi = next((item for item in abi if item.get("type") == "constructor"), None)
+        self.has_constructor = constructor_abi is not None
+
+        inputs = constructor_abi.get("inputs", []) if constructor_abi else []
+        self.types = tuple(_abi_type(inp) for inp in inputs)
+        self.names = tuple(inp.get("name") or "" for inp in inputs)
+        self.name_index: Dict[str, int] = {name: i for i, name in enumerate(self.names) if name}
+        self._encoder = registry.get_tuple_encoder(*self.types) if self.types else None
+
+    def _values(self, args: Sequence[Any], kwargs: Mapping[str, Any]) -> Optional[Sequence[Any]]:
+        """Orders the arguments as constructor inputs; None means nothing to encode."""
+        if not self.types:
+            if args or kwargs:
+                if not self.has_constructor:
+                    raise ValueError("Constructor arguments provided but no constructor in ABI")
+                raise ValueError("Constructor takes no arguments but some were provided")
+            return None
+
+        # Positional args take precedence over keyword args
+        if args:
+            if len(args) != len(self.types):
+                raise ValueError(
+                    f"Wrong number of positional args: expected {len(self.types)}, got {len(args)}"
+                )
+            return args
+
+        if kwargs:
+            if len(kwargs) != len(self.name_index) or any(name not in self.name_index for name in kwargs):
+                raise ValueError("Keyword args keys do not match constructor parameter names")
+            if len(self.name_index) != len(self.types):
+                missing = next(i for i, name in enumerate(self.names) if not name)
+                raise ValueError(f"Missing required constructor arg: #{missing} (unnamed)")
+            values: List[Any] = [None] * len(self.types)
+            for name, value in kwargs.items():
+                values[self.name_index[name]] = value
+            return values
+
+        raise ValueError("Constructor requires arguments but none provided")
+
+    def encode(self, *args: Any, **kwargs: Any) -> bytes:
+        """
+        Encodes constructor arguments (positional or keyword).
+
+        Returns:
+            bytes: ABI-encoded constructor parameters (b'' if there are none)
+
+        Raises:
+            ValueError: If no constructor matches, wrong number of args, type mismatch, etc.
+        """
+        values = self._values(args, kwargs)
+        if values is None:
+            return b""
+        try:
+            return self._encoder(values)
+        except Exception as e:
+            raise ValueError(f"Failed to ABI-encode constructor args: {e}") from e
+
+    def encode_many(self, arg_rows: Iterable[Union[Sequence[Any], Mapping[str, Any]]]) -> List[bytes]:
+        """
+        Encodes many argument sets with the same compiled encoder.
+
+        Args:
+            arg_rows: Each row is a list/tuple of positional args or a dict
+                      of keyword args.
+
+        Returns:
+            Encoded args per row, in input order.
+        """
+        results = []
+        for row in arg_rows:
+            if isinstance(row, Mapping):
+                results.append(self.encode(**row))
+            else:
+                results.append(self.encode(*row))
+        return results
 
 
 def encode_constructor_args(
@@ -16,6 +122,9 @@ def encode_constructor_args(
     Usage for deployment:
         deployment_data = bytecode + encode_constructor_args(abi, arg1, arg2, ...)
 
+    For repeated encoding against the same ABI, build a ConstructorEncoder
+    once (Contract caches one) instead of calling this per instance.
+
     Args:
         abi: The full contract ABI (list of dicts) — usually from compilation output
         *args, **kwargs: Positional or keyword constructor arguments
@@ -27,58 +136,4 @@ def encode_constructor_args(
     Raises:
         ValueError: If constructor not found, wrong number of args, type mismatch, etc.
     """
-    # Find the constructor entry (there should be only one)
-    constructor_abi = None
-    for item in abi:
-        if item.get("type") == "constructor":
-            constructor_abi = item
-            break
-
-    if constructor_abi is None:
-        if args or kwargs:
-            raise ValueError("Constructor arguments provided but no constructor in ABI")
-        return b""  # no constructor → nothing to encode
-
-    inputs = constructor_abi.get("inputs", [])
-    if not inputs:
-        if args or kwargs:
-            raise ValueError("Constructor takes no arguments but some were provided")
-        return b""  # constructor() with no params
-
-    # Build the types list + values list
-    types: List[str] = []
-    values: List[Any] = []
-
-    # Handle positional args first
-    if args:
-        if len(args) != len(inputs):
-            raise ValueError(
-                f"Wrong number of positional args: expected {len(inputs)}, got {len(args)}"
-            )
-        for i, inp in enumerate(inputs):
-            types.append(inp["type"])
-            values.append(args[i])
-
-    # Handle keyword args (overrides positional if mixed — but positional usually preferred)
-    elif kwargs:
-        if set(kwargs) != {inp["name"] for inp in inputs if inp.get("name")}:
-            raise ValueError(
-                "Keyword args keys do not match constructor parameter names"
-            )
-        for inp in inputs:
-            name = inp["name"]
-            if name not in kwargs:
-                raise ValueError(f"Missing required constructor arg: {name}")
-            types.append(inp["type"])
-            values.append(kwargs[name])
-
-    else:
-        raise ValueError("Constructor requires arguments but none provided")
-
-    # Now encode
-    try:
-        encoded = encode(types, values)
-    except Exception as e:
-        raise ValueError(f"Failed to ABI-encode constructor args: {e}") from e
-
-    return encoded
+    return ConstructorEncoder(abi).encode(*args, **kwargs)
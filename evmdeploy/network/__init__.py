@@ -1,3 +1,25 @@
+import importlib
+from typing import Any
+
 from evmdeploy.network.evm import NetworkConfig, get_network, DEFAULT_NETWORKS
 
-__all__ = ["NetworkConfig", "get_network", "DEFAULT_NETWORKS"]
+__all__ = [
+    "NetworkConfig",
+    "get_network",
+    "DEFAULT_NETWORKS",
+    "SimulatedChain",
+    "SimulatedFaults",
+    "SimulatedProvider",
+    "SimulatedRPCServer",
+]
+
+# The simulator needs web3 and eth-account; import it only when used
+_SIMULATED = {"SimulatedChain", "SimulatedFaults", "SimulatedProvider", "SimulatedRPCServer"}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _SIMULATED:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module("evmdeploy.network.simulated"), name)
+    globals()[name] = value
+    return value
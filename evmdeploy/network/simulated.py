@@ -0,0 +1,600 @@
+import heapq
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import rlp
+from eth_account import Account
+from eth_utils import keccak, to_checksum_address
+from web3.providers.base import JSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from evmdeploy.utils.create2 import DETERMINISTIC_DEPLOYER, compute_create2_address
+
+# Runtime code of the deterministic deployment proxy, pre-installed so
+# CREATE2 deployments through DETERMINISTIC_DEPLOYER work out of the box
+_FACTORY_RUNTIME = bytes.fromhex(
+    "7fffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffe0"
+    "3601600081602082378035828234f58015156039578182fd5b8082525050506014600cf3"
+)
+
+_GWEI = 10**9
+
+
+@dataclass
+class SimulatedFaults:
+    """
+    Error injection rates (probabilities between 0 and 1).
+
+    nonce_too_low simulates another client of the same key winning the
+    race: the nonce is consumed on chain and the transaction is rejected.
+    underpriced rejects an otherwise valid eth_sendRawTransaction; dropped
+    accepts it and returns the hash but never mines it; rpc_error fails any
+    request with an internal error.
+    """
+    nonce_too_low: float = 0.0
+    underpriced: float = 0.0
+    dropped: float = 0.0
+    rpc_error: float = 0.0
+
+
+class RPCError(Exception):
+    """A JSON-RPC error returned to the client."""
+
+    def __init__(self, message: str, code: int = -32000):
+        self.code = code
+        super().__init__(message)
+
+
+def _int(data: bytes) -> int:
+    return int.from_bytes(data, "big")
+
+
+def _hex(value: Union[int, bytes]) -> str:
+    if isinstance(value, int):
+        return hex(value)
+    return "0x" + value.hex()
+
+
+def _quantity(value: Any) -> int:
+    if isinstance(value, int):
+        return value
+    return int(value, 16)
+
+
+def _data(value: Optional[str]) -> bytes:
+    if not value:
+        return b""
+    return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+
+
+def _intrinsic_gas(data: bytes, create: bool) -> int:
+    zeros = data.count(0)
+    gas = 21_000 + 4 * zeros + 16 * (len(data) - zeros)
+    if create:
+        # Creation surcharge and initcode words
+        gas += 32_000 + 2 * ((len(data) + 31) // 32)
+    return gas
+
+
+def _gas_used(data: bytes, create: bool) -> int:
+    """Simulated execution cost: intrinsic gas plus, for creations, a code-deposit allowance."""
+    return _intrinsic_gas(data, create) + (200 * len(data) if create else 0)
+
+
+def decode_raw_transaction(raw: bytes) -> Dict[str, Any]:
+    """
+    Decodes a signed legacy, EIP-2930 or EIP-1559 transaction and recovers
+    its sender.
+
+    Raises:
+        RPCError: If the payload is not a supported signed transaction.
+    """
+    try:
+        if raw[0] >= 0xC0:
+            nonce, gas_price, gas, to, value, data, v, _, _ = rlp.decode(raw)
+            v = _int(v)
+            tx = {
+                "type": 0,
+                "chainId": (v - 35) // 2 if v >= 35 else None,
+                "gasPrice": _int(gas_price),
+            }
+        elif raw[0] == 1:
+            chain_id, nonce, gas_price, gas, to, value, data, _, _, _, _ = rlp.decode(raw[1:])
+            tx = {"type": 1, "chainId": _int(chain_id), "gasPrice": _int(gas_price)}
+        elif raw[0] == 2:
+            chain_id, nonce, priority_fee, max_fee, gas, to, value, data, _, _, _, _ = rlp.decode(raw[1:])
+            tx = {
+                "type": 2,
+                "chainId": _int(chain_id),
+                "maxPriorityFeePerGas": _int(priority_fee),
+                "maxFeePerGas": _int(max_fee),
+            }
+        else:
+            raise RPCError("transaction type not supported")
+        sender = Account.recover_transaction(raw)
+    except RPCError:
+        raise
+    except Exception as e:
+        raise RPCError(f"invalid transaction: {e}")
+
+    tx.update(
+        {
+            "hash": keccak(raw),
+            "from": sender,
+            "nonce": _int(nonce),
+            "gas": _int(gas),
+            "to": to_checksum_address(to) if to else None,
+            "value": _int(value),
+            "data": bytes(data),
+        }
+    )
+    return tx
+
+
+class SimulatedChain:
+    """
+    In-memory stand-in for an EVM node's JSON-RPC interface.
+
+    Implements the subset evmdeploy uses: eth_chainId, eth_blockNumber,
+    eth_getBlockByNumber, eth_getTransactionCount, eth_estimateGas,
+    eth_feeHistory, eth_gasPrice, eth_maxPriorityFeePerGas,
+    eth_sendRawTransaction, eth_getTransactionReceipt, eth_getCode and
+    eth_getBalance, single or batched.
+
+    Nothing is executed: signed transactions are decoded, checked for chain
+    id, nonce and fees like a node's mempool would, and mined into blocks
+    every `block_time` seconds (or immediately when it is 0). Contract
+    creations and CREATE2 calls through a pre-installed factory record the
+    init code as the new address's code. Accounts have unlimited balance.
+
+    Network behaviour is configurable: `latency` plus up to +/-`jitter`
+    seconds per request (a batch counts as one request), and `faults` to
+    inject errors. `seed` makes jitter and faults reproducible.
+
+    Example:
+        chain = SimulatedChain(block_time=1.0, latency=0.03, jitter=0.01,
+                               faults=SimulatedFaults(dropped=0.01))
+        w3 = Web3(SimulatedProvider(chain))
+        with SimulatedRPCServer(chain) as url:
+            ...  # point AsyncHTTPProvider or a subprocess at `url`
+    """
+
+    def __init__(
+        self,
+        chain_id: int = 31337,
+        block_time: float = 0.0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        base_fee: int = _GWEI,
+        priority_fee: int = _GWEI,
+        block_gas_limit: int = 30_000_000,
+        faults: Optional[SimulatedFaults] = None,
+        seed: Optional[int] = None,
+        factories: Tuple[str, ...] = (DETERMINISTIC_DEPLOYER,),
+    ):
+        """
+        Args:
+            chain_id: Value returned by eth_chainId and required in transactions.
+            block_time: Seconds between blocks; 0 mines each transaction on arrival.
+            latency: Base delay per request, in seconds.
+            jitter: Maximum random deviation from `latency`, in seconds.
+            base_fee: Constant base fee per gas, in wei.
+            priority_fee: Typical priority fee reported by fee history, in wei.
+            block_gas_limit: Gas available per block.
+            faults: Error injection rates.
+            seed: Random seed for jitter and faults.
+            factories: Pre-installed CREATE2 factories (salt ++ init code calldata).
+        """
+        self.chain_id = chain_id
+        self.block_time = block_time
+        self.latency = latency
+        self.jitter = jitter
+        self.base_fee = base_fee
+        self.priority_fee = priority_fee
+        self.block_gas_limit = block_gas_limit
+        self.faults = faults or SimulatedFaults()
+        self.factories = {to_checksum_address(f) for f in factories}
+
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._nonces: Dict[str, int] = {}
+        self._pool: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self._known: Dict[bytes, Dict[str, Any]] = {}
+        self._receipts: Dict[bytes, Dict[str, Any]] = {}
+        self._code: Dict[str, bytes] = {f: _FACTORY_RUNTIME for f in self.factories}
+        # Only blocks with transactions are stored; empty ones are synthesised
+        self._blocks: Dict[int, Dict[str, Any]] = {}
+        self._genesis_time = time.time()
+        self._started = time.monotonic()
+        self.block_number = 0
+        self.request_count = 0
+        self.dropped: List[bytes] = []
+
+    # --- network -----------------------------------------------------------
+
+    def next_delay(self) -> float:
+        """Simulated network delay for one request or batch."""
+        if not self.latency and not self.jitter:
+            return 0.0
+        with self._lock:
+            offset = self._random.uniform(-self.jitter, self.jitter) if self.jitter else 0.0
+        return max(0.0, self.latency + offset)
+
+    def handle(self, payload: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Answers a decoded JSON-RPC request or batch."""
+        if isinstance(payload, list):
+            if not payload:
+                return {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "empty batch"}}
+            return [self._handle_one(request) for request in payload]
+        return self._handle_one(payload)
+
+    def _handle_one(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        response: Dict[str, Any] = {"jsonrpc": "2.0", "id": request.get("id")}
+        try:
+            response["result"] = self.call(request["method"], request.get("params") or [])
+        except RPCError as e:
+            response["error"] = {"code": e.code, "message": str(e)}
+        return response
+
+    def call(self, method: str, params: List[Any]) -> Any:
+        """Executes one RPC method and returns its JSON result."""
+        handler = getattr(self, "_rpc_" + method, None)
+        if handler is None:
+            raise RPCError(f"the method {method} does not exist/is not available", code=-32601)
+        with self._lock:
+            self.request_count += 1
+            if self.faults.rpc_error and self._random.random() < self.faults.rpc_error:
+                raise RPCError("internal error", code=-32603)
+            self._mine_due()
+            return handler(*params)
+
+    # --- blocks ------------------------------------------------------------
+
+    def _mine_due(self):
+        if self.block_time <= 0:
+            return
+        due = int((time.monotonic() - self._started) / self.block_time)
+        while self.block_number < due:
+            if not self._pool:
+                # Nothing to include: skip ahead without storing empty blocks
+                self.block_number = due
+                break
+            self._mine_block()
+
+    def mine(self, blocks: int = 1):
+        """Mines blocks immediately, e.g. to flush the pool in tests."""
+        with self._lock:
+            for _ in range(blocks):
+                self._mine_block()
+
+    def _block_hash(self, number: int) -> bytes:
+        return keccak(b"simulated" + self.chain_id.to_bytes(8, "big") + number.to_bytes(8, "big"))
+
+    def _block_timestamp(self, number: int) -> int:
+        return int(self._genesis_time + number * self.block_time)
+
+    def _mine_block(self):
+        number = self.block_number + 1
+        block_hash = self._block_hash(number)
+        included = []
+        gas_used = 0
+
+        # Each sender's transactions are included in nonce order; across
+        # senders, the next executable transaction that arrived first wins.
+        # Transactions behind a nonce gap stay in the pool.
+        heads = []
+        for (sender, nonce), tx in self._pool.items():
+            if nonce == self._nonces.get(sender, 0):
+                heads.append((tx["arrival"], sender))
+        heapq.heapify(heads)
+
+        while heads:
+            _, sender = heapq.heappop(heads)
+            nonce = self._nonces.get(sender, 0)
+            tx = self._pool[(sender, nonce)]
+            if gas_used + tx["gasUsed"] > self.block_gas_limit:
+                continue
+            del self._pool[(sender, nonce)]
+            self._nonces[sender] = nonce + 1
+            gas_used += tx["gasUsed"]
+            included.append(tx)
+            self._receipts[tx["hash"]] = self._execute(tx, number, block_hash, len(included) - 1, gas_used)
+            following = self._pool.get((sender, nonce + 1))
+            if following is not None:
+                heapq.heappush(heads, (following["arrival"], sender))
+
+        self.block_number = number
+        if included:
+            self._blocks[number] = {
+                "gasUsed": gas_used,
+                "transactions": [tx["hash"] for tx in included],
+            }
+
+    def _execute(self, tx: Dict[str, Any], number: int, block_hash: bytes, index: int, cumulative: int) -> Dict[str, Any]:
+        status = 1
+        contract_address = None
+        if tx["to"] is None:
+            contract_address = to_checksum_address(keccak(rlp.encode([bytes.fromhex(tx["from"][2:]), tx["nonce"]]))[12:])
+            self._code[contract_address] = tx["data"]
+        elif tx["to"] in self.factories and len(tx["data"]) >= 32:
+            created = compute_create2_address(tx["to"], tx["data"][:32], tx["data"][32:])
+            if created in self._code:
+                status = 0  # the factory reverts when the address is taken
+            else:
+                self._code[created] = tx["data"][32:]
+
+        if "maxFeePerGas" in tx:
+            price = min(tx["maxFeePerGas"], self.base_fee + tx["maxPriorityFeePerGas"])
+        else:
+            price = tx["gasPrice"]
+        return {
+            "transactionHash": _hex(tx["hash"]),
+            "transactionIndex": _hex(index),
+            "blockHash": _hex(block_hash),
+            "blockNumber": _hex(number),
+            "from": tx["from"],
+            "to": tx["to"],
+            "contractAddress": contract_address,
+            "cumulativeGasUsed": _hex(cumulative),
+            "gasUsed": _hex(tx["gasUsed"]),
+            "effectiveGasPrice": _hex(price),
+            "logs": [],
+            "logsBloom": "0x" + "00" * 256,
+            "status": _hex(status),
+            "type": _hex(tx["type"]),
+        }
+
+    def _block(self, number: int) -> Dict[str, Any]:
+        stored = self._blocks.get(number, {})
+        return {
+            "number": _hex(number),
+            "hash": _hex(self._block_hash(number)),
+            "parentHash": _hex(self._block_hash(number - 1)) if number else "0x" + "00" * 32,
+            "timestamp": _hex(self._block_timestamp(number)),
+            "gasLimit": _hex(self.block_gas_limit),
+            "gasUsed": _hex(stored.get("gasUsed", 0)),
+            "baseFeePerGas": _hex(self.base_fee),
+            "miner": "0x" + "00" * 20,
+            "difficulty": "0x0",
+            "extraData": "0x",
+            "logsBloom": "0x" + "00" * 256,
+            "transactions": [_hex(h) for h in stored.get("transactions", [])],
+            "uncles": [],
+        }
+
+    def _block_param(self, tag: Any) -> int:
+        if tag in (None, "latest", "pending", "safe", "finalized"):
+            return self.block_number
+        if tag == "earliest":
+            return 0
+        return _quantity(tag)
+
+    # --- RPC methods -------------------------------------------------------
+
+    def _rpc_web3_clientVersion(self) -> str:
+        return "evmdeploy-simulated/0.1"
+
+    def _rpc_net_version(self) -> str:
+        return str(self.chain_id)
+
+    def _rpc_eth_chainId(self) -> str:
+        return _hex(self.chain_id)
+
+    def _rpc_eth_blockNumber(self) -> str:
+        return _hex(self.block_number)
+
+    def _rpc_eth_getBlockByNumber(self, tag: Any, full_transactions: bool = False) -> Optional[Dict[str, Any]]:
+        number = self._block_param(tag)
+        return self._block(number) if number <= self.block_number else None
+
+    def _rpc_eth_getBalance(self, address: str, tag: Any = "latest") -> str:
+        return _hex(10**30)
+
+    def _rpc_eth_getTransactionCount(self, address: str, tag: Any = "latest") -> str:
+        address = to_checksum_address(address)
+        nonce = self._nonces.get(address, 0)
+        if tag == "pending":
+            while (address, nonce) in self._pool:
+                nonce += 1
+        return _hex(nonce)
+
+    def _rpc_eth_getCode(self, address: str, tag: Any = "latest") -> str:
+        return _hex(self._code.get(to_checksum_address(address), b""))
+
+    def _rpc_eth_gasPrice(self) -> str:
+        return _hex(self.base_fee + self.priority_fee)
+
+    def _rpc_eth_maxPriorityFeePerGas(self) -> str:
+        return _hex(self.priority_fee)
+
+    def _rpc_eth_feeHistory(self, block_count: Any, newest: Any, percentiles: Optional[List[float]] = None) -> Dict[str, Any]:
+        newest_number = self._block_param(newest)
+        count = max(1, min(_quantity(block_count), newest_number + 1))
+        oldest = newest_number - count + 1
+        result: Dict[str, Any] = {
+            "oldestBlock": _hex(oldest),
+            "baseFeePerGas": [_hex(self.base_fee)] * (count + 1),
+            "gasUsedRatio": [
+                self._blocks.get(n, {}).get("gasUsed", 0) / self.block_gas_limit for n in range(oldest, newest_number + 1)
+            ],
+        }
+        if percentiles:
+            # Rewards grow with the percentile, around the configured priority fee
+            result["reward"] = [
+                [_hex(int(self.priority_fee * (0.5 + p / 100))) for p in percentiles] for _ in range(count)
+            ]
+        return result
+
+    def _rpc_eth_estimateGas(self, tx: Dict[str, Any], tag: Any = None) -> str:
+        data = _data(tx.get("data") or tx.get("input"))
+        gas = _gas_used(data, create=not tx.get("to"))
+        if gas > self.block_gas_limit:
+            raise RPCError("gas required exceeds allowance")
+        return _hex(gas)
+
+    def _rpc_eth_sendRawTransaction(self, raw_hex: str) -> str:
+        tx = decode_raw_transaction(_data(raw_hex))
+        tx_hash = tx["hash"]
+        sender, nonce = tx["from"], tx["nonce"]
+
+        if tx_hash in self._known:
+            raise RPCError("already known")
+        if tx["chainId"] is not None and tx["chainId"] != self.chain_id:
+            raise RPCError(f"invalid chain id: have {tx['chainId']}, want {self.chain_id}")
+        if nonce < self._nonces.get(sender, 0):
+            raise RPCError(f"nonce too low: next nonce {self._nonces.get(sender, 0)}, tx nonce {nonce}")
+        max_fee = tx.get("maxFeePerGas", tx.get("gasPrice", 0))
+        if max_fee < self.base_fee:
+            raise RPCError(f"transaction underpriced: fee cap {max_fee} below base fee {self.base_fee}")
+        create = tx["to"] is None
+        if tx["gas"] < _intrinsic_gas(tx["data"], create):
+            raise RPCError("intrinsic gas too low")
+        if tx["gas"] > self.block_gas_limit:
+            raise RPCError("exceeds block gas limit")
+
+        existing = self._pool.get((sender, nonce))
+        if existing is not None:
+            old_fee = existing.get("maxFeePerGas", existing.get("gasPrice", 0))
+            if max_fee * 10 < old_fee * 11:
+                raise RPCError("replacement transaction underpriced")
+
+        if (
+            self.faults.nonce_too_low
+            and nonce == self._nonces.get(sender, 0)
+            and existing is None
+            and self._random.random() < self.faults.nonce_too_low
+        ):
+            # A competing transaction took the nonce first
+            self._nonces[sender] = nonce + 1
+            raise RPCError(f"nonce too low: next nonce {nonce + 1}, tx nonce {nonce}")
+        if self.faults.underpriced and self._random.random() < self.faults.underpriced:
+            raise RPCError("transaction underpriced")
+
+        self._known[tx_hash] = tx
+        if self.faults.dropped and self._random.random() < self.faults.dropped:
+            self.dropped.append(tx_hash)
+            return _hex(tx_hash)
+
+        tx["gasUsed"] = min(tx["gas"], _gas_used(tx["data"], create))
+        tx["arrival"] = self.request_count
+        self._pool[(sender, nonce)] = tx
+        if self.block_time <= 0:
+            self._mine_block()
+        return _hex(tx_hash)
+
+    def _rpc_eth_getTransactionReceipt(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        return self._receipts.get(_data(tx_hash))
+
+
+class SimulatedProvider(JSONBaseProvider):
+    """
+    web3 provider backed by a SimulatedChain in the same process.
+
+    Requests go through the same JSON encoding as HTTPProvider, batches
+    included, and each request or batch waits the chain's simulated latency.
+    """
+
+    def __init__(self, chain: Optional[SimulatedChain] = None, **chain_kwargs: Any):
+        """
+        Args:
+            chain: Chain to serve; a new SimulatedChain(**chain_kwargs) if omitted.
+        """
+        super().__init__()
+        self.chain = chain if chain is not None else SimulatedChain(**chain_kwargs)
+
+    def _roundtrip(self, request_data: bytes) -> Any:
+        delay = self.chain.next_delay()
+        if delay:
+            time.sleep(delay)
+        return self.chain.handle(json.loads(request_data))
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return self._roundtrip(self.encode_rpc_request(method, params))
+
+    def make_batch_request(self, requests: List[Tuple[RPCEndpoint, Any]]) -> Union[List[RPCResponse], RPCResponse]:
+        return self._roundtrip(self.encode_batch_rpc_request(requests))
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    chain: SimulatedChain
+
+    def do_POST(self):
+        try:
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        except (ValueError, json.JSONDecodeError):
+            payload = None
+        delay = self.chain.next_delay()
+        if delay:
+            time.sleep(delay)
+        if payload is None:
+            response: Any = {"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": "parse error"}}
+        else:
+            response = self.chain.handle(payload)
+
+        body = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any):
+        pass
+
+
+class SimulatedRPCServer:
+    """
+    Serves a SimulatedChain over HTTP on localhost, for AsyncHTTPProvider,
+    other processes or non-Python tools.
+
+    Example:
+        with SimulatedRPCServer(SimulatedChain(block_time=2.0)) as url:
+            w3 = Web3(Web3.HTTPProvider(url))
+    """
+
+    def __init__(self, chain: Optional[SimulatedChain] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Args:
+            chain: Chain to serve; a default SimulatedChain if omitted.
+            host: Interface to bind.
+            port: Port to bind; 0 picks a free one.
+        """
+        self.chain = chain if chain is not None else SimulatedChain()
+        handler = type("SimulatedRPCHandler", (_Handler,), {"chain": self.chain})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """Starts serving in a background thread and returns the URL."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._thread.start()
+        return self.url
+
+    def stop(self):
+        """Stops the server and releases the port."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> str:
+        return self.start()
+
+    def __exit__(self, *exc_info: Any):
+        self.stop()
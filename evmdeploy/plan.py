@@ -0,0 +1,361 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from eth_account.types import PrivateKeyType
+from web3 import Web3
+
+from evmdeploy.artifacts.model import ContractArtifact, DeploymentResult
+from evmdeploy.compiler.linker import link_artifact
+from evmdeploy.contract import Contract
+from evmdeploy.deployer.deployer import Deployer
+from evmdeploy.deployer.prepare import prepare_transaction
+from evmdeploy.deployer.receipts import get_receipt_tracker
+from evmdeploy.exceptions import DeploymentError, LinkingError
+from evmdeploy.utils.create2 import DETERMINISTIC_DEPLOYER, Salt
+
+
+class Ref:
+    """Stands for the address of another plan node; resolved when the plan runs."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"Ref({self.name!r})"
+
+
+@dataclass
+class PlanNode:
+    """One contract (or library) deployment in a DeploymentPlan."""
+    name: str
+    contract: Contract
+    constructor_args: List[Any] = field(default_factory=list)
+    constructor_kwargs: Dict[str, Any] = field(default_factory=dict)
+    # Library name -> fixed address or Ref to the node deploying it
+    libraries: Dict[str, Union[str, Ref]] = field(default_factory=dict)
+    depends_on: List[str] = field(default_factory=list)
+    value: int = 0
+    gas: Optional[int] = None
+    # Set for CREATE2 deployments through `factory`
+    salt: Optional[Salt] = None
+    factory: str = DETERMINISTIC_DEPLOYER
+
+
+def _refs(value: Any) -> Iterator[Ref]:
+    if isinstance(value, Ref):
+        yield value
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _refs(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _refs(item)
+
+
+def _resolve(value: Any, addresses: Dict[str, str]) -> Any:
+    if isinstance(value, Ref):
+        return addresses[value.name]
+    if isinstance(value, list):
+        return [_resolve(item, addresses) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_resolve(item, addresses) for item in value)
+    if isinstance(value, dict):
+        return {k: _resolve(v, addresses) for k, v in value.items()}
+    return value
+
+
+class DeploymentPlan:
+    """
+    A DAG of deployments whose constructor args and libraries may refer to
+    the addresses of other nodes.
+
+    Nodes are deployed in waves: every node whose dependencies are already
+    on chain is sent in the same wave (nonces are pipelined locally), and
+    the wave's receipts are awaited together. Libraries are linked into
+    dependent bytecode from the artifact's stored link references, so
+    nothing is recompiled.
+
+    Nodes given a `salt` are deployed with CREATE2, so their address is
+    known before they are sent. Nodes with an explicit `gas` limit that only
+    depend on CREATE2 nodes go out in the same wave, after them in nonce
+    order, instead of waiting a wave for receipts. Without a gas limit they
+    wait for the next wave: gas is estimated against the latest block, where
+    a constructor calling its dependency would revert.
+
+    Example:
+        plan = DeploymentPlan()
+        plan.add("MathLib", SolidityCompiler().compile("MathLib.sol")["MathLib"])
+        token = plan.add("Token", token_artifact, constructor_args=["Tok", "TOK"])
+        plan.add("Vault", vault_artifact, constructor_args=[token])
+        results = plan.execute(w3, private_key)
+    """
+
+    def __init__(self):
+        self.nodes: Dict[str, PlanNode] = {}
+
+    def add(
+        self,
+        name: str,
+        contract: Union[Contract, ContractArtifact],
+        constructor_args: Optional[List[Any]] = None,
+        constructor_kwargs: Optional[Dict[str, Any]] = None,
+        libraries: Optional[Dict[str, Union[str, Ref]]] = None,
+        depends_on: Optional[List[str]] = None,
+        value: int = 0,
+        gas: Optional[int] = None,
+        salt: Optional[Salt] = None,
+        factory: str = DETERMINISTIC_DEPLOYER,
+    ) -> Ref:
+        """
+        Adds a node and returns a Ref to its future address.
+
+        Args:
+            name: Unique node name. A library node named like the library is
+                  linked automatically into every node that needs it.
+            contract: Contract or artifact to deploy.
+            constructor_args: Positional args; may contain Refs (also nested).
+            constructor_kwargs: Keyword args; may contain Refs.
+            libraries: Library name (bare or `file:Library`) -> address or
+                       Ref, for libraries not deployed under their own name
+                       in this plan.
+            depends_on: Extra ordering constraints by node name.
+            value: Wei sent with the deployment.
+            gas: Gas limit; estimated if not given.
+            salt: Deploy with CREATE2 through `factory` using this salt.
+            factory: CREATE2 factory address.
+        """
+        if name in self.nodes:
+            raise ValueError(f"Duplicate plan node: {name}")
+        if isinstance(contract, ContractArtifact):
+            contract = Contract(contract)
+        self.nodes[name] = PlanNode(
+            name=name,
+            contract=contract,
+            constructor_args=list(constructor_args or []),
+            constructor_kwargs=dict(constructor_kwargs or {}),
+            libraries=dict(libraries or {}),
+            depends_on=list(depends_on or []),
+            value=value,
+            gas=gas,
+            salt=salt,
+            factory=factory,
+        )
+        return Ref(name)
+
+    def ref(self, name: str) -> Ref:
+        """A Ref to an existing node's address."""
+        if name not in self.nodes:
+            raise KeyError(f"Unknown plan node: {name}")
+        return Ref(name)
+
+    def _library_sources(self, node: PlanNode) -> Dict[str, Union[str, Ref]]:
+        """Address or Ref per fully-qualified library; `file:Library` entries win over bare names."""
+        sources = {}
+        for qualified in node.contract.artifact.qualified_libraries:
+            lib = qualified.rsplit(":", 1)[1]
+            for key in (qualified, lib):
+                if key in node.libraries:
+                    sources[qualified] = node.libraries[key]
+                    break
+                if key in self.nodes:
+                    sources[qualified] = Ref(key)
+                    break
+            else:
+                raise LinkingError(
+                    f"No address or plan node for library required by {node.name}", library_name=qualified
+                )
+        return sources
+
+    def dependencies(self, name: str) -> List[str]:
+        """Names of the nodes that must be deployed before `name`."""
+        node = self.nodes[name]
+        deps = list(node.depends_on)
+        for value in [node.constructor_args, node.constructor_kwargs, self._library_sources(node)]:
+            deps.extend(ref.name for ref in _refs(value))
+
+        for dep in deps:
+            if dep not in self.nodes:
+                raise DeploymentError(f"Plan node {name} depends on unknown node {dep}")
+        return list(dict.fromkeys(deps))
+
+    def waves(self) -> List[List[str]]:
+        """
+        Groups nodes into deployment waves; each wave only depends on earlier
+        ones or, for nodes with an explicit gas limit, on CREATE2 nodes
+        listed before it in the same wave.
+
+        Raises:
+            DeploymentError: On unknown dependencies or a dependency cycle.
+        """
+        remaining = {name: self.dependencies(name) for name in self.nodes}
+        done: set = set()
+        waves = []
+        while remaining:
+            wave: List[str] = []
+            progress = True
+            while progress:
+                progress = False
+                for name, deps in list(remaining.items()):
+                    # A CREATE2 dependency sent earlier in the wave is enough,
+                    # unless gas must be estimated before it is mined
+                    same_wave = self.nodes[name].gas is not None
+                    if all(d in done or (same_wave and d in wave and self.nodes[d].salt is not None) for d in deps):
+                        wave.append(name)
+                        del remaining[name]
+                        progress = True
+            if not wave:
+                raise DeploymentError(f"Dependency cycle in deployment plan: {', '.join(remaining)}")
+            done.update(wave)
+            waves.append(wave)
+        return waves
+
+    def _materialize(self, name: str, addresses: Dict[str, str]) -> Tuple[Contract, List[Any], Dict[str, Any]]:
+        """Linked contract and resolved constructor args for a node."""
+        node = self.nodes[name]
+        libraries = _resolve(self._library_sources(node), addresses)
+        contract = Contract(link_artifact(node.contract.artifact, libraries))
+        return contract, _resolve(node.constructor_args, addresses), _resolve(node.constructor_kwargs, addresses)
+
+    def create2_addresses(self) -> Dict[str, str]:
+        """
+        Addresses of the CREATE2 nodes that can be computed offline, i.e.
+        whose init code only refers to other CREATE2 nodes.
+        """
+        addresses: Dict[str, str] = {}
+        for wave in self.waves():
+            for name in wave:
+                node = self.nodes[name]
+                if node.salt is None or not all(d in addresses for d in self.dependencies(name)):
+                    continue
+                contract, args, kwargs = self._materialize(name, addresses)
+                addresses[name] = contract.create2_address(node.salt, args, kwargs, node.factory)
+        return addresses
+
+    def _prepare(
+        self,
+        deployer: Deployer,
+        name: str,
+        nonce: int,
+        contract: Contract,
+        args: List[Any],
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Builds a node's transaction and fills in gas and fees, without sending it."""
+        node = self.nodes[name]
+        try:
+            if node.salt is None:
+                tx = contract._deployment_tx(deployer.address, nonce, node.gas, node.value, args, kwargs)
+            else:
+                tx = contract._create2_tx(
+                    deployer.address, nonce, node.salt, node.gas, node.value, args, kwargs, node.factory
+                )
+            return prepare_transaction(deployer.w3, tx)
+        except Exception:
+            deployer.nonce_manager.release(nonce)
+            raise
+
+    def execute(
+        self,
+        w3: Web3,
+        private_key: PrivateKeyType,
+        max_workers: int = 8,
+        timeout: int = 120,
+        results: Optional[Dict[str, DeploymentResult]] = None,
+        skip_existing: bool = True,
+    ) -> Dict[str, DeploymentResult]:
+        """
+        Deploys the whole plan and returns a DeploymentResult per node.
+
+        Args:
+            w3: Connected Web3 instance.
+            private_key: Deployer key, used for every node.
+            max_workers: Threads building and pricing a wave's transactions;
+                         they are then broadcast one by one in nonce order.
+                         If one fails, the rest of its wave is not sent and
+                         the error names the node that failed.
+            timeout: Seconds to wait for each wave's receipts.
+            results: Dict filled in as nodes land. Pass the dict from a failed
+                     run to resume; nodes already in it are not redeployed.
+            skip_existing: Skip CREATE2 nodes whose address already has code.
+        """
+        results = {} if results is None else results
+        addresses = {name: r.contract_address for name, r in results.items()}
+        deployer = Deployer(w3, private_key)
+        tracker = get_receipt_tracker(w3)
+        checked_factories: set = set()
+
+        for wave in self.waves():
+            # Resolve in wave order so CREATE2 addresses are known to later nodes
+            jobs = []
+            for name in wave:
+                if name in results:
+                    continue
+                node = self.nodes[name]
+                contract, args, kwargs = self._materialize(name, addresses)
+                if node.salt is not None:
+                    address = contract.create2_address(node.salt, args, kwargs, node.factory)
+                    addresses[name] = address
+                    if skip_existing and w3.eth.get_code(address):
+                        results[name] = DeploymentResult(tx_hash=None, contract_address=address, skipped=True)
+                        continue
+                    if node.factory not in checked_factories:
+                        if not w3.eth.get_code(node.factory):
+                            raise DeploymentError(f"No CREATE2 factory deployed at {node.factory}")
+                        checked_factories.add(node.factory)
+                jobs.append((name, contract, args, kwargs))
+            if not jobs:
+                continue
+
+            # Nonces are reserved in wave order, which is also execution order.
+            # Transactions are built and priced concurrently (gas estimation is
+            # the slow part), then broadcast in nonce order. Sending stops at the
+            # first failure, so no later transaction is left stuck behind a
+            # nonce gap; their nonces are released instead.
+            nonces = [deployer.reserve_nonce() for _ in jobs]
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+                prepared = [
+                    pool.submit(self._prepare, deployer, name, nonce, contract, args, kwargs)
+                    for (name, contract, args, kwargs), nonce in zip(jobs, nonces)
+                ]
+
+            errors = []
+            unsent = []
+            sent = {}
+            for (name, *_), nonce, future in zip(jobs, nonces, prepared):
+                if not errors:
+                    try:
+                        tx_hash = deployer.send_transaction(future.result())
+                    except Exception as e:
+                        errors.append(f"{name}: {e}")
+                    else:
+                        # Still wait for these so a resumed run does not redeploy them
+                        sent[name] = (tx_hash, tracker.track(tx_hash, timeout=timeout))
+                        continue
+                else:
+                    unsent.append(name)
+                deployer.nonce_manager.release(nonce)
+            if errors:
+                deployer.nonce_manager.resync()
+                if unsent:
+                    errors.append(f"not sent: {', '.join(unsent)}")
+
+            for name, (tx_hash, future) in sent.items():
+                try:
+                    receipt = future.result()
+                except DeploymentError as e:
+                    errors.append(f"{name}: {e}")
+                    continue
+                if self.nodes[name].salt is None:
+                    addresses[name] = receipt["contractAddress"]
+                results[name] = DeploymentResult(
+                    tx_hash=tx_hash,
+                    contract_address=addresses[name],
+                    receipt=receipt,
+                )
+            if errors:
+                raise DeploymentError("Deployment plan failed: " + "; ".join(errors))
+
+        return results
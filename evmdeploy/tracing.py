@@ -0,0 +1,243 @@
+"""
+Phase-level tracing for compile, storage and deploy.
+
+Library code wraps each phase in `span(name, **attributes)`. While no
+exporter is installed `span` returns a shared no-op object, so an
+instrumented call costs one function call and nothing is timed or
+allocated. Once an exporter is added, every finished span is passed to it:
+
+    from evmdeploy.tracing import HistogramExporter, tracing
+
+    histogram = HistogramExporter()
+    with tracing(histogram):
+        contract.deploy(w3, private_key)
+    print(histogram.report())
+
+An exporter is any callable taking a finished Span, so hooks need no base
+class. Spans nest per thread and per asyncio task; `Span.parent` names the
+enclosing phase.
+
+Span names used by evmdeploy:
+    compile.cache, compile.resolve_solc, compile.solc
+    artifacts.save, artifacts.load
+    deploy.contract, deploy.send, deploy.prepare, deploy.batch,
+    deploy.estimate_gas, deploy.fees, deploy.sign, deploy.broadcast,
+    deploy.confirm
+"""
+import json
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+Exporter = Callable[["Span"], None]
+
+# Replaced, never mutated, so span() can read it without a lock
+_exporters: Tuple[Exporter, ...] = ()
+_exporters_lock = threading.Lock()
+
+_current: ContextVar[Optional["Span"]] = ContextVar("evmdeploy_span", default=None)
+
+logger = logging.getLogger(__name__)
+
+
+class Span:
+    """One timed phase. Use as a context manager; attributes may be added with set()."""
+
+    __slots__ = ("name", "attributes", "parent", "start", "duration", "error", "_token")
+
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        self.name = name
+        self.attributes = attributes
+        self.parent: Optional[str] = None
+        self.start = 0.0
+        self.duration = 0.0
+        self.error: Optional[str] = None
+        self._token = None
+
+    def set(self, **attributes: Any) -> "Span":
+        """Adds or overwrites attributes, e.g. results only known at the end."""
+        self.attributes.update(attributes)
+        return self
+
+    def __enter__(self) -> "Span":
+        parent = _current.get()
+        self.parent = parent.name if parent is not None else None
+        self._token = _current.set(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.duration = time.perf_counter() - self.start
+        _current.reset(self._token)
+        if exc_type is not None:
+            self.error = exc_type.__name__
+        for exporter in _exporters:
+            try:
+                exporter(self)
+            except Exception:
+                logger.exception("Tracing exporter %r failed", exporter)
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {"span": self.name, "duration_ms": round(self.duration * 1000, 3)}
+        if self.parent is not None:
+            data["parent"] = self.parent
+        if self.error is not None:
+            data["error"] = self.error
+        data.update(self.attributes)
+        return data
+
+    def __repr__(self) -> str:
+        return f"Span({self.name!r}, {self.duration * 1000:.3f}ms, {self.attributes!r})"
+
+
+class _NullSpan:
+    """Returned by span() while tracing is off."""
+
+    __slots__ = ()
+
+    def set(self, **attributes: Any) -> "_NullSpan":
+        return self
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+def span(name: str, /, **attributes: Any):
+    """
+    Returns a context manager timing the phase `name`.
+
+    Args:
+        name: Phase name, dotted by area (e.g. "deploy.sign").
+        **attributes: Extra fields recorded with the span (contract name,
+                      byte counts, RPC method, ...).
+
+    Returns:
+        A Span, or NULL_SPAN when no exporter is installed.
+    """
+    if not _exporters:
+        return NULL_SPAN
+    return Span(name, attributes)
+
+
+def is_enabled() -> bool:
+    """True when at least one exporter is installed."""
+    return bool(_exporters)
+
+
+def add_exporter(exporter: Exporter) -> Exporter:
+    """Installs `exporter` for every span finished from now on and returns it."""
+    global _exporters
+    with _exporters_lock:
+        _exporters = _exporters + (exporter,)
+    return exporter
+
+
+def remove_exporter(exporter: Exporter):
+    """Uninstalls `exporter`; tracing turns off again once none are left."""
+    global _exporters
+    with _exporters_lock:
+        _exporters = tuple(e for e in _exporters if e is not exporter)
+
+
+@contextmanager
+def tracing(*exporters: Exporter) -> Iterator[Tuple[Exporter, ...]]:
+    """Installs `exporters` for the duration of the with block."""
+    for exporter in exporters:
+        add_exporter(exporter)
+    try:
+        yield exporters
+    finally:
+        for exporter in exporters:
+            remove_exporter(exporter)
+
+
+class LogExporter:
+    """Writes each finished span as one JSON log record."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.INFO):
+        """
+        Args:
+            logger: Destination (default: the "evmdeploy.tracing" logger).
+            level: Log level of span records.
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def __call__(self, span: Span):
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, json.dumps(span.to_dict(), default=str))
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+class HistogramExporter:
+    """
+    Collects span durations in memory, grouped by span name.
+
+    Durations are kept as raw samples, which is fine for the span counts a
+    deployment produces; call reset() between runs of a long-lived process.
+    """
+
+    def __init__(self):
+        self._samples: Dict[str, List[float]] = {}
+        self._errors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, span: Span):
+        with self._lock:
+            self._samples.setdefault(span.name, []).append(span.duration)
+            if span.error is not None:
+                self._errors[span.name] = self._errors.get(span.name, 0) + 1
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._errors.clear()
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns:
+            Dict keyed by span name with count, errors, and total, mean, p50,
+            p95 and max durations in seconds.
+        """
+        with self._lock:
+            samples = {name: sorted(values) for name, values in self._samples.items()}
+            errors = dict(self._errors)
+
+        result = {}
+        for name, ordered in sorted(samples.items()):
+            total = sum(ordered)
+            result[name] = {
+                "count": len(ordered),
+                "errors": errors.get(name, 0),
+                "total": total,
+                "mean": total / len(ordered),
+                "p50": _percentile(ordered, 0.50),
+                "p95": _percentile(ordered, 0.95),
+                "max": ordered[-1],
+            }
+        return result
+
+    def report(self) -> str:
+        """Formats summary() as a table with durations in milliseconds."""
+        columns = ("total", "mean", "p50", "p95", "max")
+        lines = [f"{'span':<24}{'count':>7}{'errors':>8}" + "".join(f"{c:>10}" for c in columns)]
+        for name, s in self.summary().items():
+            lines.append(
+                f"{name:<24}{s['count']:>7}{s['errors']:>8}" + "".join(f"{s[c] * 1000:>10.2f}" for c in columns)
+            )
+        return "\n".join(lines)
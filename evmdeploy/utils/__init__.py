@@ -1,3 +1,13 @@
 from evmdeploy.utils.hashing import compute_keccak256
+from evmdeploy.utils.create2 import (
+    DETERMINISTIC_DEPLOYER,
+    compute_create2_address,
+    compute_create2_addresses,
+)
 
-__all__ = ["compute_keccak256"]
+__all__ = [
+    "compute_keccak256",
+    "DETERMINISTIC_DEPLOYER",
+    "compute_create2_address",
+    "compute_create2_addresses",
+]
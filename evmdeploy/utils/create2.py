@@ -0,0 +1,68 @@
+from typing import Dict, Iterable, List, Tuple, Union
+
+from eth_utils import to_checksum_address
+
+from evmdeploy.utils.hashing import compute_keccak256
+
+# Nick Johnson's deterministic deployment proxy, deployed at the same address
+# on most EVM chains. Calldata is salt (32 bytes) ++ init code.
+DETERMINISTIC_DEPLOYER = "0x4e59b44847b379578588920cA78FbF26c0B4956C"
+
+Salt = Union[int, bytes, str]
+
+
+def _hex_bytes(value: Union[bytes, str]) -> bytes:
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    return bytes(value)
+
+
+def normalize_salt(salt: Salt) -> bytes:
+    """
+    Returns a salt as 32 bytes.
+
+    Args:
+        salt: int, or 32 bytes as bytes or hex string.
+    """
+    if isinstance(salt, int):
+        return salt.to_bytes(32, "big")
+    data = _hex_bytes(salt)
+    if len(data) != 32:
+        raise ValueError(f"CREATE2 salt must be 32 bytes, got {len(data)}")
+    return data
+
+
+def compute_create2_address(factory: str, salt: Salt, init_code: Union[bytes, str]) -> str:
+    """
+    Computes the address of a contract deployed with CREATE2:
+    keccak256(0xff ++ factory ++ salt ++ keccak256(init_code))[12:].
+
+    Returns:
+        Checksummed address.
+    """
+    return compute_create2_addresses(factory, [(salt, init_code)])[0]
+
+
+def compute_create2_addresses(
+    factory: str,
+    deployments: Iterable[Tuple[Salt, Union[bytes, str]]],
+) -> List[str]:
+    """
+    Bulk variant of compute_create2_address for many (salt, init_code) pairs.
+
+    Each distinct init code is hashed once, and the 0xff ++ factory prefix
+    is built once, so scanning many salts for the same contract costs one
+    keccak per salt.
+    """
+    prefix = b"\xff" + _hex_bytes(factory)
+    code_hashes: Dict[Union[bytes, str], bytes] = {}
+    addresses = []
+    for salt, init_code in deployments:
+        # bytearray and memoryview are unhashable; key them as bytes
+        key = init_code if isinstance(init_code, (bytes, str)) else bytes(init_code)
+        code_hash = code_hashes.get(key)
+        if code_hash is None:
+            code_hash = code_hashes[key] = _hex_bytes(compute_keccak256(_hex_bytes(key)))
+        digest = compute_keccak256(prefix + normalize_salt(salt) + code_hash)
+        addresses.append(to_checksum_address("0x" + digest[-40:]))
+    return addresses
@@ -0,0 +1,82 @@
+import os
+
+import pytest
+
+from evmdeploy.artifacts.cache import ArtifactCache, get_artifact_cache
+from evmdeploy.artifacts.model import ContractArtifact
+from evmdeploy.artifacts.storage import ArtifactStorage
+from evmdeploy.contract import Contract
+
+
+def _artifact(name: str, bytecode: str = "0x6080604052") -> ContractArtifact:
+    return ContractArtifact(name=name, abi=[], bytecode=bytecode, compiler_version="0.8.23", source_hash="")
+
+
+def _loader(storage: ArtifactStorage, name: str, calls: list):
+    def load():
+        calls.append(name)
+        return storage._read_artifact(storage.base_path / f"{name}.json")
+    return load
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    storage = ArtifactStorage(tmp_path)
+    storage.save_artifacts({name: _artifact(name) for name in "ABC"})
+    cache = ArtifactCache(maxsize=2)
+    calls = []
+
+    def get(name):
+        return cache.get_or_load(tmp_path / f"{name}.json", _loader(storage, name, calls))
+
+    get("A"), get("B"), get("A")
+    get("C")  # evicts B, the least recently used
+    get("A"), get("C"), get("B")
+
+    assert calls == ["A", "B", "C", "B"]
+    assert cache.stats() == {"hits": 3, "misses": 4, "evictions": 2, "size": 2, "maxsize": 2}
+
+
+@pytest.mark.parametrize("validate", ["stat", "hash"])
+def test_rewritten_file_is_reloaded(tmp_path, validate):
+    storage = ArtifactStorage(tmp_path)
+    path = storage.save_artifact(_artifact("A"))
+    cache = ArtifactCache(validate=validate)
+    calls = []
+    load = _loader(storage, "A", calls)
+
+    first = cache.get_or_load(path, load)
+    assert cache.get_or_load(path, load) is first
+
+    # Same size, so only the mtime (or the content hash) tells them apart
+    storage.save_artifact(_artifact("A", bytecode="0x6080604053"))
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert cache.get_or_load(path, load).bytecode == "0x6080604053"
+    assert len(calls) == 2
+
+    # A touched but unchanged file only misses when validating by stat
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000))
+    cache.get_or_load(path, load)
+    assert len(calls) == (3 if validate == "stat" else 2)
+
+    os.unlink(path)
+    with pytest.raises(FileNotFoundError):
+        cache.get_or_load(path, load)
+    assert cache.stats()["size"] == 0
+
+
+def test_from_storage_shares_cached_artifacts(tmp_path):
+    ArtifactStorage(tmp_path).save_artifact(_artifact("Token"))
+    before = get_artifact_cache().stats()
+
+    first = Contract.from_storage("Token", tmp_path)
+    second = Contract.from_storage("Token", tmp_path)
+    assert second.artifact is first.artifact
+    assert second.abi is first.abi
+
+    after = get_artifact_cache().stats()
+    assert (after["misses"] - before["misses"], after["hits"] - before["hits"]) == (1, 1)
+
+    # Saving through storage is picked up by the next lookup
+    ArtifactStorage(tmp_path).save_artifact(_artifact("Token", bytecode="0x60806040"))
+    assert Contract.from_storage("Token", tmp_path).bytecode == "0x60806040"
@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+import rlp
+from eth_utils import keccak, to_checksum_address
+from web3 import AsyncWeb3
+from web3.exceptions import Web3RPCError
+
+from evmdeploy.artifacts.model import ContractArtifact
+from evmdeploy.contract import Contract
+from evmdeploy.deployer.async_deployer import AsyncDeployer
+from evmdeploy.deployer.nonce import AsyncNonceManager
+from evmdeploy.deployer.receipts import AsyncReceiptTracker
+from evmdeploy.exceptions import DeploymentError
+from evmdeploy.network import SimulatedChain, SimulatedFaults, SimulatedRPCServer
+
+KEY = "0x" + "00" * 31 + "01"
+
+# Init code returning a 10-byte runtime
+BYTECODE = "0x600a600c600039600a6000f3602a60005260206000f3"
+
+
+def _contract(bytecode: str = BYTECODE) -> Contract:
+    return Contract(ContractArtifact(name="Box", abi=[], bytecode=bytecode, compiler_version="0.8.23", source_hash=""))
+
+
+def _create_address(sender: str, nonce: int) -> str:
+    return to_checksum_address(keccak(rlp.encode([bytes.fromhex(sender[2:]), nonce]))[12:])
+
+
+@pytest.fixture
+def serve():
+    """Serves a SimulatedChain over HTTP and returns a factory for AsyncWeb3 clients."""
+    servers = []
+
+    def start(**chain_kwargs):
+        chain = SimulatedChain(seed=7, **chain_kwargs)
+        server = SimulatedRPCServer(chain)
+        url = server.__enter__()
+        servers.append(server)
+        return chain, lambda: AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(url))
+
+    yield start
+    for server in servers:
+        server.__exit__(None, None, None)
+
+
+def test_rejected_send_resyncs_and_retries(serve):
+    chain, connect = serve(faults=SimulatedFaults(nonce_too_low=1.0))
+
+    async def run():
+        deployer = AsyncDeployer(connect(), KEY, max_nonce_retries=2)
+        # Every attempt loses its nonce to a competing client, so retries run out
+        with pytest.raises(Exception, match="nonce too low"):
+            await deployer.send_transaction({"data": BYTECODE})
+        assert await deployer.w3.eth.get_transaction_count(deployer.address) == 3
+
+        # Once the competition stops, the same manager sends at the chain's nonce
+        chain.faults.nonce_too_low = 0.0
+        tx_hash = await deployer.send_transaction({"data": BYTECODE})
+        receipt = await deployer.wait_for_receipt(tx_hash, timeout=10)
+        assert receipt["status"] == 1
+        assert await deployer.w3.eth.get_transaction_count(deployer.address) == 4
+
+    asyncio.run(run())
+
+
+def test_deployer_built_outside_the_loop_shares_the_loop_manager(serve):
+    _, connect = serve()
+    w3 = connect()
+    first, second = AsyncDeployer(w3, KEY), AsyncDeployer(w3, KEY)
+
+    async def run():
+        assert first.nonce_manager is second.nonce_manager
+        hashes = [await d.send_transaction({"data": BYTECODE}) for d in (first, second)]
+        return await first.wait_for_receipts(hashes, timeout=10)
+
+    assert [r["status"] for r in asyncio.run(run())] == [1, 1]
+
+
+def test_concurrent_reservations_are_distinct(serve):
+    _, connect = serve()
+
+    async def run():
+        manager = AsyncNonceManager(connect(), AsyncDeployer(connect(), KEY).address)
+        # The first reservations all race the initial sync
+        first = await asyncio.gather(*(manager.reserve() for _ in range(5)))
+        manager.release(first[2])
+        return first, await asyncio.gather(*(manager.reserve() for _ in range(2)))
+
+    first, then = asyncio.run(run())
+    assert sorted(first) == [0, 1, 2, 3, 4]
+    assert sorted(then) == [2, 5]
+
+
+def test_concurrent_deploy_async_uses_distinct_nonces(serve):
+    _, connect = serve(block_time=0.05)
+    w3 = connect()
+    address = AsyncDeployer(w3, KEY).address
+
+    async def run():
+        return await asyncio.gather(*(_contract().deploy_async(w3, KEY) for _ in range(6)))
+
+    results = asyncio.run(run())
+    assert [r.receipt["status"] for r in results] == [1] * 6
+    # CREATE addresses derive from the sender's nonce
+    assert {r.contract_address for r in results} == {_create_address(address, n) for n in range(6)}
+
+
+def test_nonce_of_a_send_rejected_before_broadcast_is_reused(serve):
+    # Gas estimation fails for init code this large
+    _, connect = serve(block_gas_limit=1_000_000)
+    w3 = connect()
+    address = AsyncDeployer(w3, KEY).address
+
+    async def run():
+        with pytest.raises(Web3RPCError, match="gas required exceeds allowance"):
+            await _contract("0x" + "60" * 8000).deploy_async(w3, KEY)
+        return await _contract().deploy_async(w3, KEY)
+
+    result = asyncio.run(run())
+    assert result.receipt["status"] == 1
+    assert result.contract_address == _create_address(address, 0)
+
+
+def test_tracker_waits_for_receipts_and_times_out(serve):
+    _, connect = serve(block_time=0.1)
+
+    async def run():
+        deployer = AsyncDeployer(connect(), KEY)
+        tracker = AsyncReceiptTracker(deployer.w3, block_time=0.1)
+        hashes = [await deployer.send_transaction({"data": BYTECODE}) for _ in range(3)]
+        receipts = await tracker.wait(hashes, timeout=10)
+
+        with pytest.raises(DeploymentError, match="Timed out"):
+            await tracker.track("0x" + "ab" * 32, timeout=0.3)
+        return hashes, receipts
+
+    hashes, receipts = asyncio.run(run())
+    assert [r["status"] for r in receipts] == [1] * 3
+    assert [r["transactionHash"].hex() for r in receipts] == [h.removeprefix("0x") for h in hashes]
@@ -0,0 +1,26 @@
+import pytest
+from solcx import get_installed_solc_versions
+
+from evmdeploy.cli.main import main
+
+SOLC_VERSION = "0.8.23"
+
+requires_solc = pytest.mark.skipif(
+    SOLC_VERSION not in {str(v) for v in get_installed_solc_versions()},
+    reason=f"solc {SOLC_VERSION} is not installed",
+)
+
+
+@requires_solc
+def test_build_rejects_duplicate_contract_names(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for directory in ("a", "b"):
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "Token.sol").write_text("pragma solidity ^0.8.0;\ncontract Token {}\n")
+
+    with pytest.raises(SystemExit, match=r"Token \(a/Token.sol:Token, b/Token.sol:Token\)"):
+        main(["build", "*/Token.sol", "--solc-version", SOLC_VERSION, "--out", "out"])
+    assert not (tmp_path / "out").exists()
+
+    assert main(["build", "a/Token.sol", "--solc-version", SOLC_VERSION, "--out", "out"]) == 0
+    assert (tmp_path / "out" / "Token.json").exists()
@@ -0,0 +1,54 @@
+import pytest
+from solcx import get_installed_solc_versions
+
+from evmdeploy.compiler.cache import CompilationCache
+from evmdeploy.compiler.solidity import SolidityCompiler
+from evmdeploy.tracing import tracing
+
+SOLC_VERSION = "0.8.23"
+
+requires_solc = pytest.mark.skipif(
+    SOLC_VERSION not in {str(v) for v in get_installed_solc_versions()},
+    reason=f"solc {SOLC_VERSION} is not installed",
+)
+
+
+def test_key_covers_sources_and_settings():
+    sources = {"A.sol": "contract A {}", "Lib.sol": "library L {}"}
+    settings = {"solc_version": SOLC_VERSION, "optimizer": True, "runs": 200}
+    key = CompilationCache.compute_key(sources, settings)
+
+    assert CompilationCache.compute_key(dict(reversed(list(sources.items()))), dict(settings)) == key
+    assert CompilationCache.compute_key({**sources, "Lib.sol": "library L { }"}, settings) != key
+    assert CompilationCache.compute_key({**sources, "Lib.sol": None}, settings) != key
+    assert CompilationCache.compute_key(sources, {**settings, "runs": 1}) != key
+
+
+@requires_solc
+def test_cache_hits_until_source_or_settings_change(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "Lib.sol").write_text("pragma solidity ^0.8.0;\nlibrary Lib {}\n")
+    (tmp_path / "Token.sol").write_text('pragma solidity ^0.8.0;\nimport "./Lib.sol";\ncontract Token {}\n')
+
+    spans = []
+
+    def compile_with(**settings):
+        compiler = SolidityCompiler(solc_version=SOLC_VERSION, cache_dir=tmp_path / "cache", **settings)
+        spans.clear()
+        with tracing(spans.append):
+            artifacts = compiler.compile("Token.sol")
+        hits = [s.attributes["hit"] for s in spans if s.name == "compile.cache"]
+        return artifacts, hits
+
+    first, hits = compile_with()
+    assert hits == [False]
+    again, hits = compile_with()
+    assert hits == [True]
+    assert again == first
+
+    # Any change in the import closure or the settings misses
+    (tmp_path / "Lib.sol").write_text("pragma solidity ^0.8.0;\nlibrary Lib { }\n")
+    assert compile_with()[1] == [False]
+    assert compile_with()[1] == [True]
+    assert compile_with(runs=1)[1] == [False]
+    assert compile_with(optimizer=False)[1] == [False]
@@ -0,0 +1,66 @@
+import pytest
+from eth_abi import encode
+
+from evmdeploy.encoding.constructor import ConstructorEncoder, encode_constructor_args
+
+
+def _abi(*inputs):
+    return [{"type": "constructor", "inputs": list(inputs)}, {"type": "function", "name": "f", "inputs": []}]
+
+
+def _input(name, abi_type, components=None):
+    param = {"name": name, "type": abi_type}
+    if components is not None:
+        param["components"] = components
+    return param
+
+
+ROUND_TRIPS = [
+    (["address", "uint256"], ["0x" + "11" * 20, 10**18]),
+    (["string", "string", "uint8"], ["Token", "TOK", 18]),
+    (["bytes", "bytes32", "bool"], [b"\x01\x02\x03", b"\xff" * 32, True]),
+    (["int256", "uint256[]"], [-1, [1, 2, 3]]),
+    (["address[2]", "string[]"], [["0x" + "22" * 20, "0x" + "33" * 20], ["a", "", "ccc"]]),
+    (["(address,uint256)", "(string,uint256[])[]"], [("0x" + "44" * 20, 7), [("x", [1]), ("y", [])]]),
+]
+
+
+@pytest.mark.parametrize("types, values", ROUND_TRIPS)
+def test_matches_eth_abi(types, values):
+    abi = _abi(*(_input(f"p{i}", t) for i, t in enumerate(types)))
+    assert encode_constructor_args(abi, *values) == encode(types, values)
+
+
+def test_tuple_components_match_eth_abi():
+    order = _input("order", "tuple", [_input("maker", "address"), _input("amounts", "uint256[]")])
+    orders = _input("orders", "tuple[]", [_input("id", "uint64"), _input("memo", "string")])
+    encoder = ConstructorEncoder(_abi(order, orders))
+
+    assert encoder.types == ("(address,uint256[])", "(uint64,string)[]")
+    values = [("0x" + "55" * 20, [1, 2]), [(1, "one"), (2, "two")]]
+    assert encoder.encode(*values) == encode(list(encoder.types), values)
+
+
+def test_keyword_args_follow_abi_order():
+    encoder = ConstructorEncoder(_abi(_input("name", "string"), _input("supply", "uint256")))
+    expected = encode(["string", "uint256"], ["Token", 100])
+
+    assert encoder.encode(supply=100, name="Token") == expected
+    assert encoder.encode_many([["Token", 100], {"supply": 100, "name": "Token"}]) == [expected, expected]
+
+
+def test_no_constructor():
+    assert encode_constructor_args([]) == b""
+    with pytest.raises(ValueError, match="no constructor"):
+        encode_constructor_args([], 1)
+
+
+def test_argument_errors():
+    encoder = ConstructorEncoder(_abi(_input("owner", "address"), _input("", "uint256")))
+
+    with pytest.raises(ValueError, match="Wrong number"):
+        encoder.encode("0x" + "11" * 20)
+    with pytest.raises(ValueError, match="unnamed"):
+        encoder.encode(owner="0x" + "11" * 20)
+    with pytest.raises(ValueError, match="Failed to ABI-encode"):
+        encoder.encode("not an address", 1)
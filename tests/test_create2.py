@@ -0,0 +1,76 @@
+import pytest
+
+from evmdeploy.utils.create2 import compute_create2_address, compute_create2_addresses, normalize_salt
+
+# Examples from EIP-1014: (deployer, salt, init_code, address)
+EIP1014_VECTORS = [
+    (
+        "0x0000000000000000000000000000000000000000",
+        "0x0000000000000000000000000000000000000000000000000000000000000000",
+        "0x00",
+        "0x4D1A2e2bB4F88F0250f26Ffff098B0b30B26BF38",
+    ),
+    (
+        "0xdeadbeef00000000000000000000000000000000",
+        "0x0000000000000000000000000000000000000000000000000000000000000000",
+        "0x00",
+        "0xB928f69Bb1D91Cd65274e3c79d8986362984fDA3",
+    ),
+    (
+        "0xdeadbeef00000000000000000000000000000000",
+        "0x000000000000000000000000feed000000000000000000000000000000000000",
+        "0x00",
+        "0xD04116cDd17beBE565EB2422F2497E06cC1C9833",
+    ),
+    (
+        "0x0000000000000000000000000000000000000000",
+        "0x0000000000000000000000000000000000000000000000000000000000000000",
+        "0xdeadbeef",
+        "0x70f2b2914A2a4b783FaEFb75f459A580616Fcb5e",
+    ),
+    (
+        "0x00000000000000000000000000000000deadbeef",
+        "0x00000000000000000000000000000000000000000000000000000000cafebabe",
+        "0xdeadbeef",
+        "0x60f3f640a8508fC6a86d45DF051962668E1e8AC7",
+    ),
+    (
+        "0x00000000000000000000000000000000deadbeef",
+        "0x00000000000000000000000000000000000000000000000000000000cafebabe",
+        "0x" + "deadbeef" * 11,
+        "0x1d8bfDC5D46DC4f61D6b6115972536eBE6A8854C",
+    ),
+    (
+        "0x0000000000000000000000000000000000000000",
+        "0x0000000000000000000000000000000000000000000000000000000000000000",
+        "0x",
+        "0xE33C0C7F7df4809055C3ebA6c09CFe4BaF1BD9e0",
+    ),
+]
+
+
+@pytest.mark.parametrize("deployer, salt, init_code, expected", EIP1014_VECTORS)
+def test_eip1014_vectors(deployer, salt, init_code, expected):
+    assert compute_create2_address(deployer, salt, init_code) == expected
+
+
+@pytest.mark.parametrize("deployer, salt, init_code, expected", EIP1014_VECTORS)
+def test_eip1014_vectors_from_bytes(deployer, salt, init_code, expected):
+    code = bytes.fromhex(init_code[2:])
+    assert compute_create2_address(deployer, bytes.fromhex(salt[2:]), code) == expected
+    assert compute_create2_address(deployer, int(salt, 16), bytearray(code)) == expected
+
+
+def test_bulk_matches_single():
+    deployer, salt, init_code, _ = EIP1014_VECTORS[5]
+    code = bytes.fromhex(init_code[2:])
+    deployments = [(i, init_code) for i in range(5)] + [(i, bytearray(code)) for i in range(5)]
+    addresses = compute_create2_addresses(deployer, deployments)
+    assert addresses[:5] == addresses[5:]
+    assert addresses[:5] == [compute_create2_address(deployer, i, code) for i in range(5)]
+
+
+def test_salt_must_be_32_bytes():
+    with pytest.raises(ValueError):
+        normalize_salt("0x1234")
+    assert normalize_salt(1) == b"\x00" * 31 + b"\x01"
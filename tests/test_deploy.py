@@ -0,0 +1,86 @@
+import gc
+import threading
+import time
+import weakref
+
+import pytest
+from web3 import Web3
+
+from evmdeploy.deployer.deployer import Deployer
+from evmdeploy.deployer.nonce import get_nonce_manager
+from evmdeploy.deployer.prepare import prepare_transaction
+from evmdeploy.network import SimulatedChain, SimulatedFaults, SimulatedProvider
+
+KEY = "0x" + "00" * 31 + "01"
+
+# Init code returning a 10-byte runtime
+BYTECODE = "0x600a600c600039600a6000f3602a60005260206000f3"
+
+
+def _deployer(faults: SimulatedFaults, **kwargs) -> Deployer:
+    chain = SimulatedChain(seed=7, faults=faults)
+    return Deployer(Web3(SimulatedProvider(chain)), KEY, **kwargs)
+
+
+def test_nonce_too_low_is_retried_with_a_fresh_nonce():
+    deployer = _deployer(SimulatedFaults(nonce_too_low=0.5), max_nonce_retries=10)
+
+    tx_hashes = [deployer.send_transaction({"data": BYTECODE}) for _ in range(5)]
+    receipts = deployer.wait_for_receipts(tx_hashes, timeout=10)
+
+    assert [r["status"] for r in receipts] == [1] * 5
+    assert all(deployer.w3.eth.get_code(r["contractAddress"]) for r in receipts)
+    # Competing transactions consumed some nonces, and every send moved past them
+    on_chain = deployer.w3.eth.get_transaction_count(deployer.address)
+    assert on_chain > 5
+    assert deployer.get_nonce() == on_chain
+
+
+def test_nonce_retries_are_bounded():
+    deployer = _deployer(SimulatedFaults(nonce_too_low=1.0), max_nonce_retries=2)
+
+    with pytest.raises(Exception, match="nonce too low"):
+        deployer.send_transaction({"data": BYTECODE})
+    # One nonce per attempt was taken by the competing client
+    assert deployer.w3.eth.get_transaction_count(deployer.address) == 3
+
+
+def test_already_known_broadcast_returns_the_hash():
+    deployer = _deployer(SimulatedFaults())
+    tx = {"data": BYTECODE, "nonce": 0}
+    prepare_transaction(deployer.w3, tx)
+    signed = deployer.signer.sign(dict(tx))
+    deployer.w3.eth.send_raw_transaction(signed.raw_transaction)
+
+    # Re-sending the identical transaction is not a nonce conflict
+    assert deployer.send_transaction(dict(tx)) == deployer.w3.to_hex(signed.hash)
+
+
+def test_get_nonce_reads_without_reserving():
+    deployer = _deployer(SimulatedFaults())
+
+    assert deployer.get_nonce() == deployer.get_nonce() == 0
+    tx_hash = deployer.send_transaction({"data": BYTECODE})
+    # No gap was left by the reads: the send used nonce 0 and was mined
+    assert deployer.wait_for_receipt(tx_hash, timeout=10)["status"] == 1
+    assert deployer.get_nonce() == 1
+    assert deployer.reserve_nonce() == 1
+
+
+def test_shared_deployer_state_is_released_with_its_provider():
+    providers = []
+    for _ in range(5):
+        deployer = _deployer(SimulatedFaults())
+        assert get_nonce_manager(deployer.w3, deployer.address) is deployer.nonce_manager
+        deployer.wait_for_receipt(deployer.send_transaction({"data": BYTECODE}), timeout=10)
+        providers.append(weakref.ref(deployer.w3.provider))
+    del deployer
+    # web3's Method descriptors remember the last Web3 they were used through
+    spare = _deployer(SimulatedFaults())
+    spare.wait_for_receipt(spare.send_transaction({"data": BYTECODE}), timeout=10)
+
+    # Polling threads exit once their last receipt is in
+    while any(t.name == "evmdeploy-receipts" for t in threading.enumerate()):
+        time.sleep(0.01)
+    gc.collect()
+    assert [ref() for ref in providers] == [None] * 5
@@ -0,0 +1,97 @@
+import asyncio
+import gc
+import weakref
+
+from web3 import AsyncWeb3, Web3
+
+from evmdeploy.deployer.gas import FeeOracle, get_async_fee_oracle, get_fee_oracle
+from evmdeploy.network import SimulatedChain, SimulatedProvider
+from evmdeploy.network.simulated import RPCError
+
+
+def _chain_with_fee_history(results):
+    """A chain whose eth_feeHistory replays `results`: an exception is raised, None delegates."""
+    chain = SimulatedChain(seed=1)
+    original = chain._rpc_eth_feeHistory
+    calls = []
+
+    def fee_history(*args):
+        result = results[len(calls)] if len(calls) < len(results) else None
+        calls.append(args)
+        if isinstance(result, Exception):
+            raise result
+        return original(*args) if result is None else result
+
+    chain._rpc_eth_feeHistory = fee_history
+    return chain, calls
+
+
+def test_transient_fee_history_error_falls_back_to_gas_price_once():
+    chain, calls = _chain_with_fee_history([RPCError("internal error", code=-32603)])
+    w3 = Web3(SimulatedProvider(chain))
+    oracle = FeeOracle(w3, max_age=0)
+
+    assert oracle.fees() == {"gasPrice": w3.eth.gas_price}
+    # Not cached and not treated as a legacy chain
+    assert oracle.eip1559 is None
+    fees = oracle.fees()
+    assert set(fees) == {"maxFeePerGas", "maxPriorityFeePerGas"}
+    assert oracle.eip1559 is True
+    assert len(calls) == 2
+
+
+def test_estimate_is_reused_until_a_new_block():
+    chain, calls = _chain_with_fee_history([])
+    oracle = FeeOracle(Web3(SimulatedProvider(chain)), max_age=0)
+
+    oracle.fees()
+    head = oracle.block_number
+    oracle.fees()
+    oracle.fees(urgency="urgent")
+    assert len(calls) == 1
+
+    chain.mine()
+    oracle.fees()
+    assert len(calls) == 2
+    assert oracle.block_number == head + 1
+
+
+def test_history_without_base_fees_switches_to_legacy_pricing():
+    legacy = {"oldestBlock": "0x0", "baseFeePerGas": ["0x0", "0x0"], "gasUsedRatio": [0.0], "reward": [["0x0"]]}
+    chain, calls = _chain_with_fee_history([legacy])
+    w3 = Web3(SimulatedProvider(chain))
+    oracle = FeeOracle(w3, max_age=0)
+
+    assert oracle.fees() == {"gasPrice": w3.eth.gas_price}
+    assert oracle.eip1559 is False
+    chain.mine()
+    assert oracle.fees() == {"gasPrice": w3.eth.gas_price}
+    assert len(calls) == 1
+
+
+def test_shared_oracle_is_released_with_its_provider():
+    providers = []
+    for _ in range(5):
+        w3 = Web3(SimulatedProvider(SimulatedChain(seed=1)))
+        oracle = get_fee_oracle(w3)
+        oracle.fees()
+        assert get_fee_oracle(w3) is oracle
+        providers.append(weakref.ref(w3.provider))
+    del w3, oracle
+    # web3's Method descriptors remember the last Web3 they were used through
+    FeeOracle(Web3(SimulatedProvider(SimulatedChain(seed=1)))).fees()
+
+    gc.collect()
+    assert [ref() for ref in providers] == [None] * 5
+
+
+def test_async_oracle_is_shared_per_event_loop():
+    w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider("http://127.0.0.1:1"))
+
+    async def oracles():
+        return get_async_fee_oracle(w3), get_async_fee_oracle(w3)
+
+    first, again = asyncio.run(oracles())
+    assert first is again
+    # A new loop gets its own oracle: the old one's lock belongs to a closed loop
+    assert asyncio.run(oracles())[0] is not first
@@ -0,0 +1,59 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+# Cold `import evmdeploy` must stay well below the cost of importing web3
+# (about a second on its own).
+IMPORT_BUDGET_SECONDS = 0.2
+
+HEAVY_MODULES = ["web3", "solcx", "eth_account", "eth_abi"]
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _run(code: str) -> dict:
+    """Runs `code` in a fresh interpreter and returns the JSON it prints."""
+    out = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True, cwd=REPO_ROOT
+    )
+    return json.loads(out.stdout)
+
+
+def _loaded_after(statements: str) -> dict:
+    return _run(
+        "import json, sys, time\n"
+        "t = time.perf_counter()\n"
+        f"{statements}\n"
+        "elapsed = time.perf_counter() - t\n"
+        f"print(json.dumps({{'elapsed': elapsed, 'loaded': [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))"
+    )
+
+
+def test_cold_import_within_budget():
+    result = _loaded_after("import evmdeploy")
+    assert result["elapsed"] < IMPORT_BUDGET_SECONDS
+    assert result["loaded"] == []
+
+
+def test_artifact_storage_does_not_import_web3():
+    result = _loaded_after("from evmdeploy import ArtifactStorage, DeploymentResult")
+    assert result["loaded"] == []
+
+
+def test_encode_constructor_args_only_imports_eth_abi():
+    result = _loaded_after("from evmdeploy import encode_constructor_args")
+    assert result["loaded"] == ["eth_abi"]
+
+
+def test_cli_module_does_not_import_web3():
+    result = _loaded_after("import evmdeploy.cli.main")
+    assert result["loaded"] == []
+
+
+def test_public_names_resolve():
+    import evmdeploy
+
+    for name in evmdeploy.__all__:
+        assert getattr(evmdeploy, name) is not None
+    assert set(evmdeploy.__all__) <= set(dir(evmdeploy))
@@ -0,0 +1,56 @@
+import pytest
+from solcx import get_installed_solc_versions
+
+from evmdeploy.artifacts.storage import ArtifactStorage
+from evmdeploy.compiler.incremental import IncrementalBuilder
+from evmdeploy.compiler.solidity import SolidityCompiler
+from evmdeploy.exceptions import CompilationError
+
+SOLC_VERSION = "0.8.23"
+
+pytestmark = pytest.mark.skipif(
+    SOLC_VERSION not in {str(v) for v in get_installed_solc_versions()},
+    reason=f"solc {SOLC_VERSION} is not installed",
+)
+
+
+@pytest.fixture
+def builder(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return IncrementalBuilder(SolidityCompiler(solc_version=SOLC_VERSION), ArtifactStorage(tmp_path / "out"))
+
+
+def _stored(builder):
+    return sorted(p.stem for p in builder.storage.base_path.glob("*.json") if not p.name.startswith("."))
+
+
+def test_same_named_contracts_are_rejected_before_saving(tmp_path, builder):
+    (tmp_path / "A.sol").write_text("contract Token {}\n")
+    assert list(builder.build("*.sol")) == ["A.sol:Token"]
+
+    # The clash spans a clean root and a new one
+    (tmp_path / "B.sol").write_text("contract Token {}\ncontract Other {}\n")
+    with pytest.raises(CompilationError, match=r"Token \(A.sol:Token, B.sol:Token\)"):
+        builder.build("*.sol")
+    assert _stored(builder) == ["Token"]
+
+    # Nothing was recorded, so the next build retries B.sol
+    (tmp_path / "B.sol").write_text("contract Other {}\n")
+    assert list(builder.build("*.sol")) == ["B.sol:Other"]
+    assert _stored(builder) == ["Other", "Token"]
+
+
+def test_artifacts_of_removed_roots_and_contracts_are_deleted(tmp_path, builder):
+    (tmp_path / "A.sol").write_text("contract A {}\ncontract Helper {}\n")
+    (tmp_path / "B.sol").write_text("contract B {}\n")
+    builder.build("*.sol")
+    assert _stored(builder) == ["A", "B", "Helper"]
+
+    (tmp_path / "B.sol").rename(tmp_path / "C.sol")
+    (tmp_path / "A.sol").write_text("contract A {}\n")
+    assert sorted(builder.build("*.sol")) == ["A.sol:A", "C.sol:B"]
+    assert _stored(builder) == ["A", "B"]
+
+    (tmp_path / "C.sol").unlink()
+    assert builder.build("*.sol") == {}
+    assert _stored(builder) == ["A"]
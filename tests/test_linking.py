@@ -0,0 +1,81 @@
+import pytest
+
+from evmdeploy.artifacts.model import ContractArtifact
+from evmdeploy.compiler.linker import LinkPlan, link_artifact, link_bytecode
+from evmdeploy.exceptions import LinkingError
+
+MATH = "0x" + "aa" * 20
+STRINGS = "0x" + "bb" * 20
+OTHER_MATH = "0x" + "cc" * 20
+
+
+def _placeholder(tag: str) -> str:
+    return "__$" + tag * 34 + "$__"
+
+
+# PUSH20 <Math> ... PUSH20 <Strings> PUSH20 <Math>; placeholders at bytes 3, 26 and 47
+BYTECODE = "6080" + "73" + _placeholder("1") + "6000" + "73" + _placeholder("2") + "73" + _placeholder("1") + "00"
+LINK_REFS = {
+    "contracts/Math.sol": {"Math": [{"start": 3, "length": 20}, {"start": 47, "length": 20}]},
+    "contracts/Strings.sol": {"Strings": [{"start": 26, "length": 20}]},
+}
+
+
+def _expected(math: str, strings: str) -> bytes:
+    return bytes.fromhex("6080" + "73" + math[2:] + "6000" + "73" + strings[2:] + "73" + math[2:] + "00")
+
+
+def test_template_zeroes_every_placeholder():
+    plan = LinkPlan(BYTECODE, LINK_REFS)
+
+    assert plan.slots == {
+        "contracts/Math.sol:Math": [(3, 23), (47, 67)],
+        "contracts/Strings.sol:Strings": [(26, 46)],
+    }
+    assert plan.template == _expected("0x" + "00" * 20, "0x" + "00" * 20)
+    assert plan.libraries == ["contracts/Math.sol:Math", "contracts/Strings.sol:Strings"]
+
+
+def test_links_multiple_libraries_at_their_offsets():
+    plan = LinkPlan("0x" + BYTECODE, LINK_REFS)
+
+    linked = plan.link({"contracts/Math.sol:Math": MATH, "Strings": STRINGS})
+    assert linked == _expected(MATH, STRINGS)
+    # The template is reused, not modified
+    assert plan.link({"Math": OTHER_MATH, "Strings": STRINGS, "Unused": MATH}) == _expected(OTHER_MATH, STRINGS)
+    assert link_bytecode(BYTECODE, LINK_REFS, {"Math": MATH, "Strings": STRINGS}) == "0x" + linked.hex()
+
+
+def test_same_named_libraries_need_qualified_keys():
+    refs = {
+        "contracts/Math.sol": {"Math": [{"start": 3, "length": 20}, {"start": 47, "length": 20}]},
+        "vendor/Math.sol": {"Math": [{"start": 26, "length": 20}]},
+    }
+    plan = LinkPlan(BYTECODE, refs)
+
+    with pytest.raises(LinkingError, match="Missing library address"):
+        plan.link({"Math": MATH})
+    linked = plan.link({"contracts/Math.sol:Math": MATH, "vendor/Math.sol:Math": OTHER_MATH})
+    assert linked == _expected(MATH, OTHER_MATH)
+
+
+def test_link_errors():
+    plan = LinkPlan(BYTECODE, LINK_REFS)
+
+    with pytest.raises(LinkingError) as missing:
+        plan.link({"Math": MATH})
+    assert missing.value.library_name == "contracts/Strings.sol:Strings"
+    with pytest.raises(LinkingError, match="Invalid library address"):
+        plan.link({"Math": MATH, "Strings": "0x1234"})
+    with pytest.raises(LinkingError, match="not covered"):
+        LinkPlan(BYTECODE, {"contracts/Math.sol": LINK_REFS["contracts/Math.sol"]})
+
+
+def test_link_artifact_clears_references():
+    artifact = ContractArtifact("Vault", [], BYTECODE, "0.8.23", "hash", link_references=LINK_REFS)
+    assert artifact.qualified_libraries == ["contracts/Math.sol:Math", "contracts/Strings.sol:Strings"]
+
+    linked = link_artifact(artifact, {"Math": MATH, "Strings": STRINGS})
+    assert linked.bytecode == "0x" + _expected(MATH, STRINGS).hex()
+    assert linked.link_references == {}
+    assert link_artifact(linked, {}) is linked
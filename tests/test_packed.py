@@ -0,0 +1,50 @@
+import pytest
+
+from evmdeploy.artifacts.model import ContractArtifact
+from evmdeploy.artifacts.packed import PackedArtifactStorage
+
+TOKEN = ContractArtifact(
+    name="Token",
+    abi=[{"type": "function", "name": "totalSupply", "inputs": [], "outputs": [{"type": "uint256"}]}],
+    bytecode="0x6080604052",
+    compiler_version="0.8.23",
+    source_hash="ab" * 32,
+    extra_outputs={"storageLayout": '{"storage":[]}'},
+)
+# Unlinked library placeholders are not hex and are stored as text
+VAULT = ContractArtifact(
+    name="Vault",
+    abi=[],
+    bytecode="0x6080604052" + "73__$" + "a" * 34 + "$__",
+    compiler_version="0.8.23",
+    source_hash="cd" * 32,
+    link_references={"Vault.sol": {"L": [{"start": 6, "length": 20}]}},
+)
+
+
+def test_round_trip(tmp_path):
+    storage = PackedArtifactStorage(tmp_path / "artifacts.pack")
+    storage.save_artifacts({"Token.sol:Token": TOKEN})
+    storage.save_artifact(VAULT)
+
+    assert storage.load_artifacts() == {"Token": TOKEN, "Vault": VAULT}
+    assert PackedArtifactStorage(tmp_path / "artifacts.pack").load_artifact("Vault") == VAULT
+    assert storage.load_artifacts([]) == {}
+    with pytest.raises(FileNotFoundError, match="Missing"):
+        storage.load_artifact("Missing")
+
+
+def test_reader_sees_its_snapshot_until_reload(tmp_path):
+    writer = PackedArtifactStorage(tmp_path / "artifacts.pack")
+    writer.save_artifact(TOKEN)
+    reader = PackedArtifactStorage(tmp_path / "artifacts.pack")
+    assert reader.names() == ["Token"]
+
+    # The writer replaces the file; the reader keeps the version it mapped
+    writer.save_artifact(VAULT)
+    assert reader.names() == ["Token"]
+    assert reader.load_artifact("Token") == TOKEN
+
+    reader.reload()
+    assert sorted(reader.names()) == ["Token", "Vault"]
+    assert reader.load_artifact("Vault") == VAULT
@@ -0,0 +1,77 @@
+import pytest
+from web3 import Web3
+
+from evmdeploy import DeploymentPlan
+from evmdeploy.artifacts.model import ContractArtifact
+from evmdeploy.exceptions import DeploymentError
+from evmdeploy.network import SimulatedChain, SimulatedProvider
+
+KEY = "0x" + "00" * 31 + "01"
+
+# Init code returning a 10-byte runtime
+BYTECODE = "0x600a600c600039600a6000f3602a60005260206000f3"
+
+
+def _artifact(name: str = "Box", bytecode: str = BYTECODE) -> ContractArtifact:
+    return ContractArtifact(name, [], bytecode, "0.8.23", "hash")
+
+
+def _w3(**chain_kwargs) -> Web3:
+    return Web3(SimulatedProvider(SimulatedChain(seed=1, **chain_kwargs)))
+
+
+def test_create2_dependent_waits_a_wave_unless_gas_is_given():
+    plan = DeploymentPlan()
+    plan.add("Base", _artifact(), salt=1)
+    plan.add("Estimated", _artifact(), salt=2, depends_on=["Base"])
+    plan.add("Fixed", _artifact(), salt=3, depends_on=["Base"], gas=200_000)
+    plan.add("Create", _artifact(), depends_on=["Base"])
+
+    assert plan.waves() == [["Base", "Fixed"], ["Estimated", "Create"]]
+
+
+def test_create2_plan_deploys_to_precomputed_addresses():
+    w3 = _w3()
+    plan = DeploymentPlan()
+    plan.add("Base", _artifact(), salt=1)
+    plan.add("Fixed", _artifact(), salt=2, depends_on=["Base"], gas=200_000)
+    plan.add("Create", _artifact(), depends_on=["Base"])
+    expected = plan.create2_addresses()
+    assert set(expected) == {"Base", "Fixed"}
+
+    results = plan.execute(w3, KEY)
+    for name, address in expected.items():
+        assert results[name].contract_address == address
+        assert results[name].receipt["status"] == 1
+        assert w3.eth.get_code(address)
+    assert w3.eth.get_code(results["Create"].contract_address)
+
+    # Running again skips the CREATE2 nodes that are already deployed
+    again = DeploymentPlan()
+    again.add("Base", _artifact(), salt=1)
+    rerun = again.execute(w3, KEY)
+    assert rerun["Base"].skipped
+    assert rerun["Base"].contract_address == expected["Base"]
+
+
+def test_failed_send_stops_the_wave_and_resumes():
+    w3 = _w3(block_gas_limit=1_000_000)
+    plan = DeploymentPlan()
+    for name in "abc":
+        plan.add(name, _artifact())
+    # Gas estimation fails: the init code needs more than a block's gas
+    plan.add("big", _artifact("Big", "0x" + "60" * 8000))
+    for name in "de":
+        plan.add(name, _artifact())
+
+    results = {}
+    with pytest.raises(DeploymentError, match="not sent: d, e"):
+        plan.execute(w3, KEY, results=results, timeout=10)
+    assert sorted(results) == ["a", "b", "c"]
+
+    # Nonces of the unsent nodes were released, so a rerun fills them in order
+    plan.nodes["big"].contract = plan.nodes["a"].contract
+    results = plan.execute(w3, KEY, results=results, timeout=10)
+    assert sorted(results) == ["a", "b", "big", "c", "d", "e"]
+    assert all(r.receipt["status"] == 1 for r in results.values())
+    assert w3.eth.get_transaction_count(w3.eth.account.from_key(KEY).address) == 6
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+from web3 import Web3
+from web3.exceptions import Web3RPCError
+
+from evmdeploy.deployer.gas import get_fee_oracle
+from evmdeploy.deployer.prepare import prepare_transaction
+from evmdeploy.network import SimulatedChain, SimulatedProvider
+
+# Init code returning a 10-byte runtime
+BYTECODE = "0x600a600c600039600a6000f3602a60005260206000f3"
+
+
+class RecordingProvider(SimulatedProvider):
+    """Records the methods of every round trip: one list per request or batch."""
+
+    def __init__(self, chain: SimulatedChain):
+        super().__init__(chain)
+        self.round_trips = []
+
+    def _roundtrip(self, request_data: bytes):
+        request = json.loads(request_data)
+        self.round_trips.append([r["method"] for r in request] if isinstance(request, list) else [request["method"]])
+        return super()._roundtrip(request_data)
+
+
+def _prepare(w3: Web3):
+    w3.provider.round_trips.clear()
+    prepare_transaction(w3, {"data": BYTECODE})
+    return w3.provider.round_trips
+
+
+def test_prepare_costs_one_round_trip_per_head():
+    chain = SimulatedChain(seed=1)
+    w3 = Web3(RecordingProvider(chain))
+    # Always revalidate the cached estimate
+    get_fee_oracle(w3).max_age = 0
+
+    assert _prepare(w3) == [["eth_chainId", "eth_estimateGas", "eth_feeHistory"]]
+    assert _prepare(w3) == [["eth_estimateGas", "eth_blockNumber"]]
+
+    # A moved head only adds the fee history, not a second eth_blockNumber
+    chain.mine()
+    assert _prepare(w3) == [["eth_estimateGas", "eth_blockNumber"], ["eth_feeHistory"]]
+    assert _prepare(w3) == [["eth_estimateGas", "eth_blockNumber"]]
+
+
+def test_batched_errors_propagate():
+    w3 = Web3(RecordingProvider(SimulatedChain(seed=1, block_gas_limit=1_000_000)))
+
+    with pytest.raises(Web3RPCError, match="gas required exceeds allowance"):
+        prepare_transaction(w3, {"data": "0x" + "60" * 8000})
+    # Raised from the batch, without repeating the calls one by one
+    assert len(w3.provider.round_trips) == 1
@@ -0,0 +1,97 @@
+import asyncio
+import gc
+import threading
+import time
+import weakref
+
+from web3 import AsyncWeb3, Web3
+
+from evmdeploy.crypto.signer import TransactionSigner
+from evmdeploy.deployer.async_deployer import AsyncDeployer
+from evmdeploy.deployer.prepare import prepare_transaction
+from evmdeploy.deployer.receipts import (
+    AsyncReceiptTracker,
+    ReceiptTracker,
+    get_async_receipt_tracker,
+    get_receipt_tracker,
+)
+from evmdeploy.network import SimulatedChain, SimulatedProvider, SimulatedRPCServer
+
+KEY = "0x" + "00" * 31 + "01"
+
+# Init code returning a 10-byte runtime
+BYTECODE = "0x600a600c600039600a6000f3602a60005260206000f3"
+
+SIGNER = TransactionSigner(KEY)
+
+
+def _send(w3: Web3) -> str:
+    tx = {"data": BYTECODE, "nonce": w3.eth.get_transaction_count(SIGNER.address, "pending")}
+    prepare_transaction(w3, tx)
+    return w3.eth.send_raw_transaction(SIGNER.sign(tx).raw_transaction).hex()
+
+
+def test_shared_tracker_is_released_with_its_provider():
+    providers = []
+    for _ in range(5):
+        w3 = Web3(SimulatedProvider(SimulatedChain(seed=1)))
+        tracker = get_receipt_tracker(w3)
+        assert get_receipt_tracker(w3) is tracker
+        assert tracker.track(_send(w3), timeout=10).result()["status"] == 1
+        providers.append(weakref.ref(w3.provider))
+    del w3, tracker
+    # web3's Method descriptors remember the last Web3 they were used through
+    spare = Web3(SimulatedProvider(SimulatedChain(seed=1)))
+    ReceiptTracker(spare).track(_send(spare), timeout=10).result()
+
+    # Polling threads exit once their last receipt is in
+    while any(t.name == "evmdeploy-receipts" for t in threading.enumerate()):
+        time.sleep(0.01)
+    gc.collect()
+    assert [ref() for ref in providers] == [None] * 5
+
+
+def test_async_tracker_works_across_event_loops():
+    with SimulatedRPCServer(SimulatedChain(seed=1, block_time=0.05)) as url:
+        w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(url))
+
+        async def deploy():
+            deployer = AsyncDeployer(w3, KEY)
+            tx_hash = await deployer.send_transaction({"data": BYTECODE})
+            receipt = await deployer.wait_for_receipt(tx_hash, timeout=10)
+            return get_async_receipt_tracker(w3), receipt
+
+        # Each asyncio.run() gets a tracker whose futures and task belong to its loop
+        first, receipt = asyncio.run(deploy())
+        assert receipt["status"] == 1
+        second, receipt = asyncio.run(deploy())
+        assert receipt["status"] == 1
+        assert second is not first
+
+
+def test_tracking_again_keeps_the_later_deadline():
+    # Blocks every 0.5s: nothing is mined within the short timeouts
+    w3 = Web3(SimulatedProvider(SimulatedChain(seed=1, block_time=0.5)))
+    tracker = ReceiptTracker(w3)
+
+    extended, shortened = _send(w3), _send(w3)
+    assert tracker.track(extended, timeout=0.05) is tracker.track(extended, timeout=10)
+    tracker.track(shortened, timeout=10)
+    tracker.track(shortened, timeout=0.05)
+
+    assert [r["status"] for r in tracker.wait([extended, shortened])] == [1, 1]
+
+
+def test_async_tracking_again_keeps_the_later_deadline():
+    with SimulatedRPCServer(SimulatedChain(seed=1, block_time=0.5)) as url:
+        w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(url))
+
+        async def run():
+            deployer = AsyncDeployer(w3, KEY)
+            tracker = AsyncReceiptTracker(w3)
+            tx_hash = await deployer.send_transaction({"data": BYTECODE})
+            short = tracker.track(tx_hash, timeout=0.05)
+            assert tracker.track(tx_hash, timeout=10) is short
+            return await short
+
+        assert asyncio.run(run())["status"] == 1
@@ -0,0 +1,61 @@
+import time
+
+import pytest
+
+from evmdeploy.deployer import salt_miner
+from evmdeploy.deployer.salt_miner import SaltMiner
+from evmdeploy.utils.create2 import DETERMINISTIC_DEPLOYER, compute_create2_address
+
+# Init code returning a 10-byte runtime
+BYTECODE = "0x600a600c600039600a6000f3602a60005260206000f3"
+
+SALT_PREFIX = bytes.fromhex("11" * 20)
+
+_search_range = salt_miner._search_range
+
+
+def _slow_first_chunk(*args):
+    # Lets later chunks finish first; forked workers inherit the patch
+    if args[5] == 0:
+        time.sleep(0.3)
+    return _search_range(*args)
+
+
+def test_mined_salt_reproduces_the_target():
+    miner = SaltMiner(BYTECODE, leading_zero_bytes=1, prefix="A", salt_prefix=SALT_PREFIX)
+    match = miner.mine(workers=1)
+
+    assert match.salt_bytes == SALT_PREFIX + match.salt.to_bytes(12, "big")
+    address = compute_create2_address(DETERMINISTIC_DEPLOYER, match.salt_bytes, BYTECODE)
+    assert address == match.address
+    assert address.lower().startswith("0x00a")
+
+
+def test_parallel_search_finds_the_serial_salt(monkeypatch):
+    # Prefix "8" matches at salts 14 and 17, in the first two 16-salt chunks
+    miner = SaltMiner(BYTECODE, prefix="8")
+    serial = miner.mine(workers=1, chunk_size=16)
+    assert serial.salt == 14
+
+    monkeypatch.setattr(salt_miner, "_search_range", _slow_first_chunk)
+    assert miner.mine(workers=2, chunk_size=16) == serial
+    assert miner.mine(start=15, workers=2, chunk_size=16).salt == 17
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_search_gives_up_after_max_salts(workers):
+    # Eight fixed hex digits: no match is expected within a few thousand salts
+    miner = SaltMiner(BYTECODE, prefix="deadbeef")
+    reports = []
+
+    assert miner.mine(start=100, max_salts=3000, workers=workers, chunk_size=512, progress=reports.append) is None
+    assert reports[-1].checked == 3000
+    # Resuming continues where the search stopped
+    assert reports[-1].next_start == 3100
+
+
+def test_target_must_fit_an_address():
+    with pytest.raises(ValueError, match="longer than an address"):
+        SaltMiner(BYTECODE, leading_zero_bytes=20, prefix="1")
+    with pytest.raises(ValueError, match="salt_prefix"):
+        SaltMiner(BYTECODE, salt_prefix=bytes(25))
@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest
+from solcx import get_installed_solc_versions
+
+from evmdeploy.compiler.scheduler import CompilationScheduler
+from evmdeploy.compiler.solidity import SolidityCompiler
+from evmdeploy.exceptions import CompilationError
+
+VERSIONS = ["0.8.19", "0.8.20", "0.8.23"]
+
+requires_solc = pytest.mark.skipif(
+    not set(VERSIONS) <= {str(v) for v in get_installed_solc_versions()},
+    reason=f"solc {', '.join(VERSIONS)} are not all installed",
+)
+
+
+def _write(root: Path, name: str, pragma: str, imports=()) -> str:
+    lines = [f"pragma solidity {pragma};"] + [f'import "./{i}";' for i in imports]
+    path = root / name
+    path.write_text("\n".join(lines) + f"\ncontract {path.stem} {{}}\n")
+    return str(path)
+
+
+def _group(*paths):
+    scheduler = CompilationScheduler(SolidityCompiler(solc_version="0.8.23"), versions=VERSIONS)
+    groups = scheduler.group(list(paths))
+    return {Path(p).name: version for version, files in groups.items() for p in files}
+
+
+def test_version_satisfies_imported_pragmas(tmp_path):
+    _write(tmp_path, "Pinned.sol", "=0.8.19")
+    root = _write(tmp_path, "Root.sol", "^0.8.0", ["Pinned.sol"])
+    free = _write(tmp_path, "Free.sol", "^0.8.0")
+
+    assert _group(root, free) == {"Root.sol": "0.8.19", "Free.sol": "0.8.23"}
+
+
+def test_roots_sharing_an_import_share_a_group(tmp_path):
+    _write(tmp_path, "Shared.sol", "^0.8.0")
+    a = _write(tmp_path, "A.sol", ">=0.8.19 <0.8.23", ["Shared.sol"])
+    b = _write(tmp_path, "B.sol", "^0.8.0", ["Shared.sol"])
+
+    assert _group(a, b) == {"A.sol": "0.8.20", "B.sol": "0.8.20"}
+
+
+def test_incompatible_roots_sharing_an_import_are_split(tmp_path):
+    _write(tmp_path, "Shared.sol", "^0.8.0")
+    a = _write(tmp_path, "A.sol", "=0.8.19", ["Shared.sol"])
+    b = _write(tmp_path, "B.sol", "=0.8.23", ["Shared.sol"])
+
+    assert _group(a, b) == {"A.sol": "0.8.19", "B.sol": "0.8.23"}
+
+
+def test_unsatisfiable_closure_raises(tmp_path):
+    _write(tmp_path, "Old.sol", "=0.8.19")
+    root = _write(tmp_path, "New.sol", "=0.8.23", ["Old.sol"])
+
+    with pytest.raises(CompilationError, match="Old.sol"):
+        _group(root)
+
+
+@requires_solc
+def test_interface_only_group_compiles_to_nothing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "IToken.sol").write_text("pragma solidity =0.8.19;\ninterface IToken {}\n")
+    token = _write(tmp_path, "Token.sol", "=0.8.23")
+    scheduler = CompilationScheduler(SolidityCompiler(solc_version="0.8.23"), versions=VERSIONS)
+
+    # IToken.sol forms a group of its own, which produces no artifacts
+    assert list(scheduler.compile(["IToken.sol", token])) == ["Token.sol:Token"]
+    with pytest.raises(CompilationError, match="No deployable contracts"):
+        scheduler.compile("IToken.sol")
@@ -0,0 +1,25 @@
+import gc
+
+from evmdeploy.crypto import signer as signer_module
+from evmdeploy.crypto.signer import TransactionSigner, get_signer, sign_transaction
+
+KEY = "0x4c0883a69102937d6231471b5dbb6204fe5129617082792ae468d01a3f362318"
+TX = {"nonce": 0, "gas": 21_000, "gasPrice": 10**9, "chainId": 1, "to": "0x" + "11" * 20, "value": 1}
+
+
+def test_signer_is_shared_only_while_held():
+    held = get_signer(KEY)
+    assert get_signer(KEY) is held
+
+    del held
+    gc.collect()
+    # The cache does not keep the key alive on its own
+    assert KEY not in signer_module._signers
+
+
+def test_signers_agree():
+    expected = sign_transaction(TX, KEY)
+    signer = TransactionSigner(KEY)
+
+    assert signer.sign(TX) == expected
+    assert signer.sign_many([TX, TX], processes=1) == [expected, expected]
@@ -0,0 +1,75 @@
+import asyncio
+import os
+
+import pytest
+
+from evmdeploy.artifacts.model import ContractArtifact
+from evmdeploy.artifacts.storage import ArtifactStorage
+
+NAMES = ["Token", "Vault", "Router", "Pair", "Factory"]
+
+
+def _artifact(name: str, abi=None) -> ContractArtifact:
+    return ContractArtifact(
+        name=name,
+        abi=abi if abi is not None else [{"type": "constructor", "inputs": []}],
+        bytecode="0x6080604052",
+        compiler_version="0.8.23",
+        source_hash=name.encode().hex(),
+        extra_outputs={"storageLayout": '{"storage":[]}'},
+    )
+
+
+def _files(path):
+    return sorted(os.listdir(path))
+
+
+def test_bulk_round_trip(tmp_path):
+    storage = ArtifactStorage(tmp_path / "out")
+    artifacts = {f"{name}.sol:{name}": _artifact(name) for name in NAMES}
+
+    paths = storage.save_artifacts(artifacts)
+    assert paths == {key: tmp_path / "out" / f"{a.name}.json" for key, a in artifacts.items()}
+    assert storage.load_artifacts() == {a.name: a for a in artifacts.values()}
+    assert storage.load_artifacts(["Vault", "Token"]) == {"Vault": _artifact("Vault"), "Token": _artifact("Token")}
+    assert storage.load_artifacts([]) == {}
+
+    async def round_trip():
+        other = ArtifactStorage(tmp_path / "async")
+        await other.save_artifacts_async(artifacts)
+        return await other.load_artifacts_async()
+
+    assert asyncio.run(round_trip()) == storage.load_artifacts()
+
+
+def test_missing_artifact_raises(tmp_path):
+    storage = ArtifactStorage(tmp_path)
+    storage.save_artifact(_artifact("Token"))
+
+    with pytest.raises(FileNotFoundError, match="Missing.json"):
+        storage.load_artifact("Missing")
+    with pytest.raises(FileNotFoundError, match="Missing.json"):
+        storage.load_artifacts(["Token", "Missing"])
+
+
+@pytest.mark.parametrize("fsync, calls", [("never", 0), ("batch", 4), ("always", 6)])
+def test_writes_are_atomic(tmp_path, monkeypatch, fsync, calls):
+    synced = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: (synced.append(fd), real_fsync(fd)))
+    storage = ArtifactStorage(tmp_path, fsync=fsync)
+
+    # batch: one per file plus the directory; always: the directory after each file
+    storage.save_artifacts({name: _artifact(name) for name in NAMES[:3]})
+    assert len(synced) == calls
+
+    # The ABI cannot be serialized, so the write fails halfway through
+    with pytest.raises(TypeError):
+        storage.save_artifact(_artifact("Token", abi=[object()]))
+    assert _files(tmp_path) == ["Router.json", "Token.json", "Vault.json"]
+    assert storage.load_artifact("Token") == _artifact("Token")
+
+
+def test_unknown_fsync_policy_is_rejected():
+    with pytest.raises(ValueError, match="fsync policy"):
+        ArtifactStorage(fsync="sometimes")
@@ -0,0 +1,94 @@
+import asyncio
+import json
+import logging
+import threading
+import timeit
+
+import pytest
+
+from evmdeploy.tracing import NULL_SPAN, HistogramExporter, LogExporter, Span, is_enabled, span, tracing
+
+
+def test_spans_nest_per_thread_and_task():
+    spans = []
+
+    def in_thread():
+        with span("thread"):
+            pass
+
+    async def task(name):
+        with span(name):
+            await asyncio.sleep(0)
+
+    async def run():
+        with span("outer"):
+            # Interleaved tasks each see "outer" as parent, never each other
+            await asyncio.gather(task("a"), task("b"))
+
+    with tracing(spans.append):
+        with span("root"):
+            with span("child") as child:
+                child.set(bytes=3)
+            # A new thread does not inherit the caller's span
+            thread = threading.Thread(target=in_thread)
+            thread.start()
+            thread.join()
+        asyncio.run(run())
+
+    parents = {s.name: s.parent for s in spans}
+    assert parents == {"child": "root", "thread": None, "root": None, "a": "outer", "b": "outer", "outer": None}
+    assert [s.name for s in spans][:3] == ["child", "thread", "root"]
+    assert spans[0].attributes == {"bytes": 3}
+
+
+def test_exporters_receive_finished_spans(caplog):
+    histogram = HistogramExporter()
+
+    def broken(finished: Span):
+        raise RuntimeError("exporter bug")
+
+    with caplog.at_level(logging.INFO, logger="evmdeploy.tracing"):
+        with tracing(LogExporter(), broken, histogram):
+            with span("deploy.sign", contract="Token"):
+                pass
+            with pytest.raises(ValueError):
+                with span("deploy.sign"):
+                    raise ValueError("bad key")
+
+    records = [json.loads(r.getMessage()) for r in caplog.records if r.levelno == logging.INFO]
+    assert [r["span"] for r in records] == ["deploy.sign", "deploy.sign"]
+    assert records[0]["contract"] == "Token" and "error" not in records[0]
+    assert records[1]["error"] == "ValueError"
+    # A failing exporter is logged and does not affect the others
+    failures = [r for r in caplog.records if r.levelno == logging.ERROR]
+    assert len(failures) == 2 and all("Tracing exporter" in r.getMessage() for r in failures)
+
+    summary = histogram.summary()["deploy.sign"]
+    assert (summary["count"], summary["errors"]) == (2, 1)
+    assert summary["max"] >= summary["p50"] > 0
+    assert histogram.report().splitlines()[1].startswith("deploy.sign")
+
+
+def test_disabled_tracing_returns_the_shared_null_span():
+    calls = []
+    assert not is_enabled()
+    assert span("deploy.sign", contract="Token") is NULL_SPAN
+
+    with tracing(calls.append):
+        assert is_enabled()
+        assert isinstance(span("deploy.sign"), Span)
+    assert not is_enabled()
+    with span("deploy.sign") as disabled:
+        assert disabled.set(bytes=1) is NULL_SPAN
+    assert calls == []
+
+
+def test_disabled_tracing_is_cheaper_than_enabled():
+    def instrumented():
+        with span("deploy.sign", contract="Token"):
+            pass
+
+    disabled = min(timeit.repeat(instrumented, number=20_000, repeat=5))
+    with tracing(lambda finished: None):
+        enabled = min(timeit.repeat(instrumented, number=20_000, repeat=5))
+    assert disabled < enabled